@@ -15,6 +15,15 @@ VERSION="$1"
 # Remove 'v' prefix from version for release title
 VERSION_NO_V=${VERSION#v}
 
+# 'blueprint upgrade' needs each archive's manifest; only 'blueprint build-release' writes them
+shopt -s nullglob
+manifests=(.genreleases/blueprint-kit-template-*-"$VERSION".manifest.json)
+shopt -u nullglob
+if [[ ${#manifests[@]} -eq 0 ]]; then
+  echo "Error: no .genreleases/*-$VERSION.manifest.json files; build the release with 'blueprint build-release $VERSION'" >&2
+  exit 1
+fi
+
 gh release create "$VERSION" \
   .genreleases/blueprint-kit-template-copilot-sh-"$VERSION".zip \
   .genreleases/blueprint-kit-template-copilot-ps-"$VERSION".zip \
@@ -42,5 +51,6 @@ gh release create "$VERSION" \
   .genreleases/blueprint-kit-template-codebuddy-ps-"$VERSION".zip \
   .genreleases/blueprint-kit-template-q-sh-"$VERSION".zip \
   .genreleases/blueprint-kit-template-q-ps-"$VERSION".zip \
+  "${manifests[@]}" \
   --title "Blueprint Kit Templates - $VERSION_NO_V" \
   --notes-file release_notes.md
\ No newline at end of file
@@ -5,6 +5,10 @@ set -euo pipefail
 # Build Blueprint Kit template release archives for each supported AI assistant and script type.
 # Usage: .github/workflows/scripts/create-release-packages.sh <version>
 #   Version argument should include leading 'v'.
+#   This script only builds the archives, for local inspection. It does not write the
+#   per-archive manifests 'blueprint upgrade' relies on, so create-github-release.sh will
+#   refuse its output: publish releases from 'blueprint build-release', which produces the
+#   same archives plus manifests, in parallel and byte-reproducibly.
 #   Optionally set AGENTS and/or SCRIPTS env vars to limit what gets built.
 #     AGENTS  : space or comma separated subset of: claude gemini copilot cursor-agent qwen opencode windsurf codex (default: all)
 #     SCRIPTS : space or comma separated subset of: sh ps (default: both)
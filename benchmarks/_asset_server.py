@@ -0,0 +1,135 @@
+"""Local stand-in for a release asset host, shared by the download scripts.
+
+Serves one in-memory blob over HTTP/1.1 the way GitHub's asset CDN does:
+``Accept-Ranges: bytes``, an ETag, ``Range`` requests answered with ``206``
+(or ``416`` past the end) and ``If-Range`` honoured, so a stale validator gets
+the full body with ``200``. Each response can be throttled to a per-connection
+rate with a fixed round-trip delay, and faults can be injected:
+
+- ``drop_at``: close the connection once this absolute byte offset is reached
+  (one time; the next request is served normally)
+- ``short_close``: advertise one byte more than is sent and close after the
+  body, as if the connection broke right at the end (one time)
+- ``reject_ranges``: answer every ``Range`` request with ``416``
+- ``replace(blob)``: swap in a new blob with a new ETag
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CHUNK = 64 * 1024
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients abandoning a response (e.g. segments cancelled after a fallback) are expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class AssetServer:
+    """Serve blob at ``self.url`` from a background thread; use as a context manager."""
+
+    def __init__(self, blob: bytes, *, rate: float | None = None, rtt: float = 0.0):
+        self.blob = blob
+        self.version = 1
+        self.etag = '"v1"'
+        self.rate = rate  # Bytes per second per connection, None for unthrottled
+        self.rtt = rtt  # Seconds slept before each response
+        self.drop_at: int | None = None
+        self.short_close = False
+        self.reject_ranges = False
+        self.requests: list[dict] = []
+        self._lock = threading.Lock()
+        self._server = _QuietServer(("127.0.0.1", 0), self._handler())
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/blueprint-kit-template.zip"
+
+    def replace(self, blob: bytes) -> None:
+        """Publish a new version of the asset under a new ETag."""
+        with self._lock:
+            self.blob = blob
+            self.version += 1
+            self.etag = f'"v{self.version}"'
+
+    def reset_log(self) -> None:
+        with self._lock:
+            self.requests.clear()
+
+    def __enter__(self) -> "AssetServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                range_header, if_range = self.headers.get("Range"), self.headers.get("If-Range")
+                with server._lock:
+                    blob, etag = server.blob, server.etag
+                    server.requests.append({"range": range_header, "if_range": if_range})
+                if server.rtt:
+                    time.sleep(server.rtt)
+
+                start, end, status = 0, len(blob) - 1, 200
+                if range_header and (if_range is None or if_range == etag):
+                    first, _, last = range_header.partition("=")[2].partition("-")
+                    start = int(first)
+                    end = min(int(last), len(blob) - 1) if last else len(blob) - 1
+                    if server.reject_ranges or start >= len(blob):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(blob)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    status = 206
+                body = blob[start:end + 1]
+
+                short_close = False
+                with server._lock:
+                    if server.short_close:
+                        server.short_close, short_close = False, True
+                self.send_response(status)
+                if status == 206:
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(blob)}")
+                self.send_header("Content-Length", str(len(body) + short_close))
+                self.send_header("ETag", etag)
+                self.send_header("Accept-Ranges", "bytes")
+                self.end_headers()
+
+                sent = 0
+                while sent < len(body):
+                    step = min(CHUNK, len(body) - sent)
+                    with server._lock:
+                        drop = server.drop_at is not None and start + sent <= server.drop_at < start + sent + step
+                        if drop:
+                            cut, server.drop_at = server.drop_at - start - sent, None
+                    if drop:
+                        self.wfile.write(body[sent:sent + cut])
+                        self.wfile.flush()
+                        self.close_connection = True
+                        return
+                    self.wfile.write(body[sent:sent + step])
+                    sent += step
+                    if server.rate:
+                        time.sleep(step / server.rate)
+                if short_close:
+                    self.close_connection = True
+
+        return Handler
@@ -0,0 +1,75 @@
+"""Benchmark single-stream vs. multi-connection template downloads.
+
+Serves a random blob from the local stand-in asset host in _asset_server.py,
+throttled per connection with a fixed round-trip delay to mimic a
+high-latency link where one TCP stream cannot fill the bandwidth, and times:
+
+- download_file: one stream
+- download_parallel with 1, 2, 4 and 8 connections (1 falls back to one stream)
+
+Usage (from the repository root):
+
+    python benchmarks/bench_download.py [--size-mb 16] [--rate-mb 4] [--rtt-ms 80] [--repeat 3]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import httpx  # noqa: E402
+
+from _asset_server import AssetServer  # noqa: E402
+from blueprint_cli.services.download import download_file, download_parallel  # noqa: E402
+
+CONNECTIONS = (1, 2, 4, 8)
+
+
+def measure(fn, server: AssetServer, dest: Path, repeat: int) -> tuple[list[float], dict]:
+    samples, stats = [], {}
+    for _ in range(repeat):
+        dest.unlink(missing_ok=True)
+        server.reset_log()
+        start = time.perf_counter()
+        stats = fn(dest)
+        samples.append(time.perf_counter() - start)
+        if dest.read_bytes() != server.blob:
+            sys.exit(f"{dest.name}: downloaded bytes differ from the served blob")
+    return samples, {**stats, "requests": len(server.requests)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=16, help="Asset size in MiB (default 16)")
+    parser.add_argument("--rate-mb", type=float, default=4, help="Throughput per connection in MiB/s (default 4)")
+    parser.add_argument("--rtt-ms", type=float, default=80, help="Delay before each response in ms (default 80)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode (default 3)")
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1024 * 1024)
+    modes = [("download_file", lambda client, server, dest: download_file(client, server.url, dest, expected_size=size))]
+    for n in CONNECTIONS:
+        modes.append((
+            f"parallel x{n}",
+            lambda client, server, dest, n=n: download_parallel(client, server.url, dest, expected_size=size, connections=n),
+        ))
+
+    print(f"{args.size_mb:g} MiB asset, {args.rate_mb:g} MiB/s per connection, {args.rtt_ms:g} ms RTT, {args.repeat} runs each")
+    print(f"{'mode':<14} {'conns':>5} {'reqs':>5} {'median':>9} {'min':>9} {'MiB/s':>7}")
+    with AssetServer(os.urandom(size), rate=args.rate_mb * 1024 * 1024, rtt=args.rtt_ms / 1000) as server, \
+            httpx.Client(limits=httpx.Limits(max_connections=32)) as client, \
+            tempfile.TemporaryDirectory() as tmp:
+        dest = Path(tmp) / "blueprint-kit-template.zip"
+        for name, fn in modes:
+            samples, stats = measure(lambda d: fn(client, server, d), server, dest, args.repeat)
+            median = statistics.median(samples)
+            print(f"{name:<14} {stats.get('connections', 1):>5} {stats['requests']:>5} {median:>7.2f} s {min(samples):>7.2f} s {args.size_mb / median:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark cold vs. precompiled command-template generation.
+
+Renders every bundled command template for every agent and script variant
+three ways:
+
+- cold: parse templates/commands/*.md (compile_bundle), then render
+- disk: load the precompiled bundle from the user cache dir, then render
+- warm: reuse the bundle memoised in the process (load_bundle), then render
+
+Usage (from the repository root):
+
+    python benchmarks/bench_templates.py [--repeat 50]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from blueprint_cli.core.agent_config import AGENT_COMMAND_CONFIG  # noqa: E402
+from blueprint_cli.services import templates  # noqa: E402
+
+
+def render_all(bundle: dict) -> int:
+    files = 0
+    for config in AGENT_COMMAND_CONFIG.values():
+        for variant in config["script_variants"]:
+            for entry in bundle["templates"].values():
+                templates.render_command(entry, variant, config["arg_format"], config["ext"])
+                files += 1
+    return files
+
+
+def cold(commands_dir: Path) -> int:
+    return render_all(templates.compile_bundle(commands_dir))
+
+
+def disk(commands_dir: Path) -> int:
+    templates._memo.clear()
+    return render_all(templates.load_bundle(commands_dir))
+
+
+def warm(commands_dir: Path) -> int:
+    return render_all(templates.load_bundle(commands_dir))
+
+
+def measure(fn, commands_dir: Path, repeat: int) -> tuple[list[float], int]:
+    samples = []
+    files = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        files = fn(commands_dir)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per mode (default 50)")
+    args = parser.parse_args()
+
+    commands_dir = templates.find_commands_dir()
+    if commands_dir is None:
+        sys.exit("templates/commands not found")
+    templates.load_bundle(commands_dir)  # Write the on-disk bundle before timing "disk"
+
+    print(f"{len(list(commands_dir.glob('*.md')))} templates x {len(AGENT_COMMAND_CONFIG)} agents x 2 variants, {args.repeat} runs each")
+    print(f"{'mode':<6} {'files':>6} {'median':>10} {'min':>10}")
+    for name, fn in (("cold", cold), ("disk", disk), ("warm", warm)):
+        samples, files = measure(fn, commands_dir, args.repeat)
+        print(f"{name:<6} {files:>6} {statistics.median(samples):>8.3f} ms {min(samples):>7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
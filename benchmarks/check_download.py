@@ -0,0 +1,159 @@
+"""Check the resume paths of the template downloader against a local server.
+
+Runs download_file and download_parallel against the stand-in asset host in
+_asset_server.py and verifies the bytes and the requests made for:
+
+- drop/resume: the connection drops mid-body and the download continues with
+  ``Range``/``If-Range`` from the bytes already on disk, within one call and
+  from the ``.part`` file a failed earlier call left behind
+- 416: a resume request past the end of an already complete part file is
+  accepted as done; one the server refuses restarts from byte 0
+- If-Range changed: the asset is replaced between attempts, the server answers
+  the stale ``If-Range`` with a full ``200`` and only new bytes end up on disk
+
+Usage (from the repository root):
+
+    python benchmarks/check_download.py
+
+Exits 1 when any check fails.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import httpx  # noqa: E402
+
+from _asset_server import AssetServer  # noqa: E402
+from blueprint_cli.services.download import DownloadError, download_file, download_parallel, partial_paths  # noqa: E402
+
+SIZE = 3 * 1024 * 1024
+
+
+def no_sleep(_seconds: float) -> None:
+    pass
+
+
+def fail_once(client: httpx.Client, server: AssetServer, dest: Path, drop_at: int) -> int:
+    """Leave a partial download behind (retries=0) and return its size."""
+    server.drop_at = drop_at
+    try:
+        download_file(client, server.url, dest, expected_size=len(server.blob), retries=0, sleep=no_sleep)
+    except DownloadError:
+        pass
+    else:
+        raise AssertionError("download did not fail on the dropped connection")
+    return partial_paths(dest)[0].stat().st_size
+
+
+def check_drop_resume(client, server, dest):
+    server.drop_at = SIZE // 3
+    stats = download_file(client, server.url, dest, expected_size=SIZE, sleep=no_sleep)
+    resume = server.requests[1]
+    assert dest.read_bytes() == server.blob, "content differs"
+    assert resume["range"] == f"bytes={SIZE // 3}-" and resume["if_range"] == server.etag, f"resume request was {resume}"
+    assert stats["attempts"] == 2 and stats["bytes"] == SIZE, f"stats {stats}"
+    return f"dropped at byte {SIZE // 3:,}, resumed from there in the same call"
+
+
+def check_resume_across_runs(client, server, dest):
+    kept = fail_once(client, server, dest, SIZE // 2)
+    server.reset_log()
+    stats = download_file(client, server.url, dest, expected_size=SIZE, sleep=no_sleep)
+    assert dest.read_bytes() == server.blob, "content differs"
+    assert stats["resumed_from"] == kept and server.requests[0]["range"] == f"bytes={kept}-", f"stats {stats}, requests {server.requests}"
+    return f"second call fetched {stats['bytes']:,} bytes on top of the {kept:,} kept"
+
+
+def check_416_complete(client, server, dest):
+    server.short_close = True
+    stats = download_file(client, server.url, dest, expected_size=SIZE, sleep=no_sleep)
+    assert dest.read_bytes() == server.blob, "content differs"
+    assert server.requests[-1]["range"] == f"bytes={SIZE}-", f"requests {server.requests}"
+    return "416 for a resume at the end of a complete part file accepted as done"
+
+
+def check_416_restart(client, server, dest):
+    fail_once(client, server, dest, SIZE // 2)
+    server.reset_log()
+    server.reject_ranges = True
+    try:
+        stats = download_file(client, server.url, dest, expected_size=SIZE, sleep=no_sleep)
+    finally:
+        server.reject_ranges = False
+    assert dest.read_bytes() == server.blob, "content differs"
+    assert stats["resumed_from"] == 0 and server.requests[-1]["range"] is None, f"stats {stats}, requests {server.requests}"
+    return "416 for a mid-file resume discarded the part file and restarted"
+
+
+def check_if_range_changed(client, server, dest):
+    fail_once(client, server, dest, SIZE // 2)
+    old_etag = server.etag
+    server.replace(os.urandom(SIZE))
+    server.reset_log()
+    stats = download_file(client, server.url, dest, expected_size=SIZE, sleep=no_sleep)
+    assert dest.read_bytes() == server.blob, "content differs from the new asset"
+    assert server.requests[0]["if_range"] == old_etag and stats["resumed_from"] == 0, f"stats {stats}, requests {server.requests}"
+    return "stale If-Range answered with 200; the new asset was written from byte 0"
+
+
+def check_parallel_drop(client, server, dest):
+    server.drop_at = SIZE // 2 + 1000
+    stats = download_parallel(client, server.url, dest, expected_size=SIZE, connections=4, sleep=no_sleep)
+    assert dest.read_bytes() == server.blob, "content differs"
+    # One probe, one request per segment and one retry for the dropped segment
+    assert stats["connections"] > 1 and stats["attempts"] == stats["connections"] + 2, f"stats {stats}"
+    return f"one of {stats['connections']} segments dropped and resumed on its own"
+
+
+def check_parallel_changed(client, server, dest):
+    server.drop_at = SIZE // 2 + 1000
+    blob = os.urandom(SIZE)
+    original = server.blob
+
+    def on_progress(done, total):
+        if server.blob is original and server.drop_at is None:
+            server.replace(blob)
+
+    stats = download_parallel(client, server.url, dest, expected_size=SIZE, connections=4, sleep=no_sleep, on_progress=on_progress)
+    assert dest.read_bytes() == blob, "content differs from the new asset"
+    assert stats["connections"] == 1, f"stats {stats}"
+    return "asset replaced mid-download; fell back to one fresh stream"
+
+
+CHECKS = [
+    ("drop/resume", check_drop_resume),
+    ("drop/resume across runs", check_resume_across_runs),
+    ("416 at end", check_416_complete),
+    ("416 mid-file", check_416_restart),
+    ("If-Range changed", check_if_range_changed),
+    ("parallel drop/resume", check_parallel_drop),
+    ("parallel If-Range changed", check_parallel_changed),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp, httpx.Client() as client:
+        for name, check in CHECKS:
+            dest = Path(tmp) / f"{name.replace(' ', '-').replace('/', '-')}.zip"
+            with AssetServer(os.urandom(SIZE)) as server:
+                try:
+                    detail = check(client, server, dest)
+                except (AssertionError, DownloadError, httpx.HTTPError, OSError) as e:
+                    failed += 1
+                    print(f"FAIL  {name}: {e}")
+                else:
+                    print(f"ok    {name}: {detail}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
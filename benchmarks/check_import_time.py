@@ -0,0 +1,81 @@
+"""Fail when ``blueprint check`` startup exceeds the import time budget.
+
+Runs ``python -X importtime`` against the source tree several times on the
+path a ``blueprint check`` invocation takes before doing any work: import the
+package, build the Click group and dispatch ``check`` through it, which loads
+``commands.check`` and what it imports (``services.tools``, ...). The total of
+every top-level import in that process is compared with the budget
+docs/local-development.md sets (150 ms); the best run counts.
+
+Usage (from the repository root):
+
+    python benchmarks/check_import_time.py [--budget-ms 150] [--runs 5] [--command check]
+
+Exits 1 when over budget and prints the slowest imports to look at.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+DEFAULT_BUDGET_MS = 150
+
+# What the blueprint entry point does up to running the command body
+DISPATCH = """
+import typer, blueprint_cli
+group = typer.main.get_command(blueprint_cli.app)
+with group.context_class(group) as ctx:
+    assert group.get_command(ctx, {command!r}) is not None
+"""
+
+
+def import_profile(command: str) -> list[tuple[int, int, str]]:
+    """Return (cumulative us, depth, module) for every import of one fresh interpreter."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", DISPATCH.format(command=command)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        depth = (len(module) - len(module.lstrip())) // 2
+        rows.append((int(cumulative), depth, module.strip()))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help=f"Budget for the dispatch path (default {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time; the fastest counts (default 5)")
+    parser.add_argument("--command", default="check", help="Command to dispatch (default check)")
+    args = parser.parse_args()
+
+    best = None
+    for _ in range(args.runs):
+        rows = import_profile(args.command)
+        total = sum(us for us, depth, _ in rows if depth == 0)
+        if best is None or total < best[0]:
+            best = (total, rows)
+
+    total_ms, rows = best[0] / 1000, best[1]
+    package_ms = next(us for us, depth, module in rows if depth == 0 and module == "blueprint_cli") / 1000
+    print(
+        f"blueprint {args.command}: {total_ms:.1f} ms of imports "
+        f"(package {package_ms:.1f} ms, dispatch {total_ms - package_ms:.1f} ms; best of {args.runs}, budget {args.budget_ms:.0f} ms)"
+    )
+    if total_ms <= args.budget_ms:
+        return
+    print("Slowest imports (cumulative):")
+    for us, _, module in sorted(rows, reverse=True)[:15]:
+        print(f"  {us / 1000:8.1f} ms  {module}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
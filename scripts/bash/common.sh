@@ -62,6 +62,15 @@ validate_required_files() {
 
 # Function to get feature directory from environment or git
 get_feature_dir() {
+    # Fast path: resolve everything in one process when the blueprint CLI is installed
+    if command -v blueprint > /dev/null 2>&1; then
+        local resolved
+        if resolved=$(blueprint context --field FEATURE_DIR 2>/dev/null); then
+            echo "$resolved"
+            return 0
+        fi
+    fi
+
     # First, try to get from BLUEPRINT_FEATURE environment variable
     if [[ -n "${BLUEPRINT_FEATURE:-}" ]]; then
         echo ".blueprint/specs/${BLUEPRINT_FEATURE}"
@@ -20,6 +20,15 @@ EOF
 
 # Function to get current feature directory from git branch or environment
 get_feature_dir() {
+    # Fast path: resolve everything in one process when the blueprint CLI is installed
+    if command -v blueprint > /dev/null 2>&1; then
+        local resolved
+        if resolved=$(blueprint context --field FEATURE_DIR 2>/dev/null); then
+            echo "$resolved"
+            return 0
+        fi
+    fi
+
     # First, try to get from SPECIFY_FEATURE environment variable
     if [[ -n "${BLUEPRINT_FEATURE:-}" ]]; then
         echo ".blueprint/specs/${BLUEPRINT_FEATURE}"
@@ -71,6 +71,14 @@ function Validate-RequiredFiles {
 
 # Function to get feature directory from environment or git
 function Get-FeatureDir {
+    # Fast path: resolve everything in one process when the blueprint CLI is installed
+    if (Get-Command blueprint -ErrorAction SilentlyContinue) {
+        $resolved = blueprint context --field FEATURE_DIR 2>$null
+        if ($LASTEXITCODE -eq 0 -and $resolved) {
+            return $resolved
+        }
+    }
+
     # First, try to get from BLUEPRINT_FEATURE environment variable
     if ($env:BLUEPRINT_FEATURE) {
         return ".blueprint\specs\$($env:BLUEPRINT_FEATURE)"
@@ -25,19 +25,63 @@ Or install globally:
     blueprint init --here
 """
 
+import importlib
 import sys
+from pathlib import Path
 import typer
 from rich.console import Console
 from rich.align import Align
 from typer.core import TyperGroup
 
 from .core.cli import BANNER, TAGLINE
-from .commands.init import init
-from .commands.check import check, show_banner
+
+
+# Command name -> (module in blueprint_cli.commands, attribute), in help order.
+# A command's module is imported only when that command is dispatched (or when
+# --help lists every command), so `blueprint check` never loads init's code.
+COMMANDS = {
+    "init": ("init", "init"),
+    "init-batch": ("init_batch", "init_batch"),
+    "check": ("check", "check"),
+    "context": ("context", "context"),
+    "index": ("catalog", "index"),
+    "list": ("catalog", "list_features"),
+    "query": ("catalog", "query"),
+    "search": ("catalog", "search"),
+    "analyze": ("analyze", "analyze"),
+    "status": ("status", "status"),
+    "build-release": ("release", "build_release"),
+    "upgrade": ("upgrade", "upgrade"),
+    "feature": ("feature", "feature_app"),
+    "tasks": ("tasks", "tasks_app"),
+}
+
+
+def show_banner():
+    from .commands.check import show_banner
+
+    show_banner()
 
 
 class BannerGroup(TyperGroup):
-    """Custom group that shows banner before help."""
+    """Custom group that shows banner before help and loads commands on dispatch."""
+
+    def list_commands(self, ctx):
+        return [*COMMANDS, *(name for name in super().list_commands(ctx) if name not in COMMANDS)]
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in COMMANDS and cmd_name not in self.commands:
+            module_name, attr = COMMANDS[cmd_name]
+            target = getattr(importlib.import_module(f"{__name__}.commands.{module_name}"), attr)
+            if isinstance(target, typer.Typer):
+                command = typer.main.get_group(target)
+            else:
+                single = typer.Typer(add_completion=False)
+                single.command(cmd_name)(target)
+                command = typer.main.get_command(single)
+            command.name = cmd_name
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
     def format_help(self, ctx, formatter):
         # Show banner before help
@@ -56,8 +100,17 @@ app = typer.Typer(
 
 
 @app.callback()
-def callback(ctx: typer.Context):
+def callback(
+    ctx: typer.Context,
+    profile: bool = typer.Option(False, "--profile", help="Print where the command spent its time (network, disk, render, git) to stderr when it finishes"),
+    trace: Path = typer.Option(None, "--trace", dir_okay=False, help="Write a Chrome Trace Event JSON file of the command's spans (open in chrome://tracing or ui.perfetto.dev)"),
+):
     """Show banner when no subcommand is provided."""
+    if profile or trace:
+        from .core.tracing import start_tracing
+
+        start_tracing()
+        ctx.call_on_close(lambda: _finish_profile(profile, trace))
     if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
         show_banner()
         console = Console()
@@ -65,9 +118,19 @@ def callback(ctx: typer.Context):
         console.print()
 
 
-# Register the commands with the app
-app.command()(init)
-app.command()(check)
+def _finish_profile(profile: bool, trace: Path | None) -> None:
+    import json
+    from .core.tracing import stop_tracing, summary_table
+
+    tracer = stop_tracing()
+    if tracer is None:
+        return
+    console = Console(stderr=True)
+    if trace:
+        trace.write_text(json.dumps(tracer.chrome_trace()), encoding="utf-8")
+        console.print(f"[dim]Trace written to {trace}[/dim]")
+    if profile:
+        console.print(summary_table(tracer))
 
 
 def main():
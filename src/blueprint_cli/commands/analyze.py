@@ -0,0 +1,100 @@
+"""Analyze command implementation for the Blueprint-Kit CLI."""
+
+import json
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from ..services.features import SPECS_DIR
+
+
+console = Console()
+
+_SEVERITY_STYLE = {"error": "red", "warning": "yellow", "info": "dim"}
+
+
+def resolve_feature_dir(feature: str | None) -> Path:
+    """Feature directory for an explicit name, or the active feature from the project context.
+
+    Prints an error and exits when it cannot be determined.
+    """
+    from ..services.context import resolve_context
+
+    ctx = resolve_context()
+    if feature:
+        feature_dir = Path(ctx["REPO_ROOT"]) / SPECS_DIR / feature
+    elif ctx["FEATURE_DIR"]:
+        feature_dir = Path(ctx["FEATURE_DIR"])
+    else:
+        console.print("[red]Error:[/red] Cannot determine the active feature. Pass a feature name or set BLUEPRINT_FEATURE")
+        raise typer.Exit(1)
+    if not feature_dir.is_dir():
+        console.print(f"[red]Error:[/red] Feature directory not found: {feature_dir}")
+        raise typer.Exit(1)
+    return feature_dir
+
+
+def analyze(
+    feature: str = typer.Argument(None, help="Feature directory name (default: the active feature)"),
+    json_output: bool = typer.Option(False, "--json", help="Print the full report as JSON"),
+    strict: bool = typer.Option(False, "--strict", help="Exit with status 1 when any error-level finding is reported"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-parse every artifact instead of using the parse cache"),
+):
+    """
+    Check spec, goals, blueprint, plan and tasks for consistency.
+
+    Reports requirement -> goal -> task coverage, dangling references,
+    conflicting technology choices and other gaps. Only artifacts that changed
+    since the last run are re-parsed.
+
+    Examples:
+        blueprint analyze
+        blueprint analyze 003-photo-albums --json
+        blueprint analyze --strict
+    """
+    from ..services.analysis import analyze_feature
+
+    feature_dir = resolve_feature_dir(feature)
+    report = analyze_feature(feature_dir, use_cache=not no_cache)
+
+    if json_output:
+        print(json.dumps(report, indent=2))
+    else:
+        from rich.table import Table
+
+        summary = report["coverage"]["summary"]
+
+        def pct(value):
+            return "-" if value is None else f"{value:.0f}%"
+
+        console.print(f"[bold]Cross-artifact analysis:[/bold] [cyan]{report['feature']}[/cyan]")
+        overview = Table(show_header=False, box=None, padding=(0, 2))
+        overview.add_column(style="cyan")
+        overview.add_column()
+        overview.add_row("Artifacts", ", ".join(
+            f"[green]{k}[/green]" if a["present"] else f"[red]{k} (missing)[/red]" for k, a in report["artifacts"].items()
+        ))
+        overview.add_row("Requirements", f"{summary['requirements']} ({pct(summary['requirements_with_goals'])} with goals, {pct(summary['requirements_with_tasks'])} with tasks)")
+        overview.add_row("Goals", f"{summary['goals']} ({pct(summary['goals_with_tasks'])} with tasks)")
+        overview.add_row("Tasks", f"{summary['tasks_done']}/{summary['tasks']} done, {len(report['coverage']['unlinked_tasks'])} not linked to a requirement or goal")
+        console.print(overview)
+        console.print()
+
+        if report["findings"]:
+            table = Table(title=f"Findings ({report['counts']['error']} errors, {report['counts']['warning']} warnings, {report['counts']['info']} info)")
+            table.add_column("Severity")
+            table.add_column("Where", style="cyan")
+            table.add_column("Finding")
+            for finding in report["findings"]:
+                style = _SEVERITY_STYLE[finding["severity"]]
+                where = finding["artifact"] or ""
+                if finding["line"]:
+                    where += f":{finding['line']}"
+                table.add_row(f"[{style}]{finding['severity']}[/{style}]", where, finding["message"])
+            console.print(table)
+        else:
+            console.print("[green]✓[/green] No findings")
+
+    if strict and report["counts"]["error"]:
+        raise typer.Exit(1)
@@ -0,0 +1,218 @@
+"""Catalog commands (index, list, query, search) for the Blueprint-Kit CLI."""
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+from rich.console import Console
+
+from ..services.features import find_project_root
+
+if TYPE_CHECKING:
+    from ..services.catalog import Catalog
+
+
+# Mirrors services.search.DEFAULT_THRESHOLD; kept here so --help doesn't import sqlite3
+DEFAULT_THRESHOLD = 0.5
+
+
+console = Console()
+
+
+def _open_catalog(refresh: bool = True) -> tuple["Catalog", dict | None]:
+    import sqlite3
+    from ..services.catalog import Catalog
+
+    try:
+        catalog = Catalog(find_project_root())
+        stats = catalog.refresh() if refresh else None
+    except (OSError, sqlite3.Error) as e:
+        console.print(f"[red]Error:[/red] Could not open the spec catalog: {e}")
+        raise typer.Exit(1)
+    return catalog, stats
+
+
+def index(
+    rebuild: bool = typer.Option(False, "--rebuild", help="Discard the catalog and re-read every artifact"),
+    json_output: bool = typer.Option(False, "--json", help="Print refresh statistics as JSON"),
+):
+    """
+    Update the spec catalog from .blueprint/specs.
+
+    Only artifacts whose mtime or size changed are re-read, and only those whose
+    content hash changed are re-parsed.
+
+    Examples:
+        blueprint index
+        blueprint index --rebuild
+    """
+    catalog, _ = _open_catalog(refresh=False)
+    with catalog:
+        stats = catalog.rebuild() if rebuild else catalog.refresh()
+    if json_output:
+        print(json.dumps(stats))
+        return
+    console.print(
+        f"[green]✓[/green] Indexed {stats['features']} features "
+        f"[dim]({stats['scanned']} artifacts checked, {stats['read']} read, {stats['parsed']} parsed, "
+        f"{stats['removed']} removed in {stats['elapsed_ms']:.0f} ms)[/dim]"
+    )
+
+
+def list_features(
+    status: str = typer.Option(None, "--status", help="Only show features in this status (e.g. specified, planned, tasked, in-progress, done)"),
+    json_output: bool = typer.Option(False, "--json", help="Print the features as JSON"),
+    no_refresh: bool = typer.Option(False, "--no-refresh", help="Answer from the catalog as-is without checking for changed files"),
+):
+    """
+    List features from the spec catalog.
+
+    Examples:
+        blueprint list
+        blueprint list --status in-progress --json
+    """
+    catalog, _ = _open_catalog(refresh=not no_refresh)
+    with catalog:
+        features = catalog.list_features(status)
+
+    if json_output:
+        print(json.dumps(features, indent=2))
+        return
+
+    if not features:
+        console.print("[yellow]No features found.[/yellow] Create one with 'blueprint feature new'")
+        return
+
+    from rich.table import Table
+
+    table = Table(title=f"Features ({len(features)})")
+    table.add_column("Feature", style="cyan")
+    table.add_column("Title")
+    table.add_column("Status")
+    table.add_column("Tasks", justify="right")
+    table.add_column("Goals", justify="right")
+    for feature in features:
+        tasks = f"{feature['tasks_done']}/{feature['tasks_total']}" if feature["tasks_total"] else "-"
+        table.add_row(feature["name"], feature["title"] or "[dim]-[/dim]", feature["status"], tasks, str(feature["goals"] or "-"))
+    console.print(table)
+
+
+def query(
+    sql: str = typer.Argument(..., help="Read-only SQL against the 'features' and 'artifacts' tables"),
+    json_output: bool = typer.Option(False, "--json", help="Print rows as a JSON list of objects"),
+    no_refresh: bool = typer.Option(False, "--no-refresh", help="Answer from the catalog as-is without checking for changed files"),
+):
+    """
+    Run a read-only SQL query against the spec catalog.
+
+    Tables: features(name, number, title, status, tasks_total, tasks_done,
+    goals, mtime, indexed_at) and artifacts(feature, kind, path, mtime_ns,
+    size, sha256, title, tasks_total, tasks_done, goals, status).
+
+    Examples:
+        blueprint query "SELECT status, COUNT(*) FROM features GROUP BY status"
+        blueprint query --json "SELECT name FROM features WHERE tasks_done < tasks_total"
+    """
+    import sqlite3
+
+    catalog, _ = _open_catalog(refresh=not no_refresh)
+    with catalog:
+        try:
+            columns, rows = catalog.query(sql)
+        except sqlite3.Error as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=2))
+        return
+
+    from rich.table import Table
+
+    table = Table(show_lines=False)
+    for column in columns:
+        table.add_column(column)
+    for row in rows:
+        table.add_row(*("" if value is None else str(value) for value in row))
+    console.print(table)
+
+
+def search(
+    text: str = typer.Argument(None, help="Free-text query (ranked with BM25)"),
+    kind: list[str] = typer.Option(None, "--kind", help="Restrict to artifact kinds: spec, goals, blueprint (repeatable)"),
+    like: Path = typer.Option(None, "--like", exists=True, dir_okay=False, help="Find documents that are near-duplicates of this markdown file"),
+    duplicates: bool = typer.Option(False, "--duplicates", help="List clusters of near-duplicate documents across all features"),
+    threshold: float = typer.Option(DEFAULT_THRESHOLD, "--threshold", min=0.0, max=1.0, help="Minimum estimated Jaccard similarity for --like/--duplicates"),
+    limit: int = typer.Option(10, "--limit", "-n", min=1, help="Maximum number of hits"),
+    json_output: bool = typer.Option(False, "--json", help="Print results as JSON"),
+    no_refresh: bool = typer.Option(False, "--no-refresh", help="Answer from the catalog as-is without checking for changed files"),
+):
+    """
+    Search specs, goals and blueprints, or find near-duplicate features.
+
+    Uses the inverted index and MinHash/LSH signatures kept in the spec
+    catalog; only documents whose content changed are re-indexed.
+
+    Examples:
+        blueprint search "oauth login"
+        blueprint search --like .blueprint/specs/042-sso/spec.md
+        blueprint search --duplicates --kind spec --threshold 0.6
+    """
+    from ..services.search import SEARCH_KINDS, duplicate_clusters, similar_to_text, search as run_search
+
+    for k in kind or []:
+        if k not in SEARCH_KINDS:
+            console.print(f"[red]Error:[/red] Invalid kind '{k}'. Choose from: {', '.join(SEARCH_KINDS)}")
+            raise typer.Exit(1)
+    if sum(bool(x) for x in (text, like, duplicates)) != 1:
+        console.print("[red]Error:[/red] Provide exactly one of a query, --like FILE or --duplicates")
+        raise typer.Exit(1)
+
+    catalog, _ = _open_catalog(refresh=not no_refresh)
+    with catalog:
+        if duplicates:
+            results = duplicate_clusters(catalog.conn, kinds=kind, threshold=threshold)
+        elif like:
+            try:
+                like_text = like.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                console.print(f"[red]Error:[/red] Could not read {like}: {e}")
+                raise typer.Exit(1)
+            # Don't report the file itself when it lives in a feature directory
+            exclude = like.resolve().parent.name if like.resolve().parent.parent == catalog.specs_dir.resolve() else None
+            results = similar_to_text(catalog.conn, like_text, kinds=kind, threshold=threshold, limit=limit, exclude=exclude)
+        else:
+            results = run_search(catalog.conn, text, kinds=kind, limit=limit)
+
+    if json_output:
+        print(json.dumps(results, indent=2))
+        return
+
+    if not results:
+        console.print("[yellow]No matches.[/yellow]")
+        return
+
+    from rich.table import Table
+
+    if duplicates:
+        table = Table(title=f"Near-duplicate clusters ({len(results)})")
+        table.add_column("Kind", style="cyan")
+        table.add_column("Similarity", justify="right")
+        table.add_column("Features")
+        for cluster in results:
+            table.add_row(cluster["kind"], f"{cluster['similarity']:.2f}", ", ".join(cluster["members"]))
+    else:
+        table = Table(title=f"Matches ({len(results)})")
+        table.add_column("Feature", style="cyan")
+        table.add_column("Kind")
+        table.add_column("Title")
+        table.add_column("Similarity" if like else "Score", justify="right")
+        if not like:
+            table.add_column("Matched")
+        for hit in results:
+            row = [hit["feature"], hit["kind"], hit["title"] or "[dim]-[/dim]", f"{hit['score']:.2f}"]
+            if not like:
+                row.append(", ".join(hit["matched"]))
+            table.add_row(*row)
+    console.print(table)
@@ -1,5 +1,9 @@
 """Check command implementation for the Blueprint-Kit CLI."""
 
+import json
+import sys
+import time
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -7,7 +11,7 @@ from rich.panel import Panel
 from ..core.step_tracker import StepTracker
 from ..core.agent_config import AGENT_CONFIG
 from ..core.cli import BANNER, TAGLINE
-from ..services.git import check_tool
+from ..services.tools import discover_tools
 
 
 console = Console()
@@ -37,29 +41,88 @@ def show_banner():
         console.print()
 
 
-def check():
+def _tool_labels() -> dict[str, str]:
+    """git, every agent, then the VS Code variants (not in agent config)."""
+    labels = {"git": "Git version control"}
+    labels.update({agent_key: agent_config["name"] for agent_key, agent_config in AGENT_CONFIG.items()})
+    labels["code"] = "Visual Studio Code"
+    labels["code-insiders"] = "Visual Studio Code Insiders"
+    return labels
+
+
+def _tool_record(tool: str, label: str, result: dict) -> dict:
+    return {
+        "tool": tool,
+        "name": label,
+        "kind": "agent" if tool in AGENT_CONFIG else ("vcs" if tool == "git" else "editor"),
+        "available": result["found"],
+        "path": result["path"],
+        "version": result["version"],
+        "latency_ms": round(result["elapsed_ms"], 3),
+    }
+
+
+def _check_machine_readable(labels: dict[str, str], versions: bool, ndjson: bool) -> None:
+    """Emit check results as JSON (one document) or NDJSON (one line per tool, as soon as known)."""
+    started = time.perf_counter()
+    records = []
+
+    def emit(tool, result):
+        record = _tool_record(tool, labels[tool], result)
+        records.append(record)
+        if ndjson:
+            sys.stdout.write(json.dumps({"type": "tool", **record}) + "\n")
+            sys.stdout.flush()
+
+    discover_tools(list(labels), probe_versions=versions, on_result=emit)
+
+    records.sort(key=lambda r: list(labels).index(r["tool"]))
+    available = {r["tool"]: r["available"] for r in records}
+    summary = {
+        "git": available["git"],
+        "any_agent": any(available[a] for a in AGENT_CONFIG),
+        "available": sum(available.values()),
+        "total": len(records),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+    if ndjson:
+        sys.stdout.write(json.dumps({"type": "summary", **summary}) + "\n")
+    else:
+        sys.stdout.write(json.dumps({"tools": records, "summary": summary}, indent=2) + "\n")
+    sys.stdout.flush()
+
+
+def check(
+    versions: bool = typer.Option(False, "--versions", help="Also probe each installed tool for its version (runs concurrently)"),
+    json_output: bool = typer.Option(False, "--json", help="Print a JSON report (no banner or tree) for provisioning scripts"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON object per tool as soon as it is known, then a summary line"),
+):
     """Check that all required tools are installed."""
+    labels = _tool_labels()
+    if json_output or ndjson:
+        if json_output and ndjson:
+            sys.stderr.write("Error: --json and --ndjson cannot be used together\n")
+            raise typer.Exit(1)
+        _check_machine_readable(labels, versions, ndjson)
+        return
+
     show_banner()
     console.print("[bold]Checking for installed tools...[/bold]\n")
 
     tracker = StepTracker("Check Available Tools")
+    for tool, label in labels.items():
+        tracker.add(tool, label)
+
+    # One PATH index for all tools instead of a full PATH scan per tool
+    results = discover_tools(list(labels), probe_versions=versions)
+    for tool, result in results.items():
+        if result["found"]:
+            tracker.complete(tool, result["version"] or "available")
+        else:
+            tracker.error(tool, "not found")
 
-    tracker.add("git", "Git version control")
-    git_ok = check_tool("git", tracker=tracker)
-    
-    agent_results = {}
-    for agent_key, agent_config in AGENT_CONFIG.items():
-        agent_name = agent_config["name"]
-        
-        tracker.add(agent_key, agent_name)
-        agent_results[agent_key] = check_tool(agent_key, tracker=tracker)
-    
-    # Check VS Code variants (not in agent config)
-    tracker.add("code", "Visual Studio Code")
-    code_ok = check_tool("code", tracker=tracker)
-    
-    tracker.add("code-insiders", "Visual Studio Code Insiders")
-    code_insiders_ok = check_tool("code-insiders", tracker=tracker)
+    git_ok = results["git"]["found"]
+    agent_results = {agent_key: results[agent_key]["found"] for agent_key in AGENT_CONFIG}
 
     console.print(tracker.render())
 
@@ -69,4 +132,4 @@ def check():
         console.print("[dim]Tip: Install git for repository management[/dim]")
 
     if not any(agent_results.values()):
-        console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
\ No newline at end of file
+        console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
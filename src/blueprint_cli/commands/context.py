@@ -0,0 +1,75 @@
+"""Context command implementation for the Blueprint-Kit CLI."""
+
+import json
+import shlex
+
+import typer
+from rich.console import Console
+
+from ..services.context import resolve_context
+
+
+console = Console()
+
+
+def context(
+    json_output: bool = typer.Option(False, "--json", help="Print the resolved context as JSON"),
+    shell: bool = typer.Option(False, "--shell", help="Print KEY='value' lines suitable for eval in bash/zsh"),
+    field: str = typer.Option(None, "--field", help="Print a single value (e.g. FEATURE_DIR) and exit non-zero if it is unset"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Resolve from scratch without reading or updating the context cache"),
+):
+    """
+    Resolve the repository root, branch, active feature and artifact paths.
+
+    The feature is taken from BLUEPRINT_FEATURE, then a NNN-prefixed branch,
+    then the latest directory under .blueprint/specs. The workflow scripts call
+    this once instead of shelling out to git repeatedly.
+
+    Examples:
+        blueprint context
+        blueprint context --json
+        blueprint context --field FEATURE_DIR
+        eval "$(blueprint context --shell)"
+    """
+    ctx = resolve_context(use_cache=not no_cache)
+
+    if field:
+        key = field.upper()
+        if key not in ctx:
+            console.print(f"[red]Error:[/red] Unknown field '{field}'. Choose from: {', '.join(ctx.keys())}")
+            raise typer.Exit(2)
+        value = ctx[key]
+        if value is None or value == []:
+            raise typer.Exit(1)
+        print(" ".join(value) if isinstance(value, list) else value)
+        return
+
+    if json_output:
+        print(json.dumps(ctx, indent=2))
+        return
+
+    if shell:
+        for key, value in ctx.items():
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            elif isinstance(value, list):
+                value = " ".join(value)
+            print(f"{key}={shlex.quote(value or '')}")
+        return
+
+    from rich.table import Table
+
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column(style="cyan")
+    table.add_column()
+    for key, value in ctx.items():
+        if key == "CACHED":
+            continue
+        if isinstance(value, list):
+            value = ", ".join(value) or "[dim]none[/dim]"
+        elif value is None:
+            value = "[dim]-[/dim]"
+        table.add_row(key, str(value))
+    console.print(table)
+    if ctx["FEATURE_DIR"] is None:
+        console.print("[yellow]No active feature:[/yellow] create one with 'blueprint feature new' or set BLUEPRINT_FEATURE")
@@ -0,0 +1,124 @@
+"""Feature command implementation for the Blueprint-Kit CLI."""
+
+import json
+import subprocess
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from ..services.features import FeatureIndex, find_project_root
+from ..services.git import is_git_repo
+
+
+console = Console()
+
+feature_app = typer.Typer(help="Create and manage feature specifications", add_completion=False)
+
+# Files created for a new feature, in order: (file name, template name or None for an empty placeholder)
+FEATURE_FILES = [
+    ("spec.md", "spec-template.md"),
+    ("goals.md", "goal-template.md"),
+    ("blueprint.md", "blueprint-template.md"),
+    ("plan.md", None),
+    ("tasks.md", None),
+]
+
+_FALLBACK_HEADINGS = {
+    "spec.md": "# [FEATURE NAME]\n",
+    "goals.md": "# [GOAL NAME]\n",
+    "blueprint.md": "# [ARCHITECTURAL BLUEPRINT NAME]\n",
+}
+
+
+def _template_content(root: Path, file_name: str, template_name: str | None) -> str:
+    """Return the project's template for file_name, or a minimal heading when it is missing."""
+    if template_name is None:
+        return ""
+    template = root / ".blueprint" / "templates" / template_name
+    try:
+        return template.read_text(encoding="utf-8")
+    except OSError:
+        return _FALLBACK_HEADINGS.get(file_name, "")
+
+
+def _switch_branch(root: Path, branch_name: str) -> tuple[bool, str]:
+    """Create (or check out an existing) feature branch. Returns (success, message)."""
+    exists = subprocess.run(
+        ["git", "show-ref", "--verify", "--quiet", f"refs/heads/{branch_name}"],
+        cwd=root,
+        capture_output=True,
+    ).returncode == 0
+    cmd = ["git", "checkout", branch_name] if exists else ["git", "checkout", "-b", branch_name]
+    result = subprocess.run(cmd, cwd=root, capture_output=True, text=True)
+    if result.returncode != 0:
+        return False, (result.stderr or result.stdout).strip()
+    return True, f"Checked out existing branch {branch_name}" if exists else f"Created and switched to branch {branch_name}"
+
+
+@feature_app.command("new")
+def feature_new(
+    description: list[str] = typer.Argument(..., help="Feature description (used to derive the branch name)"),
+    json_output: bool = typer.Option(False, "--json", help="Create only spec.md and print BRANCH_NAME/SPEC_FILE as JSON"),
+    no_branch: bool = typer.Option(False, "--no-branch", help="Do not create or switch git branches"),
+):
+    """
+    Allocate the next feature number and create its spec directory.
+
+    Numbers come from a locked counter kept in the user cache directory, so
+    concurrent runs never collide and the specs directory is only rescanned
+    when it changed outside this command.
+
+    Examples:
+        blueprint feature new "User authentication with OAuth"
+        blueprint feature new --json "Export reports as CSV"
+    """
+    text = " ".join(description).strip()
+    if not text:
+        console.print("[red]Error:[/red] Feature description is required")
+        raise typer.Exit(1)
+
+    root = find_project_root()
+    try:
+        allocation = FeatureIndex(root).allocate(text)
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Could not allocate feature number: {e}")
+        raise typer.Exit(1)
+
+    feature_dir = allocation["feature_dir"]
+    branch_name = allocation["branch_name"]
+
+    # Matches create-new-feature.sh: JSON mode only creates the spec, the
+    # slash-command flow fills in the remaining documents itself
+    files = FEATURE_FILES[:1] if json_output else FEATURE_FILES
+    created = []
+    for file_name, template_name in files:
+        target = feature_dir / file_name
+        if not target.exists():
+            target.write_text(_template_content(root, file_name, template_name), encoding="utf-8")
+        created.append(target)
+    if not json_output:
+        (feature_dir / "checklists").mkdir(exist_ok=True)
+
+    branch_message = None
+    if not no_branch:
+        if is_git_repo(root):
+            ok, branch_message = _switch_branch(root, branch_name)
+            if not ok:
+                console.print(f"[red]Error:[/red] Failed to switch to branch {branch_name}: {branch_message}")
+                raise typer.Exit(1)
+        else:
+            branch_message = "Not in a git repository, skipping branch creation"
+
+    spec_file = feature_dir / "spec.md"
+    if json_output:
+        print(json.dumps({"BRANCH_NAME": branch_name, "SPEC_FILE": str(spec_file)}))
+        return
+
+    console.print(f"[cyan]Created feature directory:[/cyan] {feature_dir}")
+    for path in created:
+        console.print(f"  [green]✓[/green] {path.name}")
+    console.print("  [green]✓[/green] checklists/")
+    if branch_message:
+        console.print(branch_message)
+    console.print("[bold green]Feature setup complete![/bold green]")
@@ -4,33 +4,31 @@ import os
 import subprocess
 import sys
 import zipfile
-import tempfile
 import shutil
 import shlex
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.live import Live
 from rich.align import Align
-from rich.table import Table
-import httpx
-# For cross-platform keyboard input
-import readchar
-import ssl
-import truststore
 
-# Define SSL context for secure connections
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+# Heavy dependencies (httpx, truststore/ssl, readchar, rich.live, rich.table) and the
+# GitHub service are imported inside the functions that need them so that
+# `blueprint check` and `--help` don't pay for them.
+if TYPE_CHECKING:
+    import httpx
 
+from ..core.step_graph import StepGraph
 from ..core.step_tracker import StepTracker
-from ..core.agent_config import AGENT_CONFIG
+from ..core.tracing import http_event_hooks, span
+from ..core.agent_config import AGENT_CONFIG, AGENT_COMMAND_CONFIG
 from ..core.cli import SCRIPT_TYPE_CHOICES, CLAUDE_LOCAL_PATH, BANNER, TAGLINE
-from ..core.utils import _github_token, _github_auth_headers, is_git_repo
-from ..services.github import download_template_from_github
+from ..core.utils import _github_token, _github_auth_headers, is_git_repo, write_text_if_changed
+from ..services.cache import TemplateCache
+from ..services.archive import extract_zip_into
+from ..services.templates import find_commands_dir, load_bundle, render_command
 from ..services.git import check_tool, init_git_repo
 
 
@@ -38,6 +36,9 @@ console = Console()
 
 def get_key():
     """Get a single keypress in a cross-platform way using readchar."""
+    # For cross-platform keyboard input
+    import readchar
+
     try:
         key = readchar.readkey()
 
@@ -75,6 +76,9 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
     Returns:
         Selected option key
     """
+    from rich.live import Live
+    from rich.table import Table
+
     option_keys = list(options.keys())
     if default_key and default_key in option_keys:
         selected_index = option_keys.index(default_key)
@@ -225,14 +229,24 @@ def run_command(cmd: list[str], check_return: bool = True, capture: bool = False
         return None
 
 
-def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Path:
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, cache: TemplateCache | None = None, offline: bool = False, refresh_cache: bool = False, timeout: float | None = None, retries: int | None = None, connections: int | None = None) -> Path:
     """Download the latest release and extract it to create a new project.
-    Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+    Returns project_path. Uses tracker if provided (with keys: fetch, cache, download, extract, cleanup)
+    """
+    zip_path, meta = fetch_template(ai_assistant, script_type, verbose=verbose, tracker=tracker, client=client, debug=debug, github_token=github_token, cache=cache, offline=offline, refresh_cache=refresh_cache, timeout=timeout, retries=retries, connections=connections)
+    return extract_template(project_path, zip_path, meta, ai_assistant, script_type, is_current_dir, verbose=verbose, tracker=tracker, debug=debug)
+
+
+def fetch_template(ai_assistant: str, script_type: str, *, verbose: bool = True, tracker: StepTracker | None = None, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, cache: TemplateCache | None = None, offline: bool = False, refresh_cache: bool = False, timeout: float | None = None, retries: int | None = None, connections: int | None = None) -> tuple[Path, dict]:
+    """Download (or take from the cache) the template archive. Returns (zip_path, metadata).
+    Uses tracker if provided (with keys: fetch, cache, download)
     """
+    from ..services.github import download_template_from_github
+
     current_dir = Path.cwd()
 
     if tracker:
-        tracker.start("fetch", "contacting GitHub API")
+        tracker.start("fetch", "reading template cache" if offline else "contacting GitHub API")
     try:
         zip_path, meta = download_template_from_github(
             ai_assistant,
@@ -242,12 +256,40 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
             show_progress=(tracker is None),
             client=client,
             debug=debug,
-            github_token=github_token
+            github_token=github_token,
+            cache=cache,
+            offline=offline,
+            refresh_cache=refresh_cache,
+            timeout=timeout,
+            retries=retries,
+            connections=connections,
+            console=console,
         )
         if tracker:
-            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
+            source = f", metadata {meta['release_source']}" if meta.get("release_source") else ""
+            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes{source})")
+            tracker.add("cache", "Template cache")
+            if meta.get("cache") in ("hit", "offline"):
+                tracker.complete("cache", f"{meta['cache']} ({meta['sha256'][:12]})")
+            elif meta.get("cache"):
+                tracker.complete("cache", f"{meta['cache']}, stored {meta['sha256'][:12]}")
+            else:
+                tracker.skip("cache", "disabled")
             tracker.add("download", "Download template")
-            tracker.complete("download", meta['filename'])
+            if meta.get("cache") in ("hit", "offline"):
+                tracker.skip("download", f"{meta['filename']} (cached)")
+            else:
+                transfer = meta.get("transfer") or {}
+                notes = []
+                if transfer.get("resumed_from"):
+                    notes.append(f"resumed at {transfer['resumed_from']:,} bytes")
+                if transfer.get("connections", 1) > 1:
+                    notes.append(f"{transfer['connections']} connections")
+                elif transfer.get("attempts", 1) > 1:
+                    notes.append(f"{transfer['attempts']} attempts")
+                tracker.complete("download", meta['filename'] + (f" ({', '.join(notes)})" if notes else ""))
+        elif verbose and meta.get("cache"):
+            console.print(f"[cyan]Template cache:[/cyan] {meta['cache']}")
     except Exception as e:
         if tracker:
             tracker.error("fetch", str(e))
@@ -255,6 +297,15 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
             if verbose:
                 console.print(f"[red]Error downloading template:[/red] {e}")
         raise
+    return zip_path, meta
+
+
+def extract_template(project_path: Path, zip_path: Path, meta: dict, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, debug: bool = False, agents: list[str] | None = None) -> Path:
+    """Extract a fetched template archive into project_path and record the installed release.
+    agents lists every agent being set up (ai_assistant's archive is the one extracted).
+    Returns project_path. Uses tracker if provided (with keys: extract, zip-list, extracted-summary, cleanup)
+    """
+    from ..services.upgrade import hashes_from_zip, write_record
 
     if tracker:
         tracker.add("extract", "Extract template")
@@ -274,73 +325,31 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
             elif verbose:
                 console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
 
-            if is_current_dir:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
-
-                    extracted_items = list(temp_path.iterdir())
-                    if tracker:
-                        tracker.start("extracted-summary")
-                        tracker.complete("extracted-summary", f"{len(extracted_items)} items")
-                    elif verbose:
-                        console.print(f"[cyan]Extracted {len(extracted_items)} items to temp location[/cyan]")
-
-                    source_dir = temp_path
-                    if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                        source_dir = extracted_items[0]
-                        if tracker:
-                            tracker.add("flatten", "Flatten nested directory")
-                            tracker.complete("flatten")
-                        elif verbose:
-                            console.print(f"[cyan]Found nested directory structure[/cyan]")
-
-                    for item in source_dir.iterdir():
-                        dest_path = project_path / item.name
-                        if item.is_dir():
-                            if dest_path.exists():
-                                if verbose and not tracker:
-                                    console.print(f"[yellow]Merging directory:[/yellow] {item.name}")
-                                for sub_item in item.rglob('*'):
-                                    if sub_item.is_file():
-                                        rel_path = sub_item.relative_to(item)
-                                        dest_file = dest_path / rel_path
-                                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                                        shutil.copy2(sub_item, dest_file)
-                            else:
-                                shutil.copytree(item, dest_path)
-                        else:
-                            if dest_path.exists() and verbose and not tracker:
-                                console.print(f"[yellow]Overwriting file:[/yellow] {item.name}")
-                            shutil.copy2(item, dest_path)
-                    if verbose and not tracker:
-                        console.print(f"[cyan]Template files merged into current directory[/cyan]")
-            else:
-                zip_ref.extractall(project_path)
-
-                extracted_items = list(project_path.iterdir())
-                if tracker:
-                    tracker.start("extracted-summary")
-                    tracker.complete("extracted-summary", f"{len(extracted_items)} top-level items")
-                elif verbose:
-                    console.print(f"[cyan]Extracted {len(extracted_items)} items to {project_path}:[/cyan]")
-                    for item in extracted_items:
-                        console.print(f"  - {item.name} ({'dir' if item.is_dir() else 'file'})")
-
-                if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                    nested_dir = extracted_items[0]
-                    temp_move_dir = project_path.parent / f"{project_path.name}_temp"
-
-                    shutil.move(str(nested_dir), str(temp_move_dir))
-
-                    project_path.rmdir()
-
-                    shutil.move(str(temp_move_dir), str(project_path))
-                    if tracker:
-                        tracker.add("flatten", "Flatten nested directory")
-                        tracker.complete("flatten")
-                    elif verbose:
-                        console.print(f"[cyan]Flattened nested directory structure[/cyan]")
+            # Stream each member straight to its final path (flattening a nested root in-stream);
+            # files whose size + CRC32 already match the archive are left untouched
+            result = extract_zip_into(zip_ref, project_path, flatten=True, skip_unchanged=True)
+            # Baseline for 'blueprint upgrade': which release is installed and what each file held
+            write_record(project_path, meta["release"], ai_assistant, script_type, hashes_from_zip(zip_ref), agents=agents)
+            if tracker:
+                tracker.start("extracted-summary")
+                tracker.complete("extracted-summary", f"{result['files'] + result['skipped']} files, {len(result['top_level'])} top-level items")
+                if result["flattened"]:
+                    tracker.add("flatten", "Flatten nested directory")
+                    tracker.complete("flatten")
+                if is_current_dir:
+                    tracker.add("merge", "Merge into existing files")
+                    tracker.complete("merge", f"{result['files']} written, {result['skipped']} unchanged, {len(result['conflicted'])} conflicted")
+            elif verbose:
+                console.print(f"[cyan]Extracted {result['files']} files to {project_path}:[/cyan]")
+                for name in result["top_level"]:
+                    console.print(f"  - {name} ({'dir' if (project_path / name).is_dir() else 'file'})")
+                if result["flattened"]:
+                    console.print(f"[cyan]Flattened nested directory structure[/cyan]")
+                if is_current_dir:
+                    for rel in result["overwritten"]:
+                        console.print(f"[yellow]Overwriting file:[/yellow] {rel}")
+                    console.print(f"[cyan]Template files merged into current directory[/cyan] "
+                                  f"({result['files']} written, {result['skipped']} unchanged, {len(result['conflicted'])} conflicted)")
 
     except Exception as e:
         if tracker:
@@ -361,7 +370,10 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
         if tracker:
             tracker.add("cleanup", "Remove temporary archive")
 
-        if zip_path.exists():
+        if meta.get("cached"):
+            if tracker:
+                tracker.skip("cleanup", "archive kept in cache")
+        elif zip_path.exists():
             zip_path.unlink()
             if tracker:
                 tracker.complete("cleanup")
@@ -400,8 +412,7 @@ def create_vscode_settings(project_path: Path, tracker: StepTracker | None = Non
             with open(template_path, 'r', encoding='utf-8') as f:
                 vscode_settings = json.load(f)
 
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(vscode_settings, f, indent=4)
+            write_text_if_changed(settings_path, json.dumps(vscode_settings, indent=4))
 
             if tracker:
                 tracker.add("vscode-settings", "Create VS Code settings")
@@ -424,8 +435,7 @@ def create_vscode_settings(project_path: Path, tracker: StepTracker | None = Non
                 }
             }
 
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(vscode_settings, f, indent=4)
+            write_text_if_changed(settings_path, json.dumps(vscode_settings, indent=4))
 
             if tracker:
                 tracker.add("vscode-settings", "Create VS Code settings")
@@ -443,9 +453,13 @@ def create_vscode_settings(project_path: Path, tracker: StepTracker | None = Non
 def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None = None) -> None:
     """Ensure POSIX .sh scripts under .blueprint/scripts (recursively) have execute bits (no-op on Windows)."""
     if os.name == "nt":
+        if tracker:
+            tracker.skip("chmod", "not needed on Windows")
         return  # Windows: skip silently
     scripts_root = project_path / ".blueprint" / "scripts"
     if not scripts_root.is_dir():
+        if tracker:
+            tracker.skip("chmod", "no scripts")
         return
     failures: list[str] = []
     updated = 0
@@ -485,102 +499,39 @@ def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None =
                 console.print(f"  - {f}")
 
 
-def generate_agent_commands_in_project(project_path: Path, agent: str, tracker: StepTracker = None):
+def generate_agent_commands_in_project(project_path: Path, agent: str, tracker: StepTracker = None, script_type: str | None = None):
     """
     Generate agent-specific command files in the project after initialization.
+
+    Templates come from the precompiled command bundle (services/templates.py), so
+    each output file is rendered with a single join instead of per-run regex parsing.
     
     Args:
         project_path: Path to the project directory
         agent: The selected AI agent
         tracker: Optional StepTracker to update with progress
+        script_type: Script variant to render ("sh" or "ps"). Every variant writes the
+            same output file, so only this one is rendered; None keeps the legacy
+            behaviour of rendering all variants (the last one wins).
     """
-    import re
-    import shutil
-    from pathlib import Path
-    
-    # Define agent configurations - Updated for correct AI tool formats
-    agents = {
-        'claude': {'dir': '.claude/commands', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'gemini': {'dir': '.gemini/commands', 'ext': 'toml', 'arg_format': '{{args}}', 'script_variants': ['sh', 'ps']},
-        'copilot': {'dir': '.github/copilot-instructions', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'cursor-agent': {'dir': '.cursor/rules', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'qwen': {'dir': '.qwen/commands', 'ext': 'toml', 'arg_format': '{{args}}', 'script_variants': ['sh', 'ps']},
-        'opencode': {'dir': '.opencode/commands', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'windsurf': {'dir': '.windsurf/workflows', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'codex': {'dir': '.codex/commands', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'kilocode': {'dir': '.kilocode/commands', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'auggie': {'dir': '.augment/commands', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'roo': {'dir': '.roo/commands', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'codebuddy': {'dir': '.codebuddy/commands', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-        'q': {'dir': '.amazonq/commands', 'ext': 'md', 'arg_format': '$ARGUMENTS', 'script_variants': ['sh', 'ps']},
-    }
-    
-    if agent not in agents:
+    if agent not in AGENT_COMMAND_CONFIG:
         if tracker:
             tracker.error(f"agent-{agent}", f"Unsupported agent: {agent}")
         else:
             console.print(f"[red]Error:[/red] Unsupported agent: {agent}")
         return
     
-    agent_config = agents[agent]
-    
-    # Get the template command files using reliable path resolution
-    # Try multiple methods to find the blueprint-kit root directory
-
-    templates_commands_dir = None
-
-    # Method 1: Try to find relative to the installed package location
-    try:
-        # When installed as package, __file__ points to the installed location
-        current_file = Path(__file__)
-        # Go up from src/blueprint_cli/commands/init.py to find blueprint-kit root
-        # This should work for both development and installed scenarios
-        for _ in range(10):  # Prevent infinite loop
-            current_file = current_file.parent
-            if current_file.name == "blueprint-kit" or current_file.parent.name == "blueprint-kit":
-                blueprint_kit_root = current_file if current_file.name == "blueprint-kit" else current_file.parent
-                templates_commands_dir = blueprint_kit_root / "templates" / "commands"
-                if templates_commands_dir.exists():
-                    break
-                templates_commands_dir = None
-    except Exception:
-        pass
-
-    # Method 2: Try importlib.resources (works when installed as package)
-    if templates_commands_dir is None:
-        try:
-            if sys.version_info >= (3, 9):
-                from importlib.resources import files
-                templates_commands_dir = files('blueprint_cli').joinpath('templates', 'commands')
-            else:
-                import importlib_resources
-                templates_commands_dir = importlib_resources.files('blueprint_cli') / 'templates' / 'commands'
-        except (ImportError, Exception):
-            pass
+    agent_config = AGENT_COMMAND_CONFIG[agent]
 
-    # Method 3: Fallback to development path
+    templates_commands_dir = find_commands_dir()
     if templates_commands_dir is None:
-        try:
-            # Assume we're in development mode
-            script_dir = Path(__file__).parent  # src/blueprint_cli/commands/
-            blueprint_cli_dir = script_dir.parent  # src/blueprint_cli/
-            src_dir = blueprint_cli_dir.parent  # src/
-            blueprint_kit_root = src_dir.parent  # blueprint-kit root
-            templates_commands_dir = blueprint_kit_root / "templates" / "commands"
-        except Exception:
-            pass
-
-    # Convert to Path object for compatibility if needed
-    if templates_commands_dir is not None and not isinstance(templates_commands_dir, Path):
-        templates_commands_dir = Path(templates_commands_dir)
-
-    if not templates_commands_dir.exists():
         if tracker:
-            tracker.error(f"agent-{agent}", f"Command templates not found at {templates_commands_dir}")
+            tracker.error(f"agent-{agent}", "Command templates not found")
         else:
             console.print("[red]Error:[/red] Command templates not found")
-            console.print(f"[yellow]Expected location:[/yellow] {templates_commands_dir}")
         return
+
+    bundle = load_bundle(templates_commands_dir)
     
     # Create the agent-specific directory
     agent_dir = project_path / agent_config['dir']
@@ -592,83 +543,89 @@ def generate_agent_commands_in_project(project_path: Path, agent: str, tracker:
     else:
         console.print(f"[cyan]Creating agent directory:[/cyan] {agent_config['dir']}")
         console.print(f"[cyan]Template directory found:[/cyan] {templates_commands_dir}")
-    
-    # Process each command template
-    command_files = list(templates_commands_dir.glob('*.md'))
-    for cmd_file in command_files:
-        try:
-            # Read the template
-            content = cmd_file.read_text(encoding='utf-8')
-            
-            # Extract YAML frontmatter
-            yaml_match = re.match(r'^---\n(.*?)\n---\n(.*)', content, re.DOTALL)
-            if not yaml_match:
-                continue  # Skip if invalid frontmatter
-            
-            yaml_content = yaml_match.group(1)
-            body_content = yaml_match.group(2)
-            
-            # Parse description from YAML
-            description_match = re.search(r'^description:\s*(.*)', yaml_content, re.MULTILINE)
-            description = description_match.group(1).strip().strip('"') if description_match else ""
-            
-            # Extract scripts dictionary
-            scripts_match = re.search(r'^scripts:\s*\n((?:\s+[a-z_]+:.*)+)', yaml_content, re.MULTILINE)
-            scripts_dict = {}
-            if scripts_match:
-                script_content = scripts_match.group(1)
-                for line in script_content.split('\n'):
-                    line = line.strip()
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        scripts_dict[key.strip()] = value.strip().strip('"')
-        
-            # Process for each script variant
-            for variant in agent_config['script_variants']:
-                # Replace {SCRIPT} placeholder with the appropriate script command
-                script_command = scripts_dict.get(variant, "(Missing script command)")
-                replaced_content = body_content.replace('{SCRIPT}', script_command)
-                
-                # Replace {ARGS} placeholder with the appropriate argument format
-                replaced_content = replaced_content.replace('{ARGS}', agent_config['arg_format'])
-                
-                # Replace $ARGUMENTS with the actual argument format
-                replaced_content = replaced_content.replace('$ARGUMENTS', agent_config['arg_format'])
-                
-                # Apply path rewrites, being careful not to duplicate .blueprint prefixes
-                # The original regex (/?memory/) would match both /memory/ and memory/, causing duplication
-                # We should only match root paths that start with / but are not already prefixed with .blueprint/
-                replaced_content = re.sub(r'(?<!\.blueprint)/(memory|scripts|templates)/', r'.blueprint/\1/', replaced_content)
-                
-                # Create the output file - use just the command name for slash command recognition
-                output_filename = f"{cmd_file.stem}.{agent_config['ext']}"
-                output_path = agent_dir / output_filename
-                
-                # For TOML files, wrap content in proper TOML structure
-                if agent_config['ext'] == 'toml':
-                    # Convert any backslashes to forward slashes to ensure
-                    # AI agents can properly recognize and work with TOML files
-                    desc_escaped = description.replace('\\\\', '/')
-                    content_escaped = replaced_content.replace('\\\\', '/')
-                    toml_content = f'description = "{desc_escaped}"\n\nprompt = """\n{content_escaped}\n"""'
-                    output_path.write_text(toml_content, encoding='utf-8')
+
+    for name, error in bundle["errors"].items():
+        if tracker:
+            tracker.error(f"cmd-{name}", f"Error: {error}")
+        else:
+            console.print(f"[red]Error processing {name}:[/red] {error}")
+
+    variants = [script_type] if script_type in agent_config['script_variants'] else agent_config['script_variants']
+    unchanged = 0
+    with span(f"render {agent} commands", "render", dir=str(agent_dir)) as trace:
+        for name, entry in bundle["templates"].items():
+            # Use just the command name for slash command recognition
+            output_path = agent_dir / f"{name}.{agent_config['ext']}"
+            try:
+                for variant in variants:
+                    content = render_command(entry, variant, agent_config['arg_format'], agent_config['ext'])
+                    if not write_text_if_changed(output_path, content):
+                        unchanged += 1
+            except Exception as e:
+                if tracker:
+                    tracker.error(f"cmd-{name}", f"Error: {str(e)}")
                 else:
-                    # Also fix backslashes in regular files for consistency
-                    content_escaped = replaced_content.replace('\\\\', '/')
-                    output_path.write_text(content_escaped, encoding='utf-8')
-        
-        except Exception as e:
-            if tracker:
-                tracker.error(f"cmd-{cmd_file.stem}", f"Error: {str(e)}")
-            else:
-                console.print(f"[red]Error processing {cmd_file}:[/red] {e}")
-    
+                    console.print(f"[red]Error processing {name}:[/red] {e}")
+        trace.update(files=bundle["count"], unchanged=unchanged)
+
+    command_count = bundle["count"]
     if tracker:
-        tracker.complete(f"agent-{agent}", f"Created {len(command_files)} commands for {agent}")
+        tracker.complete(f"agent-{agent}", f"Created {command_count} commands for {agent}" + (f", {unchanged} writes skipped (unchanged)" if unchanged else ""))
     else:
-        console.print(f"[green]Created {len(command_files)} command files for {agent} agent in {agent_config['dir']}[/green]")
-        console.print(f"[cyan]Debug:[/cyan] Agent directory: {agent_dir}")
-        console.print(f"[cyan]Debug:[/cyan] Files created: {list(agent_dir.glob('*'))}")
+        console.print(f"[green]Created {command_count} command files for {agent} agent in {agent_config['dir']}[/green]")
+
+
+def generate_agent_commands_for_agents(project_path: Path, agents: list[str], tracker: StepTracker = None, script_type: str | None = None, max_workers: int | None = None):
+    """
+    Generate command files for several agents in one pass.
+
+    The command templates are parsed once (the bundle is shared by every agent) and
+    each agent's dir/ext/arg_format target is rendered and written concurrently.
+
+    Args:
+        project_path: Path to the project directory
+        agents: AI agents to generate commands for
+        tracker: Optional StepTracker to update with progress
+        script_type: Script variant to render ("sh" or "ps")
+        max_workers: Thread pool size (defaults to one worker per agent, capped at 8)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if len(agents) == 1:
+        generate_agent_commands_in_project(project_path, agents[0], tracker=tracker, script_type=script_type)
+        return
+
+    commands_dir = find_commands_dir()
+    if commands_dir is not None:
+        load_bundle(commands_dir)  # Parse once up front; workers reuse the memoised bundle
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(8, len(agents))) as pool:
+        futures = [
+            pool.submit(generate_agent_commands_in_project, project_path, agent, tracker, script_type)
+            for agent in agents
+        ]
+        for future in futures:
+            future.result()
+
+
+def parse_ai_assistants(value) -> list[str]:
+    """Split an --ai value such as "claude,gemini" (or a list) into unique agent keys.
+
+    Raises:
+        ValueError: if any agent is not in AGENT_CONFIG
+    """
+    items = value if isinstance(value, (list, tuple)) else str(value).split(",")
+    agents = []
+    for item in items:
+        agent = str(item).strip()
+        if agent and agent not in agents:
+            agents.append(agent)
+    if not agents:
+        raise ValueError("No AI assistant given")
+    invalid = [a for a in agents if a not in AGENT_CONFIG]
+    if invalid:
+        raise ValueError(f"Invalid AI assistant '{invalid[0]}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
+    return agents
 
 
 def create_agent_specific_md_file(project_path: Path, agent: str, tracker: StepTracker = None):
@@ -708,7 +665,6 @@ def create_agent_specific_md_file(project_path: Path, agent: str, tracker: StepT
         # Check if the template exists and read it
         if agent_template_path and agent_template_path.exists():
             template_content = agent_template_path.read_text(encoding='utf-8')
-            console.print(f"[green]Debug:[/green] Found template at: {agent_template_path}")
         else:
             # If primary method didn't work, try fallback methods
             script_dir = Path(__file__).parent  # src/blueprint_cli/commands/
@@ -727,7 +683,7 @@ def create_agent_specific_md_file(project_path: Path, agent: str, tracker: StepT
 
             if fallback_template_path and fallback_template_path.exists():
                 template_content = fallback_template_path.read_text(encoding='utf-8')
-                console.print(f"[green]Debug:[/green] Found template using fallback method: {fallback_template_path}")
+                agent_template_path = fallback_template_path
             else:
                 error_msg = f"Agent template not found in any location"
                 if tracker:
@@ -759,14 +715,13 @@ def create_agent_specific_md_file(project_path: Path, agent: str, tracker: StepT
 
         # Create the agent-specific MD file in the project root
         output_path = project_path / filename
-        output_path.write_text(template_content, encoding='utf-8')
+        with span(f"render {agent} agent file", "render", template=str(agent_template_path), file=filename):
+            write_text_if_changed(output_path, template_content)
 
         success_msg = f"Created {filename} with agent-specific configuration in project root"
         if tracker:
             tracker.add(f"agent-md-{agent}", f"Create {filename} file")
             tracker.complete(f"agent-md-{agent}", f"Created {filename} in project root")
-        
-        console.print(f"[green]Debug:[/green] Successfully created {filename} in {project_path}")
 
     except Exception as e:
         error_msg = f"Error creating agent-specific MD file: {str(e)}"
@@ -779,9 +734,176 @@ def create_agent_specific_md_file(project_path: Path, agent: str, tracker: StepT
         raise  # Re-raise to ensure the error is properly handled by the main init function
 
 
+def generate_local_files(project_path: Path, agents: list[str], script_type: str, tracker: StepTracker | None = None) -> None:
+    """Write everything init renders from the bundled templates: agent commands, agent MD files and VS Code settings.
+
+    None of it needs the downloaded archive, so it can run while the archive is fetched.
+    """
+    generate_agent_commands_for_agents(project_path, agents, tracker=tracker, script_type=script_type)
+    for agent in agents:
+        create_agent_specific_md_file(project_path, agent, tracker=tracker)
+    create_vscode_settings(project_path, tracker=tracker)
+
+
+def merge_staged_tree(staging: Path, project_path: Path) -> dict:
+    """Move files rendered into staging over the project tree, leaving identical files untouched.
+
+    Staged files win over extracted ones, as they did when they were written after extraction.
+    Returns counts of ``written`` and ``unchanged`` files.
+    """
+    written = unchanged = 0
+    with span("merge staged files", "disk") as trace:
+        for source in sorted(staging.rglob("*")):
+            if not source.is_file():
+                continue
+            target = project_path / source.relative_to(staging)
+            try:
+                if target.is_file() and target.stat().st_size == source.stat().st_size and target.read_bytes() == source.read_bytes():
+                    unchanged += 1
+                    continue
+            except OSError:
+                pass
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(source), str(target))
+            written += 1
+        trace.update(files=written, unchanged=unchanged)
+    return {"written": written, "unchanged": unchanged}
+
+
+def _staging_dir(project_path: Path) -> Path:
+    import tempfile
+
+    try:
+        # Next to the project so the merge is a rename, not a copy
+        return Path(tempfile.mkdtemp(prefix=".blueprint-stage-", dir=project_path.parent))
+    except OSError:
+        return Path(tempfile.mkdtemp(prefix="blueprint-stage-"))
+
+
+def add_scaffold_steps(graph: StepGraph, project_path: Path, agents: list[str], script_type: str, is_current_dir: bool, *, staging: Path, verbose: bool = False, debug: bool = False, **fetch_options) -> None:
+    """Declare the steps that turn an empty (or existing) directory into a project.
+
+    The archive is fetched and extracted while the agent commands, agent MD
+    files and VS Code settings are rendered from the bundled templates into
+    staging; the merge step moves those over the extracted tree once both sides
+    are done. Provides ``files`` (the complete tree) and ``chmod``.
+    fetch_options are passed to fetch_template.
+    """
+    tracker = graph.tracker
+
+    def fetch(ctx):
+        ctx["archive"] = fetch_template(agents[0], script_type, verbose=verbose, tracker=tracker, debug=debug, **fetch_options)
+
+    def extract(ctx):
+        zip_path, meta = ctx["archive"]
+        extract_template(project_path, zip_path, meta, agents[0], script_type, is_current_dir, verbose=verbose, tracker=tracker, debug=debug, agents=agents)
+
+    def load_commands(ctx):
+        commands_dir = find_commands_dir()
+        if commands_dir is not None:
+            load_bundle(commands_dir)  # Parse once; the per-agent steps reuse the memoised bundle
+
+    def merge(ctx):
+        merged = merge_staged_tree(staging, project_path)
+        return f"{merged['written']} written" + (f", {merged['unchanged']} unchanged" if merged["unchanged"] else "")
+
+    graph.add("fetch", "Fetch latest release", fetch, provides=["archive"])
+    if tracker:
+        tracker.add("cache", "Template cache")
+        tracker.add("download", "Download template")
+    graph.add("extract", "Extract template", extract, needs=["archive"], provides=["tree"])
+    if tracker:
+        tracker.add("zip-list", "Archive contents")
+        tracker.add("extracted-summary", "Extraction summary")
+
+    graph.add("bundle", None, load_commands)
+    local = []
+    for agent in agents:
+        graph.add(f"agent-{agent}", f"Generate {agent} commands", lambda ctx, agent=agent: generate_agent_commands_in_project(staging, agent, tracker, script_type), needs=["bundle"])
+        graph.add(f"agent-md-{agent}", f"Create {agent} agent file", lambda ctx, agent=agent: create_agent_specific_md_file(staging, agent, tracker))
+        local += [f"agent-{agent}", f"agent-md-{agent}"]
+    graph.add("vscode-settings", "Create VS Code settings", lambda ctx: create_vscode_settings(staging, tracker))
+    local.append("vscode-settings")
+
+    graph.add("merge-local", "Merge generated files", merge, needs=["tree", *local], provides=["files"])
+    graph.add("chmod", "Ensure scripts executable", lambda ctx: ensure_executable_scripts(project_path, tracker), needs=["tree"])
+    if tracker:
+        tracker.add("cleanup", "Cleanup")
+
+
+def add_git_step(graph: StepGraph, project_path: Path, *, skip: str | None = None, required: bool = False) -> None:
+    """Declare the ``git`` step: initialise a repository once ``files`` and ``chmod`` are done.
+
+    An existing repository is left alone. When ``git init`` fails the step is
+    marked failed and the message kept in the graph context as ``git_error``;
+    with required=True the failure is raised instead, failing the graph.
+    """
+    tracker = graph.tracker
+
+    def init_git(ctx):
+        if is_git_repo(project_path):
+            return "existing repo detected"
+        success, error_msg = init_git_repo(project_path, quiet=True)
+        if success:
+            return "initialized"
+        if required:
+            raise RuntimeError(f"git init failed: {error_msg}")
+        ctx["git_error"] = error_msg
+        if tracker:
+            tracker.error("git", "init failed")
+
+    graph.add("git", "Initialize git repository", init_git, needs=["files", "chmod"], skip=skip)
+
+
+def scaffold_project(project_path: Path, agents: list[str], script_type: str, is_current_dir: bool = False, *, tracker: StepTracker | None = None, max_workers: int = 8, git: bool = False, git_skip: str | None = None, **options) -> dict[str, tuple[float, float]]:
+    """Download and extract the template, generate the local files and fix script permissions.
+
+    Runs the steps from add_scaffold_steps (max_workers=1 runs them one at a
+    time) and returns their timings. options are passed to add_scaffold_steps.
+    With git=True the graph also gets the ``git`` step (see add_git_step; a
+    failed ``git init`` fails the scaffold), skipped with git_skip as the reason
+    when that is set.
+    """
+    staging = _staging_dir(project_path)
+    try:
+        graph = StepGraph(tracker, max_workers=max_workers)
+        add_scaffold_steps(graph, project_path, agents, script_type, is_current_dir, staging=staging, **options)
+        if git:
+            add_git_step(graph, project_path, skip=git_skip, required=True)
+        return graph.run()
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def print_step_timings(timings: dict[str, tuple[float, float]]) -> None:
+    """Print when each step started and how long it took, slowest first."""
+    from rich.table import Table
+
+    table = Table(title="Step timings", show_header=True)
+    table.add_column("Step", style="cyan")
+    table.add_column("Start", justify="right")
+    table.add_column("Duration", justify="right")
+    for key, (start, end) in sorted(timings.items(), key=lambda item: item[1][0] - item[1][1]):
+        table.add_row(key, f"{start * 1000:.0f} ms", f"{(end - start) * 1000:.0f} ms")
+    console.print(table)
+
+
+def _emit_init_summary(project_path: Path, ok: bool, timings: dict | None = None, error: str | None = None) -> None:
+    """Close an --ndjson event stream with a summary line, like ``check --ndjson``."""
+    import json
+
+    summary = {"type": "summary", "ok": ok, "project": str(project_path)}
+    if error is not None:
+        summary["error"] = error
+    if timings:
+        summary["steps_ms"] = {key: round((end - start) * 1000, 1) for key, (start, end) in timings.items()}
+    sys.stdout.write(json.dumps(summary) + "\n")
+    sys.stdout.flush()
+
+
 def init(
     project_name: str = typer.Argument(None, help="Name for your new project directory (optional if using --here, or use '.' for current directory)"),
-    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: claude, gemini, copilot, cursor-agent, qwen, opencode, codex, windsurf, kilocode, auggie, codebuddy, or q"),
+    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: claude, gemini, copilot, cursor-agent, qwen, opencode, codex, windsurf, kilocode, auggie, codebuddy, or q (comma-separate several, e.g. claude,gemini)"),
     script_type: str = typer.Option(None, "--script", help="Script type to use: sh or ps"),
     ignore_agent_tools: bool = typer.Option(False, "--ignore-agent-tools", help="Skip checks for AI agent tools like Claude Code"),
     no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
@@ -790,6 +912,13 @@ def init(
     skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
     debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
     github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    offline: bool = typer.Option(False, "--offline", help="Use the most recent cached template without contacting GitHub"),
+    refresh_cache: bool = typer.Option(False, "--refresh-cache", help="Ignore cached templates and re-download (the cache is updated)"),
+    release_ttl: float = typer.Option(None, "--release-ttl", help="Seconds to trust cached release metadata without contacting GitHub (default 600, or BLUEPRINT_RELEASE_TTL)"),
+    timeout: float = typer.Option(None, "--timeout", help="Seconds to wait for data during the template download before retrying (default 60, or BLUEPRINT_READ_TIMEOUT)"),
+    retries: int = typer.Option(None, "--retries", help="Times to retry and resume an interrupted template download (default 5, or BLUEPRINT_DOWNLOAD_RETRIES)"),
+    connections: int = typer.Option(None, "--connections", help="Parallel connections for template archives of 2 MiB or more (default 4, or BLUEPRINT_DOWNLOAD_CONNECTIONS; 1 disables)"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON object per step change to stdout instead of the live tree (for CI logs); other output goes to stderr"),
 ):
     """
     Initialize a new Blueprint-Kit project from the latest template.
@@ -812,12 +941,23 @@ def init(
         blueprint init --here --ai claude    # Alternative syntax for current directory
         blueprint init --here --ai codex
         blueprint init --here --ai codebuddy
+        blueprint init my-project --ai claude,gemini,copilot   # Commands for several agents
         blueprint init --here
         blueprint init --here --force  # Skip confirmation when current directory not empty
+        blueprint init my-project --ai claude --offline   # Reuse a previously cached template
+        blueprint init my-project --ai claude --timeout 120 --retries 10   # Flaky network or proxy
+        blueprint init my-project --ai claude --ndjson > init-events.ndjson   # CI
     """
 
+    if ndjson:
+        # stdout carries only the event stream
+        console.file = sys.stderr
     show_banner()
 
+    if offline and refresh_cache:
+        console.print("[red]Error:[/red] --offline and --refresh-cache cannot be used together")
+        raise typer.Exit(1)
+
     if project_name == ".":
         here = True
         project_name = None  # Clear project_name to use existing validation logic
@@ -880,10 +1020,12 @@ def init(
             console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
 
     if ai_assistant:
-        if ai_assistant not in AGENT_CONFIG:
-            console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
+        try:
+            selected_ais = parse_ai_assistants(ai_assistant)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
-        selected_ai = ai_assistant
+        selected_ai = selected_ais[0]
     else:
         # Create options dict for selection (agent_key: display_name)
         ai_choices = {key: config["name"] for key, config in AGENT_CONFIG.items()}
@@ -898,14 +1040,17 @@ def init(
             console.print(f"[red]Error during AI assistant selection: {selection_error}[/red]")
             console.print("[yellow]Falling back to default AI assistant: copilot[/yellow]")
             selected_ai = "copilot"
+        selected_ais = [selected_ai]
 
     if not ignore_agent_tools:
-        agent_config = AGENT_CONFIG.get(selected_ai)
-        if agent_config and agent_config["requires_cli"]:
+        for agent_key in selected_ais:
+            agent_config = AGENT_CONFIG.get(agent_key)
+            if not (agent_config and agent_config["requires_cli"]):
+                continue
             install_url = agent_config["install_url"]
-            if not check_tool(selected_ai):
+            if not check_tool(agent_key):
                 error_panel = Panel(
-                    f"[cyan]{selected_ai}[/cyan] not found\n"
+                    f"[cyan]{agent_key}[/cyan] not found\n"
                     f"Install from: [cyan]{install_url}[/cyan]\n"
                     f"{agent_config['name']} is required to continue with this project type.\n\n"
                     "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
@@ -935,84 +1080,68 @@ def init(
         else:
             selected_script = default_script
 
-    console.print(f"[cyan]Selected AI assistant:[/cyan] {selected_ai}")
+    console.print(f"[cyan]Selected AI assistant{'s' if len(selected_ais) > 1 else ''}:[/cyan] {', '.join(selected_ais)}")
     console.print(f"[cyan]Selected script type:[/cyan] {selected_script}")
 
-    tracker = StepTracker("Initialize Blueprint-Kit Project")
+    tracker = StepTracker("Initialize Blueprint-Kit Project", events=sys.stdout if ndjson else None)
 
     sys._specify_tracker_active = True
 
     tracker.add("precheck", "Check required tools")
     tracker.complete("precheck", "ok")
     tracker.add("ai-select", "Select AI assistant")
-    tracker.complete("ai-select", f"{selected_ai}")
+    tracker.complete("ai-select", ", ".join(selected_ais))
     tracker.add("script-select", "Select script type")
     tracker.complete("script-select", selected_script)
-    for key, label in [
-        ("fetch", "Fetch latest release"),
-        ("download", "Download template"),
-        ("extract", "Extract template"),
-        ("zip-list", "Archive contents"),
-        ("extracted-summary", "Extraction summary"),
-        ("vscode-settings", "Create VS Code settings"),
-        ("chmod", "Ensure scripts executable"),
-        ("cleanup", "Cleanup"),
-        ("git", "Initialize git repository"),
-        ("final", "Finalize")
-    ]:
-        tracker.add(key, label)
-
     # Track git error message outside Live context so it persists
     git_error_message = None
+    timings = {}
+
+    import httpx
+    from contextlib import nullcontext
+    from rich.live import Live
+    from ..services.github import get_ssl_context
 
-    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
-        tracker.attach_refresh(lambda: live.update(tracker.render()))
+    # Live pulls frames from the tracker at its own rate; headless runs only emit events
+    with nullcontext() if tracker.headless else Live(tracker, console=console, refresh_per_second=8, transient=True):
+        staging = _staging_dir(project_path)
         try:
             verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
-            local_client = httpx.Client(verify=local_ssl_context)
-
-            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token)
-
-            # Generate agent-specific command files for the selected AI assistant
-            console.print(f"[cyan]Debug:[/cyan] About to generate agent commands for {selected_ai}")
-            try:
-                generate_agent_commands_in_project(project_path, selected_ai, tracker=tracker)
-                console.print(f"[green]Debug:[/green] Agent command generation completed for {selected_ai}")
-            except Exception as e:
-                print(f"ERROR in generate_agent_commands_in_project: {e}")
-                import traceback
-                traceback.print_exc()
-                raise  # Re-raise to maintain original behavior
-
-            # Create agent-specific MD file for the selected AI assistant
-            create_agent_specific_md_file(project_path, selected_ai, tracker=tracker)
-
-            # Create VS Code settings for enhanced workflow
-            create_vscode_settings(project_path, tracker=tracker)
-
-            ensure_executable_scripts(project_path, tracker=tracker)
-            console.print(f"[cyan]Debug:[/cyan] Executable scripts step completed")
-
-            if not no_git:
-                tracker.start("git")
-                if is_git_repo(project_path):
-                    tracker.complete("git", "existing repo detected")
-                elif should_init_git:
-                    success, error_msg = init_git_repo(project_path, quiet=True)
-                    if success:
-                        tracker.complete("git", "initialized")
-                    else:
-                        tracker.error("git", "init failed")
-                        git_error_message = error_msg
-                else:
-                    tracker.skip("git", "git not available")
-            else:
-                tracker.skip("git", "--no-git flag")
+            local_ssl_context = get_ssl_context() if verify else False
+            local_client = httpx.Client(verify=local_ssl_context, event_hooks=http_event_hooks())
+
+            # Steps run as soon as their inputs are ready: the generated files are
+            # rendered from the bundled templates while the archive downloads
+            graph = StepGraph(tracker)
+            add_scaffold_steps(
+                graph,
+                project_path,
+                selected_ais,
+                selected_script,
+                here,
+                staging=staging,
+                verbose=False,
+                client=local_client,
+                debug=debug,
+                github_token=github_token,
+                cache=TemplateCache(release_ttl=release_ttl),
+                offline=offline,
+                refresh_cache=refresh_cache,
+                timeout=timeout,
+                retries=retries,
+                connections=connections,
+            )
+            git_skip = "--no-git flag" if no_git else (None if should_init_git else "git not available")
+            add_git_step(graph, project_path, skip=git_skip)
+            tracker.add("final", "Finalize")
+            timings = graph.run()
+            git_error_message = graph.context.get("git_error")
 
             tracker.complete("final", "project ready")
         except Exception as e:
             tracker.error("final", str(e))
+            if tracker.headless:
+                _emit_init_summary(project_path, ok=False, error=str(e))
             console.print(Panel(f"Initialization failed: {e}", title="Failure", border_style="red"))
             if debug:
                 _env_pairs = [
@@ -1027,9 +1156,14 @@ def init(
                 shutil.rmtree(project_path)
             raise typer.Exit(1)
         finally:
-            pass
+            shutil.rmtree(staging, ignore_errors=True)
 
-    console.print(tracker.render())
+    if tracker.headless:
+        _emit_init_summary(project_path, ok=True, timings=timings)
+    else:
+        console.print(tracker.render())
+    if debug:
+        print_step_timings(timings)
     console.print("\n[bold green]Project ready.[/bold green]")
     
     # Show git error details if initialization failed
@@ -1050,12 +1184,12 @@ def init(
         console.print(git_error_panel)
 
     # Agent folder security notice
-    agent_config = AGENT_CONFIG.get(selected_ai)
-    if agent_config:
-        agent_folder = agent_config["folder"]
+    agent_folders = [AGENT_CONFIG[a]["folder"] for a in selected_ais if a in AGENT_CONFIG]
+    if agent_folders:
+        agent_folder = ", ".join(f"[cyan]{folder}[/cyan]" for folder in agent_folders)
         security_notice = Panel(
             f"Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\n"
-            f"Consider adding [cyan]{agent_folder}[/cyan] (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
+            f"Consider adding {agent_folder} (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
             title="[yellow]Agent Folder Security[/yellow]",
             border_style="yellow",
             padding=(1, 2)
@@ -1072,7 +1206,7 @@ def init(
         step_num = 2
 
     # Add Codex-specific setup step if needed
-    if selected_ai == "codex":
+    if "codex" in selected_ais:
         codex_path = project_path / ".codex"
         quoted_path = shlex.quote(str(codex_path))
         if os.name == "nt":  # Windows
@@ -0,0 +1,360 @@
+"""Batch init command implementation for the Blueprint-Kit CLI."""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+if TYPE_CHECKING:
+    import httpx
+
+from ..core.step_tracker import StepTracker
+from ..core.tracing import http_event_hooks
+from ..core.cli import SCRIPT_TYPE_CHOICES
+from ..services.cache import TemplateCache
+from ..services.git import check_tool
+from .init import (
+    console as init_console,
+    show_banner,
+    scaffold_project,
+    parse_ai_assistants,
+)
+
+
+console = Console()
+
+
+def load_manifest(manifest_path: Path) -> list[dict]:
+    """Load and validate a batch manifest.
+
+    JSON manifests are either a list of project entries or ``{"projects": [...]}``.
+    TOML manifests use ``[[project]]`` (or ``[[projects]]``) tables. Each entry has
+    ``name`` and optional ``ai`` (one agent, a comma-separated string or a list),
+    ``script``, ``here`` and ``no_git`` keys.
+
+    Raises:
+        ValueError: if the manifest cannot be parsed or an entry is invalid
+    """
+    text = manifest_path.read_text(encoding="utf-8")
+    if manifest_path.suffix.lower() == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML manifests require Python 3.11+; use a JSON manifest instead")
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid TOML manifest: {e}")
+        entries = data.get("project", data.get("projects", []))
+    else:
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON manifest: {e}")
+        entries = data.get("projects", []) if isinstance(data, dict) else data
+
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("Manifest does not contain any projects")
+
+    default_script = "ps" if os.name == "nt" else "sh"
+    projects = []
+    seen = set()
+    for i, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict) or not entry.get("name"):
+            raise ValueError(f"Project #{i} is missing a 'name'")
+        try:
+            agents = parse_ai_assistants(entry.get("ai", "copilot"))
+        except ValueError as e:
+            raise ValueError(f"Project '{entry['name']}': {e}")
+        script = entry.get("script", default_script)
+        if script not in SCRIPT_TYPE_CHOICES:
+            raise ValueError(f"Project '{entry['name']}': invalid script type '{script}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
+        path = (manifest_path.parent / entry["name"]).resolve()
+        if path in seen:
+            raise ValueError(f"Project '{entry['name']}' appears more than once")
+        seen.add(path)
+        projects.append({
+            "name": entry["name"],
+            "path": path,
+            "ai": agents[0],
+            "agents": agents,
+            "script": script,
+            "here": bool(entry.get("here", False)),
+            "no_git": bool(entry.get("no_git", False)),
+        })
+    return projects
+
+
+class _ProjectRow:
+    """Adapter that folds the per-step tracker calls of one project into a single batch row.
+
+    download_and_extract_template and friends report through the StepTracker API
+    (add/start/complete/error/skip); this keeps the shared view at one line per project.
+    """
+
+    def __init__(self, tracker: StepTracker, key: str):
+        self.tracker = tracker
+        self.key = key
+        self.errors: list[str] = []
+        self.details: dict[str, str] = {}  # Last detail reported per step (completed or skipped)
+
+    def add(self, key: str, label: str):
+        pass
+
+    def start(self, key: str, detail: str = ""):
+        if not self.errors:
+            self.tracker.start(self.key, key)
+
+    def complete(self, key: str, detail: str = ""):
+        self.details[key] = detail
+        if not self.errors:
+            self.tracker.start(self.key, key)
+
+    def skip(self, key: str, detail: str = ""):
+        self.details[key] = f"skipped ({detail})" if detail else "skipped"
+
+    def error(self, key: str, detail: str = ""):
+        self.errors.append(f"{key}: {detail}" if detail else key)
+        self.tracker.error(self.key, self.errors[0])
+
+
+def _describe_failure(e: Exception, default: str) -> str:
+    """Return a one-line reason; typer.Exit carries only an exit code."""
+    if isinstance(e, typer.Exit) or not str(e):
+        return default
+    return str(e).splitlines()[0]
+
+
+def _init_project(project: dict, row: _ProjectRow, *, client: "httpx.Client", cache: TemplateCache, git_available: bool, debug: bool, github_token: str | None, offline: bool, timeout: float | None = None, retries: int | None = None, connections: int | None = None) -> str:
+    """Scaffold a single manifest entry. Returns a short status detail; raises on failure.
+
+    Like init, a new project directory is removed again when scaffolding fails,
+    so the manifest can simply be re-run.
+    """
+    project_path = project["path"]
+    if project["here"]:
+        project_path.mkdir(parents=True, exist_ok=True)
+    elif project_path.exists():
+        raise RuntimeError(f"directory already exists: {project_path}")
+
+    try:
+        scaffold_project(
+            project_path,
+            project["agents"],
+            project["script"],
+            project["here"],
+            tracker=row,
+            git=True,
+            git_skip="no_git in manifest" if project["no_git"] else (None if git_available else "git not available"),
+            verbose=False,
+            client=client,
+            debug=debug,
+            github_token=github_token,
+            cache=cache,
+            offline=offline,
+            timeout=timeout,
+            retries=retries,
+            connections=connections,
+        )
+        if row.errors:
+            raise RuntimeError(row.errors[0])
+    except BaseException:
+        if not project["here"] and project_path.exists():
+            shutil.rmtree(project_path, ignore_errors=True)
+        raise
+    git_detail = f"git {row.details.get('git') or 'skipped'}"
+    return f"{','.join(project['agents'])}/{project['script']}, {git_detail}"
+
+
+def init_batch(
+    manifest: Path = typer.Argument(..., exists=True, dir_okay=False, help="TOML or JSON manifest listing the projects to initialize"),
+    workers: int = typer.Option(None, "--workers", "-j", help="Number of projects to scaffold concurrently (default: min(8, CPU count))"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    offline: bool = typer.Option(False, "--offline", help="Use cached templates only, without contacting GitHub"),
+    refresh_cache: bool = typer.Option(False, "--refresh-cache", help="Re-download every template once before scaffolding"),
+    timeout: float = typer.Option(None, "--timeout", help="Seconds to wait for data during a template download before retrying (default 60, or BLUEPRINT_READ_TIMEOUT)"),
+    retries: int = typer.Option(None, "--retries", help="Times to retry and resume an interrupted template download (default 5, or BLUEPRINT_DOWNLOAD_RETRIES)"),
+    connections: int = typer.Option(None, "--connections", help="Parallel connections for template archives of 2 MiB or more (default 4, or BLUEPRINT_DOWNLOAD_CONNECTIONS; 1 disables)"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON object per step change to stdout instead of the live tree (for CI logs); other output goes to stderr"),
+):
+    """
+    Initialize many Blueprint-Kit projects from a single manifest.
+
+    Each distinct (ai, script) template is downloaded once through the template
+    cache using one pooled HTTP client, then projects are scaffolded concurrently.
+
+    Example manifest (projects.toml):
+
+        [[project]]
+        name = "billing-service"
+        ai = "claude"
+        script = "sh"
+
+        [[project]]
+        name = "existing-repo"
+        ai = "gemini"
+        here = true      # merge into an existing directory
+        no_git = true
+
+    Examples:
+        blueprint init-batch projects.toml
+        blueprint init-batch projects.json --workers 16
+        blueprint init-batch projects.toml --ndjson > batch-events.ndjson   # CI
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from contextlib import nullcontext
+    import httpx
+    from rich.live import Live
+    from rich.table import Table
+    from ..services.github import download_template_from_github, get_ssl_context
+
+    if ndjson:
+        # stdout carries only the event stream
+        console.file = sys.stderr
+        init_console.file = sys.stderr
+    show_banner()
+
+    if offline and refresh_cache:
+        console.print("[red]Error:[/red] --offline and --refresh-cache cannot be used together")
+        raise typer.Exit(1)
+
+    try:
+        projects = load_manifest(manifest)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    workers = max(1, workers or min(8, os.cpu_count() or 1))
+    git_available = check_tool("git")
+    cache = TemplateCache()
+    client = httpx.Client(
+        verify=get_ssl_context() if not skip_tls else False,
+        limits=httpx.Limits(max_connections=workers, max_keepalive_connections=workers),
+        event_hooks=http_event_hooks(),
+    )
+
+    tracker = StepTracker(f"Initialize {len(projects)} Blueprint-Kit projects", events=sys.stdout if ndjson else None)
+    variants = sorted({(p["ai"], p["script"]) for p in projects})
+    for ai, script in variants:
+        tracker.add(f"template:{ai}-{script}", f"Template {ai}/{script}")
+    for project in projects:
+        tracker.add(f"project:{project['path']}", project["name"])
+
+    sys._specify_tracker_active = True
+    results: dict[Path, tuple[bool, str]] = {}
+
+    with nullcontext() if tracker.headless else Live(tracker, console=console, refresh_per_second=8, transient=True):
+        try:
+            # Phase 1: fetch each distinct asset once into the shared cache
+            template_ok = {}
+
+            def prefetch(variant):
+                ai, script = variant
+                key = f"template:{ai}-{script}"
+                tracker.start(key, "cached only" if offline else "fetching")
+                try:
+                    _, meta = download_template_from_github(
+                        ai,
+                        Path.cwd(),
+                        script_type=script,
+                        verbose=False,
+                        show_progress=False,
+                        client=client,
+                        debug=debug,
+                        github_token=github_token,
+                        cache=cache,
+                        offline=offline,
+                        refresh_cache=refresh_cache,
+                        timeout=timeout,
+                        retries=retries,
+                        connections=connections,
+                        console=console,
+                    )
+                except Exception as e:
+                    tracker.error(key, _describe_failure(e, "download failed"))
+                    return variant, False
+                tracker.complete(key, f"{meta['release']}, cache {meta['cache']}")
+                return variant, True
+
+            # Warm the release metadata cache before fanning out
+            if variants and not offline:
+                template_ok.update([prefetch(variants[0])])
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for variant, ok in pool.map(prefetch, [v for v in variants if v not in template_ok]):
+                    template_ok[variant] = ok
+
+            # Phase 2: scaffold projects concurrently (every download is now a cache hit)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {}
+                for project in projects:
+                    key = f"project:{project['path']}"
+                    if not template_ok.get((project["ai"], project["script"])):
+                        tracker.skip(key, "template unavailable")
+                        results[project["path"]] = (False, "template unavailable")
+                        continue
+                    row = _ProjectRow(tracker, key)
+                    futures[pool.submit(
+                        _init_project,
+                        project,
+                        row,
+                        client=client,
+                        cache=cache,
+                        git_available=git_available,
+                        debug=debug,
+                        github_token=github_token,
+                        offline=offline,
+                        timeout=timeout,
+                        retries=retries,
+                        connections=connections,
+                    )] = (project, key)
+                for future in as_completed(futures):
+                    project, key = futures[future]
+                    try:
+                        detail = future.result()
+                    except Exception as e:
+                        detail = _describe_failure(e, "initialization failed")
+                        tracker.error(key, detail)
+                        results[project["path"]] = (False, detail)
+                    else:
+                        tracker.complete(key, detail)
+                        results[project["path"]] = (True, detail)
+        finally:
+            client.close()
+
+    if not tracker.headless:
+        console.print(tracker.render())
+
+    failed = [p for p in projects if not results.get(p["path"], (False, ""))[0]]
+    summary = Table(title="Batch Summary", show_lines=False)
+    summary.add_column("Project", style="cyan")
+    summary.add_column("AI")
+    summary.add_column("Script")
+    summary.add_column("Result")
+    for project in projects:
+        ok, detail = results.get(project["path"], (False, "not run"))
+        summary.add_row(project["name"], ", ".join(project["agents"]), project["script"], "[green]ok[/green]" if ok else f"[red]{detail}[/red]")
+    console.print()
+    console.print(summary)
+    if tracker.headless:
+        sys.stdout.write(json.dumps({
+            "type": "summary",
+            "ok": not failed,
+            "projects": [
+                {"name": p["name"], "path": str(p["path"]), "ok": results.get(p["path"], (False, ""))[0], "detail": results.get(p["path"], (False, "not run"))[1]}
+                for p in projects
+            ],
+        }) + "\n")
+        sys.stdout.flush()
+
+    if failed:
+        console.print(Panel(f"{len(failed)} of {len(projects)} projects failed", title="[red]Batch Incomplete[/red]", border_style="red"))
+        raise typer.Exit(1)
+    console.print(f"\n[bold green]{len(projects)} projects ready.[/bold green]")
@@ -0,0 +1,84 @@
+"""Build-release command implementation for the Blueprint-Kit CLI."""
+
+import json
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+
+console = Console()
+
+
+def _split_list(value: str | None) -> list[str]:
+    """Comma/space separated values, de-duplicated in first-seen order."""
+    items: list[str] = []
+    for item in (value or "").replace(",", " ").split():
+        if item not in items:
+            items.append(item)
+    return items
+
+
+def build_release(
+    version: str = typer.Argument(..., help="Release tag with a leading 'v', e.g. v0.2.0"),
+    agents: str = typer.Option(None, "--agents", envvar="AGENTS", help="Comma or space separated agents to build (default: all)"),
+    scripts: str = typer.Option(None, "--scripts", envvar="SCRIPTS", help="Script variants to build: sh, ps (default: both)"),
+    source: Path = typer.Option(Path("."), "--source", file_okay=False, help="Repository checkout containing templates/, memory/ and scripts/"),
+    output: Path = typer.Option(Path(".genreleases"), "--output", "-o", file_okay=False, help="Directory to write the archives to"),
+    jobs: int = typer.Option(None, "--jobs", "-j", min=1, help="Worker processes (default: CPU count)"),
+    json_output: bool = typer.Option(False, "--json", help="Print the built archives and their SHA-256 hashes as JSON"),
+):
+    """
+    Build the template release archives for every agent and script variant.
+
+    Produces the same archives as create-release-packages.sh, built in
+    parallel and byte-reproducible: the same sources always give the same
+    SHA-256. Set SOURCE_DATE_EPOCH to stamp entries with a specific time.
+    Unlike the shell script it also writes the per-archive manifests that
+    `blueprint upgrade` needs, so releases must be built with this command.
+
+    Examples:
+        blueprint build-release v0.2.0
+        blueprint build-release v0.2.0 --agents claude,copilot --scripts sh
+    """
+    from ..core.agent_config import RELEASE_PACKAGE_CONFIG
+    from ..services.release import SCRIPT_VARIANTS, VERSION_RE, build_release as run_build
+
+    if not VERSION_RE.match(version):
+        console.print("[red]Error:[/red] Version must look like v0.0.0")
+        raise typer.Exit(1)
+    agent_list = _split_list(agents)
+    script_list = _split_list(scripts)
+    for kind, items, allowed in (("agent", agent_list, list(RELEASE_PACKAGE_CONFIG)), ("script", script_list, list(SCRIPT_VARIANTS))):
+        unknown = [item for item in items if item not in allowed]
+        if unknown:
+            console.print(f"[red]Error:[/red] Unknown {kind} {', '.join(unknown)} (allowed: {', '.join(allowed)})")
+            raise typer.Exit(1)
+
+    try:
+        result = run_build(source.resolve(), output, version, agents=agent_list or None, scripts=script_list or None, jobs=jobs)
+    except (OSError, UnicodeDecodeError) as e:
+        console.print(f"[red]Error:[/red] Could not build release packages: {e}")
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps(result, indent=2))
+        return
+
+    for warning in result["warnings"]:
+        console.print(f"[yellow]Warning:[/yellow] {warning}")
+
+    from rich.table import Table
+
+    table = Table(title=f"Release packages {version}")
+    table.add_column("Archive", style="cyan")
+    table.add_column("Size", justify="right")
+    table.add_column("SHA-256")
+    for archive in result["archives"]:
+        table.add_row(Path(archive["file"]).name, f"{archive['size'] / 1024:.1f} KB", archive["sha256"][:16])
+    console.print(table)
+    console.print(
+        f"[green]✓[/green] Built {len(result['archives'])} archives in {output} "
+        f"[dim]({result['templates']} templates, {result['shared_files']} shared files compressed once, "
+        f"{result['jobs']} workers, {result['elapsed_ms']:.0f} ms)[/dim]"
+    )
@@ -0,0 +1,88 @@
+"""Status command implementation for the Blueprint-Kit CLI."""
+
+import json
+
+import typer
+from rich.console import Console
+
+from ..services.features import find_project_root
+
+
+console = Console()
+
+
+def _progress(done: int, total: int, width: int = 20) -> str:
+    if not total:
+        return "[dim]no tasks[/dim]"
+    filled = round(width * done / total)
+    color = "green" if done == total else "yellow" if done else "dim"
+    return f"[{color}]{'█' * filled}[/{color}][dim]{'░' * (width - filled)}[/dim] {100 * done / total:3.0f}%"
+
+
+def status(
+    feature: list[str] = typer.Argument(None, help="Feature directory names to report on (default: all features)"),
+    json_output: bool = typer.Option(False, "--json", help="Print the report as JSON"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-read every tasks.md instead of using cached counts"),
+):
+    """
+    Show task completion per feature, user story and persona.
+
+    Counts '- [x]' and '- [ ]' tasks in each feature's tasks.md. Counts are
+    cached by file mtime and size, so only changed files are re-read.
+
+    Examples:
+        blueprint status
+        blueprint status 003-photo-albums
+        blueprint status --json
+    """
+    from ..services.status import project_status
+
+    report = project_status(find_project_root(), features=feature or None, use_cache=not no_cache)
+    if feature:
+        missing = sorted(set(feature) - {f["name"] for f in report["features"]})
+        if missing:
+            console.print(f"[red]Error:[/red] Feature not found: {', '.join(missing)}")
+            raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps(report, indent=2))
+        return
+
+    if not report["features"]:
+        console.print("[yellow]No features found.[/yellow] Create one with 'blueprint feature new'")
+        return
+
+    from rich.table import Table
+
+    totals = report["totals"]
+    table = Table(title=f"Task progress ({totals['done']}/{totals['total']} tasks across {totals['features']} features)")
+    table.add_column("Feature", style="cyan")
+    table.add_column("Tasks", justify="right")
+    table.add_column("Progress")
+    for entry in report["features"]:
+        tasks = f"{entry['done']}/{entry['total']}" if entry["tasks_file"] else "[dim]-[/dim]"
+        table.add_row(entry["name"], tasks, _progress(entry["done"], entry["total"]))
+    console.print(table)
+
+    # Story breakdown only makes sense for a handful of features
+    if feature:
+        for entry in report["features"]:
+            if not entry["stories"]:
+                continue
+            stories = Table(title=f"{entry['name']} by user story")
+            stories.add_column("Story", style="cyan")
+            stories.add_column("Tasks", justify="right")
+            stories.add_column("Progress")
+            for story in entry["stories"]:
+                label = f"US{story['number']}: {story['title']}" if story["number"] is not None else "[dim](outside user stories)[/dim]"
+                stories.add_row(label, f"{story['done']}/{story['total']}", _progress(story["done"], story["total"]))
+            console.print(stories)
+
+    if report["personas"]:
+        personas = Table(title="By persona")
+        personas.add_column("Persona", style="cyan")
+        personas.add_column("Tasks", justify="right")
+        personas.add_column("Progress")
+        for entry in report["personas"]:
+            personas.add_row(entry["persona"], f"{entry['done']}/{entry['total']}", _progress(entry["done"], entry["total"]))
+        console.print(personas)
@@ -0,0 +1,84 @@
+"""Tasks commands (plan) for the Blueprint-Kit CLI."""
+
+import json
+
+import typer
+from rich.console import Console
+
+from .analyze import resolve_feature_dir
+
+
+console = Console()
+
+tasks_app = typer.Typer(help="Work with a feature's tasks.md", add_completion=False)
+
+
+@tasks_app.command("plan")
+def plan(
+    feature: str = typer.Argument(None, help="Feature directory name (default: the active feature)"),
+    json_output: bool = typer.Option(False, "--json", help="Print the schedule as JSON"),
+    workers: int = typer.Option(None, "--workers", "-w", min=1, help="Cap each batch at this many tasks (default: unlimited)"),
+    include_done: bool = typer.Option(False, "--include-done", help="Schedule completed tasks too instead of treating them as finished"),
+):
+    """
+    Schedule tasks.md into batches of tasks that can run in parallel.
+
+    Builds a dependency graph from phase order, [P] markers, shared file paths
+    and explicit '(depends on T001)' references, then reports the batches and
+    the critical path.
+
+    Examples:
+        blueprint tasks plan
+        blueprint tasks plan 003-photo-albums --json
+        blueprint tasks plan --workers 3
+    """
+    from ..services.artifacts import iter_tasks
+    from ..services.taskgraph import TaskGraphError, plan_tasks
+
+    feature_dir = resolve_feature_dir(feature)
+    tasks_file = feature_dir / "tasks.md"
+    try:
+        with open(tasks_file, encoding="utf-8") as f:
+            tasks = list(iter_tasks(f))
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] No tasks.md in {feature_dir}. Run /tasks first")
+        raise typer.Exit(1)
+    except (OSError, UnicodeDecodeError) as e:
+        console.print(f"[red]Error:[/red] Could not read {tasks_file}: {e}")
+        raise typer.Exit(1)
+
+    try:
+        result = plan_tasks(tasks, workers=workers, include_done=include_done)
+    except TaskGraphError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps({"feature": feature_dir.name, "tasks_file": str(tasks_file), **result}, indent=2))
+        return
+
+    summary = result["summary"]
+    console.print(
+        f"[bold]Task plan:[/bold] [cyan]{feature_dir.name}[/cyan] "
+        f"[dim]({summary['scheduled']} to schedule, {summary['done']}/{summary['tasks']} done)[/dim]"
+    )
+    for warning in result["warnings"]:
+        console.print(f"[yellow]Warning:[/yellow] {warning}")
+    if not result["batches"]:
+        console.print("[green]✓[/green] Nothing left to schedule")
+        return
+
+    from rich.table import Table
+
+    by_id = {task["id"]: task for task in result["tasks"]}
+    critical = set(result["critical_path"])
+    table = Table(title=f"Batches ({summary['batches']}, up to {summary['max_parallel']} in parallel)")
+    table.add_column("Batch", justify="right")
+    table.add_column("Task", style="cyan")
+    table.add_column("Description")
+    for number, batch in enumerate(result["batches"], 1):
+        for position, task_id in enumerate(batch):
+            label = f"[bold]{task_id}[/bold] *" if task_id in critical else task_id
+            table.add_row(str(number) if position == 0 else "", label, by_id[task_id]["text"].removeprefix(task_id).strip(), end_section=position == len(batch) - 1)
+    console.print(table)
+    console.print(f"[dim]* critical path ({summary['critical_path']} tasks): {' -> '.join(result['critical_path'])}[/dim]")
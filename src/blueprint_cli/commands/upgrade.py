@@ -0,0 +1,187 @@
+"""Upgrade command implementation for the Blueprint-Kit CLI."""
+
+import json
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from ..core.tracing import http_event_hooks
+from ..core.utils import _github_auth_headers
+
+
+console = Console()
+
+_ACTION_STYLE = {"add": "green", "update": "cyan", "delete": "red", "conflict": "yellow"}
+
+
+def _detect_agent(project: Path) -> list[str]:
+    from ..core.agent_config import RELEASE_PACKAGE_CONFIG
+
+    return [
+        agent for agent, config in RELEASE_PACKAGE_CONFIG.items()
+        if any((project / config["dir"]).glob(f"blueprint.*.{config['ext']}"))
+    ]
+
+
+def _detect_script(project: Path) -> str | None:
+    scripts = project / ".blueprint" / "scripts"
+    found = [variant for variant, name in (("sh", "bash"), ("ps", "powershell")) if (scripts / name).is_dir()]
+    return found[0] if len(found) == 1 else None
+
+
+def _fetch_manifest(client, release_data: dict, agent: str, script: str, headers: dict | None) -> dict:
+    from ..services.release import MANIFEST_VERSION, manifest_name
+
+    name = manifest_name(agent, script, release_data["tag_name"])
+    asset = next((a for a in release_data.get("assets", []) if a.get("name") == name), None)
+    if asset is None:
+        raise RuntimeError(f"Release {release_data['tag_name']} has no {name}; upgrade with 'blueprint init --here --force' instead")
+    response = client.get(asset["browser_download_url"], headers=headers, follow_redirects=True, timeout=30)
+    if response.status_code != 200:
+        raise RuntimeError(f"Manifest download failed with {response.status_code}")
+    manifest = response.json()
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise RuntimeError(f"Unsupported manifest version {manifest.get('version')} in {name}")
+    return manifest
+
+
+def upgrade(
+    to: str = typer.Option(None, "--to", help="Release tag to upgrade to (default: latest)"),
+    ai_assistant: str = typer.Option(None, "--ai", help="Agent the project was initialised for (default: from .blueprint/release.json or detected)"),
+    script_type: str = typer.Option(None, "--script", help="Script variant: sh or ps (default: from .blueprint/release.json or detected)"),
+    from_release: str = typer.Option(None, "--from", help="Release the project was initialised from, for projects without .blueprint/release.json"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would change without downloading or writing anything"),
+    force: bool = typer.Option(False, "--force", help="Overwrite or delete locally modified files instead of flagging them"),
+    json_output: bool = typer.Option(False, "--json", help="Print the upgrade plan and result as JSON"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+):
+    """
+    Upgrade the project's template files to a newer release.
+
+    Compares the installed release recorded in .blueprint/release.json with
+    the target release's file manifest and downloads only the files that
+    changed, using ranged requests against the release archive. Files you
+    edited since install are flagged and left alone unless --force is given.
+
+    Only one agent's files are upgraded: the first one given to `init --ai`
+    (recorded as "agent" in release.json, whose archive the baseline comes
+    from). Command files for the other recorded agents are left as they are;
+    regenerate them with `blueprint init --here --ai <all agents, that one first>`.
+
+    Examples:
+        blueprint upgrade --dry-run
+        blueprint upgrade
+        blueprint upgrade --to v1.2.0 --json
+        blueprint upgrade --ai claude --script sh --from v1.0.0   # project without a release record
+    """
+    import httpx
+    from ..services.cache import TemplateCache
+    from ..services.features import find_project_root
+    from ..services.github import fetch_release_metadata, get_ssl_context, release_api_url
+    from ..services.release import archive_name
+    from ..services.upgrade import apply_plan, fetch_members, load_record, plan_upgrade, read_members_from_zip, record_hashes, write_record
+
+    project = find_project_root()
+    record = load_record(project)
+    agent = ai_assistant or (record or {}).get("agent")
+    if not agent:
+        detected = _detect_agent(project)
+        if len(detected) != 1:
+            console.print("[red]Error:[/red] Cannot tell which agent this project uses. Pass --ai")
+            raise typer.Exit(1)
+        agent = detected[0]
+    script = script_type or (record or {}).get("script") or _detect_script(project)
+    if script not in ("sh", "ps"):
+        console.print("[red]Error:[/red] Cannot tell which script variant this project uses. Pass --script sh or --script ps")
+        raise typer.Exit(1)
+
+    headers = _github_auth_headers(github_token)
+    cache = TemplateCache()
+    client = httpx.Client(verify=get_ssl_context() if not skip_tls else False, event_hooks=http_event_hooks())
+    try:
+        release_data, _ = fetch_release_metadata(release_api_url(to), client=client, cache=cache, github_token=github_token)
+        tag = release_data["tag_name"]
+        target_archive = _fetch_manifest(client, release_data, agent, script, headers)
+        target = target_archive["files"]
+
+        if record:
+            baseline = record["files"]
+            installed = record["release"]
+        elif from_release:
+            old_data, _ = fetch_release_metadata(release_api_url(from_release), client=client, cache=cache, github_token=github_token)
+            old_manifest = _fetch_manifest(client, old_data, agent, script, headers)
+            baseline = {path: meta["sha256"] for path, meta in old_manifest["files"].items()}
+            installed = from_release
+        else:
+            baseline, installed = {}, None
+
+        plan = plan_upgrade(project, baseline, target, force=force)
+        changes = [item for item in plan if item["action"] in ("add", "update", "delete")]
+        conflicts = [item for item in plan if item["action"] == "conflict"]
+        fetch = [{"name": item["path"], **target[item["path"]]} for item in changes if item["action"] != "delete"]
+
+        transfer = {"mode": None, "requests": 0, "bytes": 0}
+        if not dry_run:
+            cached = cache.lookup(tag, target_archive["archive"], sha256=target_archive["sha256"], size=target_archive["size"])
+            if not fetch:
+                contents = {}
+            elif cached is not None:
+                contents = read_members_from_zip(cached, fetch)
+                transfer["mode"] = "cache"
+            else:
+                asset = next((a for a in release_data.get("assets", []) if a.get("name") == archive_name(agent, script, tag)), None)
+                if asset is None:
+                    raise RuntimeError(f"Release {tag} has no {archive_name(agent, script, tag)}")
+                contents, transfer = fetch_members(client, asset["browser_download_url"], fetch, target_archive["size"], headers)
+            apply_plan(project, plan, contents, target)
+            write_record(project, tag, agent, script, record_hashes(plan, baseline, target), agents=(record or {}).get("agents"))
+    except (httpx.HTTPError, RuntimeError, ValueError, OSError) as e:
+        console.print(f"[red]Error:[/red] Upgrade failed: {e}")
+        raise typer.Exit(1)
+    finally:
+        client.close()
+
+    not_upgraded = [a for a in (record or {}).get("agents", []) if a != agent]
+    result = {
+        "from": installed,
+        "to": tag,
+        "agent": agent,
+        "not_upgraded": not_upgraded,
+        "script": script,
+        "dry_run": dry_run,
+        "changes": changes,
+        "conflicts": conflicts,
+        "unchanged": len(plan) - len(changes) - len(conflicts),
+        "transfer": transfer,
+        "archive_size": target_archive["size"],
+    }
+    if json_output:
+        print(json.dumps(result, indent=2))
+        return
+
+    console.print(f"[bold]Upgrade:[/bold] {installed or '[dim]unknown release[/dim]'} → [cyan]{tag}[/cyan] ({agent}, {script})")
+    if not_upgraded:
+        console.print(f"[yellow]Note:[/yellow] only {agent}'s files are upgraded; command files for {', '.join(not_upgraded)} are unchanged (regenerate with [cyan]blueprint init --here --ai {','.join([agent, *not_upgraded])}[/cyan])")
+    if changes or conflicts:
+        from rich.table import Table
+
+        table = Table(show_header=True)
+        table.add_column("Action")
+        table.add_column("File", style="cyan")
+        table.add_column("Reason", style="dim")
+        for item in changes + conflicts:
+            style = _ACTION_STYLE[item["action"]]
+            table.add_row(f"[{style}]{item['action']}[/{style}]", item["path"], item["reason"] or "")
+        console.print(table)
+    if dry_run:
+        console.print(f"[dim]Dry run: {len(changes)} changes, {len(conflicts)} conflicts, {result['unchanged']} files unchanged[/dim]")
+        return
+    downloaded = "no download needed" if not transfer["mode"] else (
+        "read from the template cache" if transfer["mode"] == "cache"
+        else f"{transfer['bytes']:,} of {target_archive['size']:,} archive bytes in {transfer['requests']} {transfer['mode']} request(s)"
+    )
+    console.print(f"[green]✓[/green] Applied {len(changes)} changes, {result['unchanged']} files unchanged [dim]({downloaded})[/dim]")
+    if conflicts:
+        console.print(f"[yellow]{len(conflicts)} locally modified files were left as they are.[/yellow] Review them, or re-run with --force to take the release versions")
@@ -0,0 +1,150 @@
+"""Dependency-aware step scheduling on top of StepTracker."""
+
+import time
+from typing import Any, Callable, Iterable
+
+from .step_tracker import StepTracker
+from .tracing import span
+
+
+class StepGraphError(ValueError):
+    """The declared steps cannot be scheduled (unknown input or a cycle)."""
+
+
+class StepGraph:
+    """Run steps on a thread pool as soon as the inputs they declare are available.
+
+    Each step names the resources it ``needs`` and ``provides``; a step also
+    provides its own key, so ``needs`` may name another step directly. Step
+    functions take the shared context dict, read their inputs from it and store
+    their outputs in it. A function returns a detail string to have the step
+    marked done, or None when it reports its own status through the tracker (as
+    the existing init helpers do).
+
+    Steps added with ``skip`` are marked skipped and count as finished for their
+    dependents. When a step raises, nothing new is started, the steps still
+    running are allowed to finish, the ones that never ran are marked skipped,
+    and the first exception is re-raised from run().
+    """
+
+    def __init__(self, tracker: StepTracker | None = None, max_workers: int = 8):
+        self.tracker = tracker
+        self.max_workers = max_workers
+        self.steps: dict[str, dict] = {}
+        self.context: dict[str, Any] = {}
+        # key -> (start, end) in seconds from the start of run()
+        self.timings: dict[str, tuple[float, float]] = {}
+
+    def add(
+        self,
+        key: str,
+        label: str | None,
+        fn: Callable[[dict], str | None] | None = None,
+        *,
+        needs: Iterable[str] = (),
+        provides: Iterable[str] = (),
+        skip: str | None = None,
+    ) -> None:
+        """Declare a step. A None label keeps it out of the tracker (internal steps)."""
+        if key in self.steps:
+            raise StepGraphError(f"Duplicate step '{key}'")
+        self.steps[key] = {
+            "key": key,
+            "label": label,
+            "fn": fn,
+            "needs": tuple(needs),
+            "provides": (key, *provides),
+            "skip": skip,
+        }
+        if self.tracker and label:
+            self.tracker.add(key, label)
+
+    def _dependencies(self) -> dict[str, set[str]]:
+        producers = {}
+        for step in self.steps.values():
+            for resource in step["provides"]:
+                producers[resource] = step["key"]
+        deps = {}
+        for step in self.steps.values():
+            missing = [r for r in step["needs"] if r not in producers]
+            if missing:
+                raise StepGraphError(f"Step '{step['key']}' needs {', '.join(missing)}, which no step provides")
+            deps[step["key"]] = {producers[r] for r in step["needs"]} - {step["key"]}
+
+        # Kahn's algorithm, only to reject cycles before anything runs
+        remaining = {key: set(d) for key, d in deps.items()}
+        ready = [key for key, d in remaining.items() if not d]
+        seen = 0
+        while ready:
+            done = ready.pop()
+            seen += 1
+            for key, d in remaining.items():
+                if done in d:
+                    d.discard(done)
+                    if not d:
+                        ready.append(key)
+        if seen != len(deps):
+            cycle = sorted(key for key, d in remaining.items() if d)
+            raise StepGraphError(f"Dependency cycle between steps: {', '.join(cycle)}")
+        return deps
+
+    def _report(self, method: str, key: str, detail: str = "") -> None:
+        if self.tracker and self.steps[key]["label"]:
+            getattr(self.tracker, method)(key, detail)
+
+    def _run_step(self, key: str, origin: float) -> str | None:
+        step = self.steps[key]
+        self._report("start", key)
+        start = time.perf_counter()
+        try:
+            with span(key, "step"):
+                return step["fn"](self.context) if step["fn"] else ""
+        finally:
+            self.timings[key] = (start - origin, time.perf_counter() - origin)
+
+    def run(self) -> dict[str, tuple[float, float]]:
+        """Run every step and return the per-step timings."""
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        deps = self._dependencies()
+        finished: set[str] = set()
+        pending = dict(deps)
+        origin = time.perf_counter()
+        error: BaseException | None = None
+        failed = None
+
+        for key, step in self.steps.items():
+            if step["skip"] is not None:
+                self._report("skip", key, step["skip"])
+                finished.add(key)
+                del pending[key]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+            while pending or running:
+                if error is None:
+                    for key in [k for k, d in pending.items() if d <= finished]:
+                        del pending[key]
+                        running[pool.submit(self._run_step, key, origin)] = key
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    try:
+                        detail = future.result()
+                    except Exception as e:
+                        if error is None:
+                            error, failed = e, key
+                        # Without a message, keep the detail the step reported itself
+                        self._report("error", key, str(e).splitlines()[0] if str(e) else "")
+                        continue
+                    if detail is not None:
+                        self._report("complete", key, detail)
+                    finished.add(key)
+
+        if error is not None:
+            for key in pending:
+                self._report("skip", key, f"not run: {failed} failed")
+            raise error
+        return self.timings
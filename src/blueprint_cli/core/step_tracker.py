@@ -1,25 +1,60 @@
 """Step tracking functionality for CLI operations."""
 
+import json
+import threading
+import time
+from typing import TextIO
+
 from rich.tree import Tree
 
 
 class StepTracker:
     """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
-    Supports live auto-refresh via an attached refresh callback.
+
+    Steps are indexed by key, so updates are O(1) however many steps there are.
+    Rendering is incremental: render() keeps one Tree and only rewrites the
+    nodes of steps changed since the previous frame. The tracker is itself a
+    Rich renderable, so ``Live(tracker, refresh_per_second=8)`` pulls at most 8
+    frames a second no matter how often steps change; an attached refresh
+    callback is rate-limited the same way (call flush() after the last update).
+
+    With ``events`` set the tracker is headless: every change is written to
+    that stream as one NDJSON object and nothing needs to be rendered (for CI logs).
     """
-    def __init__(self, title: str):
+
+    def __init__(self, title: str, *, events: TextIO | None = None, max_fps: float = 8):
         self.title = title
-        self.steps = []  # list of dicts: {key, label, status, detail}
         self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
+        self._steps: dict[str, dict] = {}  # key -> {key, label, status, detail}, in insertion order
         self._refresh_cb = None  # callable to trigger UI refresh
+        self._lock = threading.RLock()  # steps may be updated from worker threads (init-batch)
+        self._min_interval = 1 / max_fps
+        self._last_refresh = 0.0
+        self._tree: Tree | None = None
+        self._nodes: dict[str, Tree] = {}
+        self._new: list[str] = []  # keys added since the last render
+        self._dirty: set[str] = set()  # keys changed since the last render
+        self._events = events
+        self._started = time.perf_counter()
+
+    @property
+    def headless(self) -> bool:
+        return self._events is not None
+
+    @property
+    def steps(self) -> list[dict]:
+        """Snapshot of the steps in insertion order."""
+        with self._lock:
+            return [dict(s) for s in self._steps.values()]
 
     def attach_refresh(self, cb):
         self._refresh_cb = cb
 
     def add(self, key: str, label: str):
-        if key not in [s["key"] for s in self.steps]:
-            self.steps.append({"key": key, "label": label, "status": "pending", "detail": ""})
-            self._maybe_refresh()
+        with self._lock:
+            if key not in self._steps:
+                self._steps[key] = {"key": key, "label": label, "status": "pending", "detail": ""}
+                self._changed(key, new=True)
 
     def start(self, key: str, detail: str = ""):
         self._update(key, status="running", detail=detail)
@@ -34,56 +69,94 @@ class StepTracker:
         self._update(key, status="skipped", detail=detail)
 
     def _update(self, key: str, status: str, detail: str):
-        for s in self.steps:
-            if s["key"] == key:
-                s["status"] = status
-                if detail:
-                    s["detail"] = detail
-                self._maybe_refresh()
+        with self._lock:
+            step = self._steps.get(key)
+            if step is None:
+                self._steps[key] = {"key": key, "label": key, "status": status, "detail": detail}
+                self._changed(key, new=True)
                 return
-
-        self.steps.append({"key": key, "label": key, "status": status, "detail": detail})
+            step["status"] = status
+            if detail:
+                step["detail"] = detail
+            self._changed(key)
+
+    def _changed(self, key: str, new: bool = False):
+        if self._events is not None:
+            step = self._steps[key]
+            self._events.write(json.dumps({
+                "type": "step",
+                "key": key,
+                "label": step["label"],
+                "status": step["status"],
+                "detail": step["detail"],
+                "elapsed_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            }) + "\n")
+            self._events.flush()
+            return
+        if new:
+            self._new.append(key)
+        else:
+            self._dirty.add(key)
         self._maybe_refresh()
 
-    def _maybe_refresh(self):
-        if self._refresh_cb:
-            try:
-                self._refresh_cb()
-            except Exception:
-                pass
+    def _maybe_refresh(self, force: bool = False):
+        if not self._refresh_cb:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_refresh < self._min_interval:
+            return
+        self._last_refresh = now
+        try:
+            self._refresh_cb()
+        except Exception:
+            pass
+
+    def flush(self):
+        """Deliver a refresh held back by the rate limit."""
+        with self._lock:
+            if self._new or self._dirty:
+                self._maybe_refresh(force=True)
+
+    @staticmethod
+    def _line(step: dict) -> str:
+        label = step["label"]
+        detail_text = step["detail"].strip() if step["detail"] else ""
+
+        status = step["status"]
+        if status == "done":
+            symbol = "[green]+[/green]"
+        elif status == "pending":
+            symbol = "[green dim]-[/green dim]"
+        elif status == "running":
+            symbol = "[cyan]-[/cyan]"
+        elif status == "error":
+            symbol = "[red]X[/red]"
+        elif status == "skipped":
+            symbol = "[yellow]-[/yellow]"
+        else:
+            symbol = " "
+
+        if status == "pending":
+            # Entire line light gray (pending)
+            if detail_text:
+                return f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
+            return f"{symbol} [bright_black]{label}[/bright_black]"
+        # Label white, detail (if any) light gray in parentheses
+        if detail_text:
+            return f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
+        return f"{symbol} [white]{label}[/white]"
 
     def render(self):
-        tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
-        for step in self.steps:
-            label = step["label"]
-            detail_text = step["detail"].strip() if step["detail"] else ""
-
-            status = step["status"]
-            if status == "done":
-                symbol = "[green]+[/green]"
-            elif status == "pending":
-                symbol = "[green dim]-[/green dim]"
-            elif status == "running":
-                symbol = "[cyan]-[/cyan]"
-            elif status == "error":
-                symbol = "[red]X[/red]"
-            elif status == "skipped":
-                symbol = "[yellow]-[/yellow]"
-            else:
-                symbol = " "
-
-            if status == "pending":
-                # Entire line light gray (pending)
-                if detail_text:
-                    line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [bright_black]{label}[/bright_black]"
-            else:
-                # Label white, detail (if any) light gray in parentheses
-                if detail_text:
-                    line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [white]{label}[/white]"
-
-            tree.add(line)
-        return tree
\ No newline at end of file
+        with self._lock:
+            if self._tree is None:
+                self._tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
+            for key in self._new:
+                self._nodes[key] = self._tree.add(self._line(self._steps[key]))
+            for key in self._dirty.difference(self._new):
+                self._nodes[key].label = self._line(self._steps[key])
+            self._new.clear()
+            self._dirty.clear()
+            return self._tree
+
+    def __rich__(self):
+        return self.render()
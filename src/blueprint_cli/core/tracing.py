@@ -0,0 +1,230 @@
+"""Lightweight tracing for profiling CLI operations.
+
+Code marks interesting work with ``span(name, category, **args)``. While no
+tracer is active (the normal case) a span costs one global lookup. With
+``blueprint --profile`` or ``--trace PATH`` a Tracer collects every span, which
+can be exported as Chrome Trace Event JSON (open it in chrome://tracing or
+https://ui.perfetto.dev) or summarised per category so a slow run can be
+attributed to network, disk, rendering or git.
+
+Categories used by the CLI:
+
+- ``network``: one span per HTTP request/response (see http_event_hooks)
+- ``disk``: archive extraction and merging files into the project
+- ``render``: command and agent file rendering, per agent
+- ``git``/``process``: each subprocess call
+- ``step``: init steps scheduled by StepGraph (they contain the spans above)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator
+
+
+class Tracer:
+    """Collect completed spans from any thread."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans: list[dict] = []
+        self._lock = threading.Lock()
+        self._threads: dict[int, tuple[int, str]] = {}  # thread ident -> (tid, thread name)
+
+    def _tid(self) -> int:
+        ident = threading.get_ident()
+        with self._lock:
+            if ident not in self._threads:
+                self._threads[ident] = (len(self._threads) + 1, threading.current_thread().name)
+            return self._threads[ident][0]
+
+    def record(self, name: str, category: str, start: float, end: float, args: dict | None = None, tid: int | None = None) -> None:
+        """Add a finished span; start and end are time.perf_counter() values."""
+        span = {
+            "name": name,
+            "cat": category,
+            "start": start - self.origin,
+            "end": end - self.origin,
+            "tid": tid if tid is not None else self._tid(),
+            "args": args or {},
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.origin
+
+    def chrome_trace(self) -> dict:
+        """Spans as Chrome Trace Event JSON ("X" complete events, microseconds)."""
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            for tid, name in self._threads.values()
+        ]
+        for span in sorted(self.spans, key=lambda s: s["start"]):
+            events.append({
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6, 1),
+                "dur": round((span["end"] - span["start"]) * 1e6, 1),
+                "pid": 1,
+                "tid": span["tid"],
+                "args": span["args"],
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def summary(self) -> list[dict]:
+        """Per (category, name) rows with calls, total/max ms and bytes, slowest category first."""
+        rows: dict[tuple[str, str], dict] = {}
+        for span in self.spans:
+            row = rows.setdefault((span["cat"], span["name"]), {
+                "category": span["cat"], "name": span["name"], "calls": 0, "total_ms": 0.0, "max_ms": 0.0, "bytes": 0,
+            })
+            duration = (span["end"] - span["start"]) * 1000
+            row["calls"] += 1
+            row["total_ms"] += duration
+            row["max_ms"] = max(row["max_ms"], duration)
+            row["bytes"] += span["args"].get("bytes") or 0
+        totals: dict[str, float] = {}
+        for row in rows.values():
+            totals[row["category"]] = totals.get(row["category"], 0.0) + row["total_ms"]
+        # Steps contain the other spans, so they go last instead of topping the table
+        return sorted(rows.values(), key=lambda r: (r["category"] == "step", -totals[r["category"]], r["category"], -r["total_ms"]))
+
+
+_active: Tracer | None = None
+
+
+def start_tracing() -> Tracer:
+    """Install a fresh process-wide tracer and return it."""
+    global _active
+    _active = Tracer()
+    return _active
+
+
+def stop_tracing() -> Tracer | None:
+    """Uninstall the active tracer and return it."""
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def active_tracer() -> Tracer | None:
+    return _active
+
+
+@contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[dict]:
+    """Time the enclosed block. Yields the args dict so results can be added to it."""
+    tracer = _active
+    if tracer is None:
+        yield args
+        return
+    start = time.perf_counter()
+    try:
+        yield args
+    except BaseException as e:
+        args["error"] = type(e).__name__
+        raise
+    finally:
+        tracer.record(name, category, start, time.perf_counter(), args)
+
+
+@lru_cache(maxsize=1)
+def _counting_stream_class():
+    # Defined on first use so importing this module does not import httpx
+    import httpx
+
+    class CountingStream(httpx.SyncByteStream):
+        """Wrap a response stream to count body bytes and end the span on close."""
+
+        def __init__(self, stream, on_close):
+            self._stream = stream
+            self._on_close = on_close
+            self.bytes = 0
+
+        def __iter__(self):
+            for chunk in self._stream:
+                self.bytes += len(chunk)
+                yield chunk
+
+        def close(self):
+            try:
+                self._stream.close()
+            finally:
+                if self._on_close is not None:
+                    self._on_close(self.bytes)
+                    self._on_close = None
+
+    return CountingStream
+
+
+def _on_request(request) -> None:
+    tracer = _active
+    if tracer is not None:
+        request.extensions["blueprint_trace"] = (time.perf_counter(), tracer._tid())
+
+
+def _on_response(response) -> None:
+    tracer = _active
+    started = response.request.extensions.get("blueprint_trace")
+    if tracer is None or started is None:
+        return
+    start, tid = started
+    headers_at = time.perf_counter()
+    request = response.request
+    args = {
+        "url": str(request.url),
+        "status": response.status_code,
+        "ttfb_ms": round((headers_at - start) * 1000, 3),
+    }
+    if "range" in request.headers:
+        args["range"] = request.headers["range"]
+
+    def finish(count: int) -> None:
+        args["bytes"] = count
+        tracer.record(f"{request.method} {request.url.host}", "network", start, time.perf_counter(), args, tid=tid)
+
+    response.stream = _counting_stream_class()(response.stream, finish)
+
+
+def http_event_hooks() -> dict:
+    """httpx ``event_hooks`` that trace every request while a tracer is active.
+
+    Each request becomes one ``network`` span lasting until its body is closed,
+    with the status, time to response headers and body bytes. Returns no hooks
+    when tracing is off, so untraced clients pay nothing.
+    """
+    if _active is None:
+        return {}
+    return {"request": [_on_request], "response": [_on_response]}
+
+
+def summary_table(tracer: Tracer):
+    """Rich Table of Tracer.summary() with a total per category."""
+    from rich.table import Table
+
+    table = Table(title="Profile", caption=f"Wall time {tracer.elapsed() * 1000:.0f} ms. Spans that run concurrently or nest overlap, so totals can exceed it.")
+    table.add_column("Category", style="cyan")
+    table.add_column("Span")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column("Bytes", justify="right")
+    by_category: dict[str, list[dict]] = {}
+    for row in tracer.summary():
+        by_category.setdefault(row["category"], []).append(row)
+    for category, rows in by_category.items():
+        total_bytes = sum(r["bytes"] for r in rows)
+        table.add_row(
+            f"[bold]{category}[/bold]",
+            "[bold]all[/bold]",
+            str(sum(r["calls"] for r in rows)),
+            f"[bold]{sum(r['total_ms'] for r in rows):.1f} ms[/bold]",
+            "",
+            f"{total_bytes:,}" if total_bytes else "",
+        )
+        for row in rows:
+            table.add_row("", row["name"], str(row["calls"]), f"{row['total_ms']:.1f} ms", f"{row['max_ms']:.1f} ms", f"{row['bytes']:,}" if row["bytes"] else "")
+    return table
@@ -1,6 +1,7 @@
 """General utility functions for the Blueprint-Kit CLI."""
 
 import os
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -15,6 +16,53 @@ def _github_auth_headers(cli_token: str | None = None) -> dict:
     return {"Authorization": f"Bearer {token}"} if token else None
 
 
+def write_text_if_changed(path: Path, content: str, encoding: str = "utf-8") -> bool:
+    """Write content to path only when it differs from what is already there.
+
+    Leaves mtimes of unchanged files alone so re-running init doesn't invalidate
+    downstream build/IDE caches. Returns True if the file was written.
+    """
+    try:
+        if path.read_text(encoding=encoding) == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(content, encoding=encoding)
+    return True
+
+
+@contextmanager
+def file_lock(lock_path: Path):
+    """Hold an exclusive advisory lock on lock_path for the duration of the block.
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows; blocks until the lock
+    is available so concurrent CLI processes serialise on it.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10s; keep waiting
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def is_git_repo(path: Path = None) -> bool:
     """Check if the specified path is inside a git repository."""
     if path is None:
@@ -24,14 +72,16 @@ def is_git_repo(path: Path = None) -> bool:
         return False
 
     import subprocess
+    from .tracing import span
     try:
         # Use git command to check if inside a work tree
-        subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            check=True,
-            capture_output=True,
-            cwd=path,
-        )
+        with span("git rev-parse", "git", cwd=str(path)):
+            subprocess.run(
+                ["git", "rev-parse", "--is-inside-work-tree"],
+                check=True,
+                capture_output=True,
+                cwd=path,
+            )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""Deterministic cross-artifact analysis for the Blueprint-Kit CLI.
+
+Computes requirement -> goal -> task coverage, dangling references and likely
+contradictions from the structured artifacts produced by
+``services/artifacts.py``, replacing the manual cross-check the ``/analyze``
+command used to ask the agent for.
+
+Parse results are cached per file in the user cache directory. A file whose
+mtime and size are unchanged is not read at all; one that changed is hashed
+and only re-parsed when its content differs, so re-analysing after a single
+edit only reprocesses the touched artifact.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+from .artifacts import ARTIFACT_FILES, ID_PATTERNS, PARSER_VERSION, parse_artifact_document
+from .cache import FileStatCache, default_cache_dir
+from .search import tokenize
+
+
+REPORT_VERSION = 1
+
+# Two texts are related when they share at least this many content tokens and
+# the overlap is at least this fraction of the shorter text's token set
+MIN_SHARED_TOKENS = 2
+MIN_OVERLAP = 0.3
+# Negated requirement pairs need a stronger overlap before they are flagged
+MIN_CONTRADICTION_OVERLAP = 0.5
+
+_NEGATION_RE = re.compile(r'\b(must not|shall not|should not|cannot|can not|never|no longer|not allowed|prohibited)\b', re.IGNORECASE)
+
+# Technologies grouped by the slot they fill; two artifacts naming different
+# members of the same group (and not each other's) are flagged
+TECHNOLOGY_GROUPS = {
+    "database": ["postgresql", "postgres", "mysql", "mariadb", "sqlite", "mongodb", "dynamodb", "cassandra", "cockroachdb", "firestore", "sql server", "oracle"],
+    "language": ["python", "typescript", "javascript", "go", "golang", "rust", "java", "kotlin", "c#", "ruby", "php", "swift", "elixir"],
+    "frontend": ["react", "vue", "angular", "svelte", "solid", "ember"],
+    "messaging": ["kafka", "rabbitmq", "sqs", "nats", "pubsub", "kinesis"],
+    "api": ["rest", "graphql", "grpc"],
+}
+_TECH_ALIASES = {"postgres": "postgresql", "golang": "go"}
+
+
+def _tokens(text: str) -> set[str]:
+    # IDs are matched explicitly; they must not count as shared vocabulary
+    for pattern in ID_PATTERNS.values():
+        text = pattern.sub(" ", text)
+    return set(tokenize(text))
+
+
+def related(a: str, b: str, min_overlap: float = MIN_OVERLAP) -> bool:
+    """Cheap deterministic relatedness test between two short texts."""
+    ta, tb = _tokens(a), _tokens(b)
+    if not ta or not tb:
+        return False
+    shared = len(ta & tb)
+    return shared >= MIN_SHARED_TOKENS and shared / min(len(ta), len(tb)) >= min_overlap
+
+
+def _technologies(text: str) -> dict[str, set[str]]:
+    lowered = f" {text.lower()} "
+    found: dict[str, set[str]] = {}
+    for group, names in TECHNOLOGY_GROUPS.items():
+        for name in names:
+            if re.search(rf'(?<![\w#]){re.escape(name)}(?![\w#])', lowered):
+                found.setdefault(group, set()).add(_TECH_ALIASES.get(name, name))
+    return found
+
+
+class ParseCache(FileStatCache):
+    """Per-feature cache of parsed artifacts keyed on (mtime, size) then content hash."""
+
+    def __init__(self, feature_dir: Path, root: Path | None = None, enabled: bool = True):
+        super().__init__(feature_dir, root or default_cache_dir() / "analysis", PARSER_VERSION, enabled)
+        self.feature_dir = feature_dir
+        self.stats = {"reused": 0, "rehashed": 0, "parsed": 0}
+
+    def get(self, kind: str, path: Path) -> dict | None:
+        """Parsed document for path (None if the file is missing)."""
+        st = self.stat(kind, path)
+        if st is None:
+            return None
+        entry = self.fresh(kind, st)
+        if entry:
+            self.stats["reused"] += 1
+            return entry["doc"]
+
+        entry = self.entries.get(kind)
+        data = path.read_bytes()
+        sha = hashlib.sha256(data).hexdigest()
+        if entry and entry["sha256"] == sha:
+            self.stats["rehashed"] += 1
+            doc = entry["doc"]
+        else:
+            self.stats["parsed"] += 1
+            doc = parse_artifact_document(kind, data.decode("utf-8", errors="replace"))
+        doc["sha256"] = sha
+        self.put(kind, st, sha256=sha, doc=doc)
+        return doc
+
+
+def _finding(findings: list, severity: str, code: str, message: str, artifact: str | None = None, line: int | None = None, **extra) -> None:
+    findings.append({"severity": severity, "code": code, "message": message, "artifact": artifact, "line": line, **extra})
+
+
+def analyze_feature(feature_dir: Path, *, use_cache: bool = True) -> dict:
+    """Analyse one feature directory and return a JSON-serialisable report.
+
+    Report keys: ``feature``, ``artifacts`` (per-kind presence, path, hash,
+    missing sections and placeholder count), ``coverage`` (per requirement and
+    goal links plus a summary), ``findings`` (severity/code/message/location,
+    sorted by severity) and ``cache`` (how many artifacts were reused, rehashed
+    or parsed).
+    """
+    cache = ParseCache(feature_dir, enabled=use_cache)
+    docs: dict[str, dict | None] = {kind: cache.get(kind, feature_dir / name) for kind, name in ARTIFACT_FILES.items()}
+    cache.save()
+
+    findings: list[dict] = []
+    artifacts = {}
+    for kind, name in ARTIFACT_FILES.items():
+        doc = docs[kind]
+        artifacts[kind] = {
+            "present": doc is not None,
+            "path": str(feature_dir / name),
+            "sha256": doc["sha256"] if doc else None,
+            "title": doc["title"] if doc else None,
+            "missing_sections": doc["missing_sections"] if doc else [],
+            "placeholders": doc["placeholders"] if doc else 0,
+        }
+        if doc is None:
+            _finding(findings, "error" if kind in ("spec", "goals", "blueprint") else "warning", "missing-artifact", f"{name} does not exist", kind)
+            continue
+        for section in doc["missing_sections"]:
+            _finding(findings, "warning", "missing-section", f"{name} has no '{section}' section", kind)
+        if doc["placeholders"]:
+            _finding(findings, "info", "unfilled-placeholders", f"{name} still has {doc['placeholders']} template placeholders", kind)
+
+    spec, goals_doc, blueprint, plan, tasks_doc = (docs[k] for k in ARTIFACT_FILES)
+    requirements = spec["requirements"] if spec else []
+    goals = goals_doc["goals"] if goals_doc else []
+    tasks = tasks_doc["tasks"] if tasks_doc else []
+
+    # Coverage: explicit ID references win, otherwise fall back to token overlap
+    def linked(source: dict, targets: list[dict]) -> list[str]:
+        hits = []
+        for target in targets:
+            if (not source.get("implicit") and source["id"] in target["text"]) or related(source["text"], target["text"]):
+                hits.append(target["id"])
+        return hits
+
+    requirement_coverage = []
+    for requirement in requirements:
+        entry = {
+            "id": requirement["id"],
+            "text": requirement["text"],
+            "goals": linked(requirement, goals),
+            "tasks": linked(requirement, tasks),
+        }
+        requirement_coverage.append(entry)
+        if goals_doc and not entry["goals"]:
+            _finding(findings, "warning", "requirement-without-goal", f"Requirement {requirement['id']} has no supporting goal", "spec", requirement["line"], ref=requirement["id"])
+        if tasks_doc and not entry["tasks"]:
+            _finding(findings, "error", "requirement-without-task", f"Requirement {requirement['id']} is not implemented by any task", "spec", requirement["line"], ref=requirement["id"])
+
+    goal_coverage = []
+    for goal in goals:
+        entry = {
+            "id": goal["id"],
+            "text": goal["text"],
+            "requirements": [r["id"] for r in requirement_coverage if goal["id"] in r["goals"]],
+            "tasks": linked(goal, tasks),
+        }
+        goal_coverage.append(entry)
+        if spec and not entry["requirements"]:
+            _finding(findings, "warning", "goal-without-requirement", f"Goal {goal['id']} is not backed by any requirement", "goals", goal["line"], ref=goal["id"])
+
+    covered_tasks = {t for r in requirement_coverage for t in r["tasks"]} | {t for g in goal_coverage for t in g["tasks"]}
+    unlinked_tasks = [t["id"] for t in tasks if t["id"] not in covered_tasks]
+    for task in tasks:
+        if task["persona"] is None:
+            _finding(findings, "info", "task-without-persona", f"Task {task['id']} has no persona assignment", "tasks", task["line"], ref=task["id"])
+
+    # Dangling references: explicit IDs that no artifact defines, links to missing files.
+    # An ID listed as an item in its owning artifact counts as defined even outside the
+    # section it is parsed from, and a document never dangles on an ID it lists itself.
+    defined = {
+        "requirement": {r["id"] for r in requirements if not r["implicit"]} | set(spec["defines"]["requirement"] if spec else ()),
+        "goal": {g["id"] for g in goals if not g["implicit"]} | set(goals_doc["defines"]["goal"] if goals_doc else ()),
+        "task": {t["id"] for t in tasks if not t["implicit"]} | set(tasks_doc["defines"]["task"] if tasks_doc else ()),
+    }
+    dependency_refs = {dep for task in tasks for dep in task["depends_on"]}
+    for kind, doc in docs.items():
+        if doc is None:
+            continue
+        for id_kind, refs in doc["references"].items():
+            owner = {"requirement": spec, "goal": goals_doc, "task": tasks_doc}[id_kind]
+            if owner is None:
+                continue
+            for ref in refs:
+                if kind == "tasks" and ref in dependency_refs:
+                    continue  # Reported per task below, with its line
+                if ref not in defined[id_kind] and ref not in doc["defines"][id_kind]:
+                    _finding(findings, "error", "dangling-reference", f"{ARTIFACT_FILES[kind]} references {ref}, which is not defined", kind, ref=ref)
+        for link in doc["links"]:
+            target = (feature_dir / link.split("#", 1)[0]).resolve()
+            if link.split("#", 1)[0] and not target.exists():
+                _finding(findings, "warning", "broken-link", f"{ARTIFACT_FILES[kind]} links to {link}, which does not exist", kind, ref=link)
+    for task in tasks:
+        for dep in task["depends_on"]:
+            if dep not in defined["task"]:
+                _finding(findings, "error", "dangling-reference", f"Task {task['id']} depends on {dep}, which is not defined", "tasks", task["line"], ref=dep)
+
+    # Contradictions: conflicting technology choices and negated requirement pairs
+    if blueprint and plan:
+        blueprint_tech = _technologies(" ".join(blueprint["technology"].values()))
+        plan_tech = _technologies(" ".join(plan["technology"].values()))
+        for group in sorted(blueprint_tech.keys() & plan_tech.keys()):
+            if not blueprint_tech[group] & plan_tech[group]:
+                _finding(
+                    findings, "error", "technology-conflict",
+                    f"blueprint.md chooses {', '.join(sorted(blueprint_tech[group]))} for {group} but plan.md uses {', '.join(sorted(plan_tech[group]))}",
+                    "plan", group=group,
+                )
+    for i, first in enumerate(requirements):
+        for second in requirements[i + 1:]:
+            if bool(_NEGATION_RE.search(first["text"])) != bool(_NEGATION_RE.search(second["text"])) and related(first["text"], second["text"], MIN_CONTRADICTION_OVERLAP):
+                _finding(
+                    findings, "warning", "possible-contradiction",
+                    f"Requirements {first['id']} and {second['id']} overlap but only one is negated",
+                    "spec", second["line"], refs=[first["id"], second["id"]],
+                )
+
+    severity_rank = {"error": 0, "warning": 1, "info": 2}
+    findings.sort(key=lambda f: (severity_rank[f["severity"]], f["code"], f["artifact"] or "", f["line"] or 0))
+    counts = {s: sum(1 for f in findings if f["severity"] == s) for s in severity_rank}
+
+    def percent(part, whole):
+        return round(100 * part / whole, 1) if whole else None
+
+    return {
+        "version": REPORT_VERSION,
+        "feature": feature_dir.name,
+        "feature_dir": str(feature_dir),
+        "artifacts": artifacts,
+        "coverage": {
+            "requirements": requirement_coverage,
+            "goals": goal_coverage,
+            "unlinked_tasks": unlinked_tasks,
+            "summary": {
+                "requirements": len(requirements),
+                "requirements_with_goals": percent(sum(1 for r in requirement_coverage if r["goals"]), len(requirements)),
+                "requirements_with_tasks": percent(sum(1 for r in requirement_coverage if r["tasks"]), len(requirements)),
+                "goals": len(goals),
+                "goals_with_tasks": percent(sum(1 for g in goal_coverage if g["tasks"]), len(goals)),
+                "tasks": len(tasks),
+                "tasks_done": sum(1 for t in tasks if t["done"]),
+            },
+        },
+        "findings": findings,
+        "counts": counts,
+        "cache": cache.stats,
+    }
@@ -0,0 +1,257 @@
+"""Template archive extraction and reproducible archive writing for the Blueprint-Kit CLI."""
+
+import hashlib
+import os
+import shutil
+import struct
+import zipfile
+import zlib
+from pathlib import Path, PurePosixPath
+
+from ..core.tracing import span
+
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# 1980-01-01 00:00:00, the earliest timestamp a zip entry can hold
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def nested_root(names: list[str]) -> str | None:
+    """Return the single top-level directory every entry lives under, or None.
+
+    Mirrors the "one extracted item that is a directory" flattening rule used for
+    release archives built as ``<dir>/...``.
+    """
+    roots = set()
+    has_nested = False
+    for name in names:
+        parts = PurePosixPath(name).parts
+        if not parts:
+            continue
+        roots.add(parts[0])
+        if len(parts) > 1 or name.endswith("/"):
+            has_nested = True
+        if len(roots) > 1:
+            return None
+    if len(roots) == 1 and has_nested:
+        return roots.pop()
+    return None
+
+
+def _target_path(dest: Path, name: str, strip: str | None) -> Path | None:
+    """Map an archive member name to its destination, refusing paths that escape dest."""
+    parts = PurePosixPath(name.replace("\\", "/")).parts
+    if strip is not None and parts and parts[0] == strip:
+        parts = parts[1:]
+    if not parts or any(p in ("..", "") for p in parts) or PurePosixPath(name).is_absolute():
+        return None
+    return dest.joinpath(*parts)
+
+
+def file_crc32(path: Path) -> int:
+    """Return the CRC32 of a file, computed the same way as zip central directory entries."""
+    crc = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc & 0xFFFFFFFF
+
+
+def is_unchanged(target: Path, info: zipfile.ZipInfo) -> bool:
+    """True when target already holds exactly the member's content.
+
+    Size is compared first so only same-size files pay for a CRC32 pass; the
+    archive side comes straight from the central directory without decompressing.
+    """
+    try:
+        if target.stat().st_size != info.file_size:
+            return False
+    except OSError:
+        return False
+    return file_crc32(target) == info.CRC
+
+
+def extract_zip_into(zip_ref: zipfile.ZipFile, dest: Path, *, flatten: bool = True, skip_unchanged: bool = True) -> dict:
+    """Stream every archive member straight to its final location under dest.
+
+    Each member is read once and written once: there is no intermediate temp tree.
+    When flatten is True and all members share a single top-level directory, that
+    directory is stripped in-stream. With skip_unchanged, existing files whose
+    size and CRC32 match the archive entry are left untouched (mtimes preserved).
+
+    Returns:
+        Dict with ``files`` (written count), ``skipped`` (unchanged count),
+        ``conflicted`` (existing files that differed and were overwritten, or could
+        not be written because a directory is in the way), ``flattened`` (stripped
+        root or None), ``top_level`` (sorted top-level names) and ``overwritten``
+        (relative paths of existing files that were rewritten).
+    """
+    infos = zip_ref.infolist()
+    strip = nested_root([i.filename for i in infos]) if flatten else None
+    dest.mkdir(parents=True, exist_ok=True)
+
+    written = 0
+    written_bytes = 0
+    skipped = 0
+    conflicted = []
+    top_level = set()
+    overwritten = []
+    created_dirs = set()
+    with span("zip extract", "disk", archive=os.path.basename(str(zip_ref.filename or ""))) as trace:
+        for info in infos:
+            target = _target_path(dest, info.filename, strip)
+            if target is None:
+                continue
+            rel = target.relative_to(dest)
+            top_level.add(rel.parts[0])
+            if info.is_dir():
+                if target not in created_dirs:
+                    target.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target)
+                continue
+            parent = target.parent
+            if parent not in created_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(parent)
+            if target.is_dir():
+                conflicted.append(rel.as_posix())
+                continue
+            if target.exists():
+                if skip_unchanged and is_unchanged(target, info):
+                    skipped += 1
+                    continue
+                overwritten.append(rel.as_posix())
+                conflicted.append(rel.as_posix())
+            with zip_ref.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            written += 1
+            written_bytes += info.file_size
+        trace.update(files=written, skipped=skipped, bytes=written_bytes)
+
+    return {
+        "files": written,
+        "skipped": skipped,
+        "conflicted": conflicted,
+        "flattened": strip,
+        "top_level": sorted(top_level),
+        "overwritten": overwritten,
+    }
+
+
+def zip_timestamp() -> tuple[int, int, int, int, int, int]:
+    """Timestamp for reproducible archives: SOURCE_DATE_EPOCH when set, else the zip epoch."""
+    epoch = os.getenv("SOURCE_DATE_EPOCH", "").strip()
+    if epoch.isdigit():
+        import time
+
+        stamp = time.gmtime(int(epoch))[:6]
+        if stamp[0] >= 1980:
+            return stamp
+    return ZIP_EPOCH
+
+
+def compress_entry(name: str, data: bytes, mode: int = 0o644, level: int = 9) -> dict:
+    """Deflate one archive member up front so the result can be written into many archives.
+
+    Falls back to storing the data when deflate does not make it smaller.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    method = zipfile.ZIP_DEFLATED
+    if len(compressed) >= len(data):
+        compressed, method = data, zipfile.ZIP_STORED
+    return {
+        "name": name,
+        "crc": zlib.crc32(data) & 0xFFFFFFFF,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "size": len(data),
+        "method": method,
+        "data": compressed,
+        "mode": mode,
+    }
+
+
+def write_reproducible_zip(path: Path, entries: list[dict], timestamp: tuple | None = None) -> list[dict]:
+    """Write pre-compressed entries (see ``compress_entry``) as a byte-reproducible zip.
+
+    Members are sorted by name, parent directories get explicit entries, and
+    every member carries the same timestamp and normalised permissions, so the
+    same inputs always produce the same bytes. The file is written next to path
+    and swapped into place.
+
+    Returns:
+        One dict per file member (name, sha256, size, mode, crc, method,
+        offset of its local header and compressed_size), in archive order, so
+        single members can later be fetched with a ranged request
+    """
+    year, month, day, hour, minute, second = timestamp or zip_timestamp()
+    dos_time = (hour << 11) | (minute << 5) | (second // 2)
+    dos_date = ((year - 1980) << 9) | (month << 5) | day
+
+    members = {}
+    for entry in entries:
+        members[entry["name"]] = entry
+        parts = entry["name"].split("/")[:-1]
+        for i in range(1, len(parts) + 1):
+            directory = "/".join(parts[:i]) + "/"
+            members.setdefault(directory, {"name": directory, "crc": 0, "sha256": None, "size": 0, "method": zipfile.ZIP_STORED, "data": b"", "mode": 0o755})
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    central = []
+    layout = []
+    offset = 0
+    with open(tmp_path, "wb") as f:
+        for name in sorted(members):
+            entry = members[name]
+            encoded = name.encode("utf-8")
+            flags = 0x800 if not encoded.isascii() else 0
+            is_dir = name.endswith("/")
+            external = ((0o040000 if is_dir else 0o100000) | entry["mode"]) << 16 | (0x10 if is_dir else 0)
+            header = struct.pack(
+                "<4s5H3L2H", b"PK\x03\x04", 20, flags, entry["method"], dos_time, dos_date,
+                entry["crc"], len(entry["data"]), entry["size"], len(encoded), 0,
+            )
+            f.write(header)
+            f.write(encoded)
+            f.write(entry["data"])
+            central.append(struct.pack(
+                "<4s6H3L5H2L", b"PK\x01\x02", (3 << 8) | 20, 20, flags, entry["method"], dos_time, dos_date,
+                entry["crc"], len(entry["data"]), entry["size"], len(encoded), 0, 0, 0, 0, external, offset,
+            ) + encoded)
+            if not is_dir:
+                layout.append({
+                    "name": name, "sha256": entry["sha256"], "size": entry["size"], "mode": entry["mode"],
+                    "crc": entry["crc"], "method": entry["method"], "offset": offset, "compressed_size": len(entry["data"]),
+                })
+            offset += len(header) + len(encoded) + len(entry["data"])
+        directory = b"".join(central)
+        f.write(directory)
+        f.write(struct.pack("<4s4H2LH", b"PK\x05\x06", 0, 0, len(central), len(central), len(directory), offset, 0))
+    os.replace(tmp_path, path)
+    return layout
+
+
+def read_local_member(buf: bytes, member: dict, base: int = 0) -> bytes:
+    """Decode one member from raw archive bytes starting at archive offset base.
+
+    member carries ``offset``, ``compressed_size``, ``method`` and ``sha256`` as
+    returned by ``write_reproducible_zip``. Raises ValueError when the bytes do
+    not hold a valid local header or the content does not match its hash.
+    """
+    start = member["offset"] - base
+    header = buf[start:start + 30]
+    if len(header) < 30 or header[:4] != b"PK\x03\x04":
+        raise ValueError(f"No local header for {member['name']} at offset {member['offset']}")
+    name_len, extra_len = struct.unpack("<2H", header[26:30])
+    data_start = start + 30 + name_len + extra_len
+    data = buf[data_start:data_start + member["compressed_size"]]
+    if len(data) != member["compressed_size"]:
+        raise ValueError(f"Truncated data for {member['name']}")
+    if member["method"] == zipfile.ZIP_DEFLATED:
+        data = zlib.decompress(data, -15)
+    elif member["method"] != zipfile.ZIP_STORED:
+        raise ValueError(f"Unsupported compression method {member['method']} for {member['name']}")
+    if hashlib.sha256(data).hexdigest() != member["sha256"]:
+        raise ValueError(f"Checksum mismatch for {member['name']}")
+    return data
@@ -0,0 +1,303 @@
+"""Structured parsing of feature artifacts for the Blueprint-Kit CLI.
+
+Turns spec.md, goals.md, blueprint.md, plan.md and tasks.md (as produced from
+the templates in ``templates/``) into plain JSON-serialisable dicts so results
+can be cached and compared without re-reading the markdown.
+"""
+
+import re
+from typing import Iterable, Iterator
+
+
+PARSER_VERSION = 3  # Bump when parse output changes so cached parses are discarded
+
+# Artifact kind -> file name inside a feature directory
+ARTIFACT_FILES = {
+    "spec": "spec.md",
+    "goals": "goals.md",
+    "blueprint": "blueprint.md",
+    "plan": "plan.md",
+    "tasks": "tasks.md",
+}
+
+# Sections each artifact is expected to have (matched case-insensitively on H2 titles)
+REQUIRED_SECTIONS = {
+    "spec": ["Feature Overview", "User Scenarios & Testing", "Functional Requirements", "Success Criteria"],
+    "goals": ["Goal Definition", "Success Criteria", "Success Indicators", "Validation Approach"],
+    "blueprint": ["Architecture Overview", "Core Components", "System Design", "Quality Attributes"],
+    "plan": ["Implementation Approach", "Implementation Phases", "Testing Strategy"],
+    "tasks": ["Task Breakdown"],
+}
+
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_LIST_ITEM_RE = re.compile(r'^\s*(?:[-*+]|\d+[.)])\s+(.*\S)\s*$')
+_CHECKBOX_RE = re.compile(r'^\s*[-*+]\s+\[([ xX])\]\s*(.*?)\s*$')
+# Bracketed template text; "[Label]:" prefixes and "[text](link)" are not placeholders
+_PLACEHOLDER_RE = re.compile(r'\[(?!P\]|ASSUMPTION\b|NEEDS CLARIFICATION\b)[A-Z][^\]\n]*\](?![(:])')
+_BOLD_FIELD_RE = re.compile(r'^\*\*([^*]+)\*\*:\s*(.*?)\s*$')
+_KEY_VALUE_RE = re.compile(r'^\[?([^\]:]+?)\]?:\s*(.*)$')
+_BACKTICK_RE = re.compile(r'`([^`\n]+)`')
+_LINK_RE = re.compile(r'\[[^\]\n]*\]\(([^)\s]+)\)')
+_PARALLEL_RE = re.compile(r'(?:\*\*)?\[P\](?:\*\*)?')
+_PERSONA_RE = re.compile(r'\*\*Assigned to\*\*:\s*\[?([^\]\n-][^\]\n]*?)\]?\s*(?:$|-\s)')
+_DEPENDS_RE = re.compile(r'\((?:depends on|after|requires)\s+([^)]+)\)', re.IGNORECASE)
+_STORY_RE = re.compile(r'^User Story\s+(\d+)\s*(?:[:\-–]\s*(.*))?$', re.IGNORECASE)
+_PHASE_RE = re.compile(r'^Phase\s+([\d.]+)\s*(?:[:\-–]\s*(.*))?$', re.IGNORECASE)
+_PATH_LIKE_RE = re.compile(r'^[\w.\-/]+\.[A-Za-z0-9]+$|/')
+_REQUIREMENTS_TITLE_RE = re.compile(r'^(?:functional\s+)?requirements\b', re.IGNORECASE)
+
+# Explicit identifiers authors can use to cross-reference artifacts
+ID_PATTERNS = {
+    "requirement": re.compile(r'\b(FR-\d+|REQ-\d+)\b'),
+    "goal": re.compile(r'\b((?:G|SC)-\d+)\b'),
+    "task": re.compile(r'\b(T\d{3,})\b'),
+}
+
+# Sections holding review/sync checkboxes rather than content
+_CHECKLIST_SECTION_RE = re.compile(r'checklist|artifact synchronization|pre-implementation gates|gate status|prerequisites', re.IGNORECASE)
+
+
+def is_placeholder(text: str) -> bool:
+    """True for unfilled template text such as ``[Requirement 1 - should be testable]``."""
+    stripped = text.strip()
+    return not stripped or bool(re.fullmatch(r'\[[^\]]*\]', stripped))
+
+
+def split_sections(text: str) -> list[dict]:
+    """Split markdown into heading-delimited sections.
+
+    Returns:
+        List of ``{"level", "title", "line", "lines": [(line_no, text), ...], "path"}``
+        where path holds the titles of the enclosing headings (outermost first).
+        Content before the first heading is a level-0 section titled "".
+    """
+    sections = [{"level": 0, "title": "", "line": 1, "lines": [], "path": []}]
+    stack: list[tuple[int, str]] = []
+    in_fence = False
+    for number, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        heading = None if in_fence else _HEADING_RE.match(line)
+        if heading:
+            level, title = len(heading.group(1)), heading.group(2)
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            sections.append({"level": level, "title": title, "line": number, "lines": [], "path": [t for _, t in stack]})
+            stack.append((level, title))
+        else:
+            sections[-1]["lines"].append((number, line))
+    return sections
+
+
+def _list_items(section: dict) -> list[tuple[int, str]]:
+    items = []
+    for number, line in section["lines"]:
+        match = _LIST_ITEM_RE.match(line)
+        if match and not _CHECKBOX_RE.match(line):
+            items.append((number, match.group(1)))
+    return items
+
+
+def _find_sections(sections: list[dict], title: str) -> list[dict]:
+    """Sections with the given title, plus every subsection nested under them."""
+    title = title.lower()
+    return [s for s in sections if s["title"].lower() == title or title in (p.lower() for p in s["path"])]
+
+
+def _requirement_sections(sections: list[dict]) -> list[dict]:
+    """Sections titled "Requirements" or "Functional Requirements" (any level), plus their subsections."""
+    return [
+        s for s in sections
+        if any(_REQUIREMENTS_TITLE_RE.match(t) for t in (*s["path"], s["title"]))
+        and not s["title"].lower().startswith("requirements rationale")
+    ]
+
+
+def _defined_ids(sections: list[dict]) -> dict[str, list[str]]:
+    """Explicit IDs that start a list item anywhere in the document, by ID kind."""
+    defined: dict[str, set[str]] = {name: set() for name in ID_PATTERNS}
+    for section in sections:
+        for _, text in _list_items(section):
+            for name, pattern in ID_PATTERNS.items():
+                match = pattern.match(text.lstrip("*[ "))
+                if match:
+                    defined[name].add(match.group(1))
+    return {name: sorted(ids) for name, ids in defined.items()}
+
+
+def _numbered_entries(items: list[tuple[int, str]], kind: str, prefix: str) -> list[dict]:
+    """Assign explicit IDs where authors wrote them, or positional ones (``FR-001``) otherwise."""
+    entries = []
+    pattern = ID_PATTERNS[kind]
+    for position, (line, text) in enumerate(items, start=1):
+        if is_placeholder(text):
+            continue
+        match = pattern.match(text.lstrip("*[ "))
+        if match:
+            entry_id, implicit = match.group(1), False
+        else:
+            entry_id, implicit = f"{prefix}-{position:03d}", True
+        entries.append({"id": entry_id, "text": text, "line": line, "implicit": implicit})
+    return entries
+
+
+def _key_values(section_list: list[dict]) -> dict[str, str]:
+    values = {}
+    for section in section_list:
+        for _, text in _list_items(section):
+            match = _KEY_VALUE_RE.match(text)
+            if match and not is_placeholder(match.group(2)):
+                values[match.group(1).strip().lower()] = match.group(2).strip()
+    return values
+
+
+def _bold_fields(sections: list[dict]) -> dict[str, str]:
+    fields = {}
+    for section in sections:
+        for _, line in section["lines"]:
+            match = _BOLD_FIELD_RE.match(line.strip())
+            if match and not is_placeholder(match.group(2)):
+                fields.setdefault(match.group(1).strip().lower(), match.group(2))
+    return fields
+
+
+def _parse_task_line(body: str, done: bool, position: int, story: dict | None, phase: dict | None, line_no: int) -> dict:
+    id_match = ID_PATTERNS["task"].match(_PARALLEL_RE.sub("", body).strip())
+    persona_match = _PERSONA_RE.search(body + " - ")
+    depends = []
+    for dep in _DEPENDS_RE.findall(body):
+        depends.extend(ID_PATTERNS["task"].findall(dep))
+    description = _PERSONA_RE.sub("", body + " - ").strip(" -")
+    description = " ".join(_PARALLEL_RE.sub("", description).split())
+    return {
+        "id": id_match.group(1) if id_match else f"T{position:03d}",
+        "implicit": id_match is None,
+        "text": description,
+        "done": done,
+        "parallel": bool(_PARALLEL_RE.search(body)),
+        "files": [f for f in _BACKTICK_RE.findall(body) if _PATH_LIKE_RE.search(f) and not is_placeholder(f)],
+        "persona": persona_match.group(1).strip() if persona_match and not is_placeholder(persona_match.group(1)) else None,
+        "depends_on": depends,
+        "story": story,
+        "phase": phase,
+        "line": line_no,
+    }
+
+
+def iter_tasks(lines: Iterable[str]) -> Iterator[dict]:
+    """Stream checkbox tasks with their story, phase, parallel marker, files, persona and dependencies.
+
+    Works line by line (a file object can be passed directly), keeping only the
+    current heading stack in memory, so very large tasks.md files are never
+    held in full.
+    """
+    story = phase = None
+    stack: list[tuple[int, str]] = []
+    skipping = False
+    in_fence = False
+    position = 0
+    for line_no, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        heading = _HEADING_RE.match(line)
+        if heading:
+            level, title = len(heading.group(1)), heading.group(2)
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, title))
+            story_match = _STORY_RE.match(title)
+            phase_match = _PHASE_RE.match(title)
+            if story_match:
+                story = {"number": int(story_match.group(1)), "title": (story_match.group(2) or "").strip()}
+                phase = None
+            elif phase_match:
+                phase = {"number": phase_match.group(1), "title": (phase_match.group(2) or "").strip()}
+            elif level <= 2:
+                story = phase = None
+            skipping = any(_CHECKLIST_SECTION_RE.search(t) for _, t in stack)
+            continue
+        if skipping:
+            continue
+        match = _CHECKBOX_RE.match(line)
+        if not match:
+            continue
+        body = match.group(2)
+        if is_placeholder(_PARALLEL_RE.sub("", body).split(" - ")[0]):
+            continue
+        position += 1
+        yield _parse_task_line(body, match.group(1) != " ", position, story, phase, line_no)
+
+
+def parse_artifact_document(kind: str, text: str) -> dict:
+    """Parse one artifact into structured, JSON-serialisable form.
+
+    Every kind gets ``title``, ``sections``, ``missing_sections``,
+    ``placeholders`` (count of unfilled template placeholders), ``references``
+    (explicit IDs mentioned, by ID kind), ``defines`` (explicit IDs that start a
+    list item, by ID kind) and ``links`` (relative link targets).
+    Kind-specific keys: spec ``requirements``/``success_criteria``, goals
+    ``goals``, blueprint ``components``/``technology``, plan ``technology``/
+    ``components``/``phases``, tasks ``tasks``.
+    """
+    sections = split_sections(text)
+    h1 = next((s["title"] for s in sections if s["level"] == 1), None)
+    section_titles = [s["title"] for s in sections if s["level"] == 2]
+    lowered = {t.lower() for t in section_titles}
+    references = {
+        name: sorted(set(pattern.findall(text)))
+        for name, pattern in ID_PATTERNS.items()
+    }
+    links = sorted({
+        target for target in _LINK_RE.findall(text)
+        if "://" not in target and not target.startswith(("#", "mailto:"))
+    })
+    doc = {
+        "kind": kind,
+        "version": PARSER_VERSION,
+        "title": None if h1 is None or is_placeholder(h1) else h1,
+        "sections": section_titles,
+        "missing_sections": [s for s in REQUIRED_SECTIONS.get(kind, []) if s.lower() not in lowered],
+        "placeholders": len(_PLACEHOLDER_RE.findall(text)),
+        "references": references,
+        "defines": _defined_ids(sections),
+        "links": links,
+    }
+
+    if kind == "spec":
+        requirement_items = [i for s in _requirement_sections(sections) for i in _list_items(s)]
+        doc["requirements"] = _numbered_entries(requirement_items, "requirement", "FR")
+        doc["success_criteria"] = [t for s in _find_sections(sections, "Success Criteria") for _, t in _list_items(s) if not is_placeholder(t)]
+    elif kind == "goals":
+        goal_items = [i for s in _find_sections(sections, "Success Criteria") for i in _list_items(s)]
+        doc["goals"] = _numbered_entries(goal_items, "goal", "G")
+        metrics = _bold_fields(_find_sections(sections, "Goal Definition")).get("success metrics")
+        doc["metrics"] = metrics
+    elif kind == "blueprint":
+        components = []
+        for _, text_item in (i for s in _find_sections(sections, "Core Components") for i in _list_items(s)):
+            match = _KEY_VALUE_RE.match(text_item)
+            name = match.group(1).strip() if match else text_item
+            if is_placeholder(f"[{name}]") and name.lower().startswith("component"):
+                continue
+            components.append({"name": name, "text": text_item})
+        doc["components"] = components
+        doc["technology"] = _key_values(_find_sections(sections, "Technology Stack"))
+        doc["quality"] = _key_values(_find_sections(sections, "Quality Attributes"))
+    elif kind == "plan":
+        fields = _bold_fields(_find_sections(sections, "Implementation Approach"))
+        doc["technology"] = {k: v for k, v in fields.items()}
+        doc["components"] = [
+            s["title"] for s in _find_sections(sections, "Core Implementation")
+            if s["level"] == 3 and not is_placeholder(s["title"])
+        ]
+        doc["phases"] = [
+            s["title"] for s in _find_sections(sections, "Implementation Phases")
+            if s["level"] == 3 and not is_placeholder(s["title"].split(":", 1)[-1])
+        ]
+    elif kind == "tasks":
+        doc["tasks"] = list(iter_tasks(text.splitlines()))
+    return doc
@@ -0,0 +1,353 @@
+"""On-disk template cache for the Blueprint-Kit CLI.
+
+Release archives are stored content-addressed (``<sha256>.zip``) under the
+platform user cache directory and indexed by release tag + asset name so an
+unchanged asset is never downloaded twice. The cache is bounded in size and
+evicts least-recently-used archives first.
+
+Release metadata (the ``releases/latest`` JSON) is kept alongside with its
+ETag/Last-Modified validators so it can be trusted for a TTL window and then
+revalidated with a conditional GET.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from platformdirs import user_cache_dir
+
+from ..core.utils import file_lock
+
+
+APP_NAME = "blueprint-kit"
+
+# Default upper bound for cached archives (override with BLUEPRINT_CACHE_MAX_BYTES)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Seconds cached release metadata is trusted without revalidation (override with BLUEPRINT_RELEASE_TTL)
+DEFAULT_RELEASE_TTL = 600
+
+# Seconds after which a download lock is assumed to belong to a dead process
+DOWNLOAD_LOCK_STALE = 3600
+
+# Partial downloads untouched for this long (e.g. for a superseded release) are removed
+PARTIAL_DOWNLOAD_TTL = 7 * 24 * 3600
+
+
+def default_cache_dir() -> Path:
+    """Return the cache root, honouring BLUEPRINT_CACHE_DIR when set."""
+    override = os.getenv("BLUEPRINT_CACHE_DIR", "").strip()
+    return Path(override) if override else Path(user_cache_dir(APP_NAME))
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the hex SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_json_atomic(path: Path, data) -> None:
+    """Write JSON next to the destination and atomically swap it into place."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class FileStatCache:
+    """Per-file results kept in one JSON file under the user cache dir.
+
+    Entries are keyed by caller-chosen names and remember the (mtime, size) of
+    the file they were computed from, so a caller only re-reads files whose
+    stat changed. The cache file is ``<cache_root>/<sha256(scope)[:16]>.json``
+    and is discarded when its version differs from ``version``.
+    """
+
+    def __init__(self, scope: Path, cache_root: Path, version, enabled: bool = True):
+        self.enabled = enabled
+        self.version = version
+        digest = hashlib.sha256(str(scope.resolve()).encode("utf-8")).hexdigest()[:16]
+        self.path = cache_root / f"{digest}.json"
+        self.entries: dict[str, dict] = self._load() if enabled else {}
+        self.dirty = False
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            return {}
+        return data.get("entries", {})
+
+    def stat(self, key: str, path: Path) -> os.stat_result | None:
+        """Stat path, forgetting key's entry when the file no longer exists."""
+        try:
+            return path.stat()
+        except OSError:
+            if self.entries.pop(key, None) is not None:
+                self.dirty = True
+            return None
+
+    def fresh(self, key: str, st: os.stat_result) -> dict | None:
+        """Key's entry if it was stored for a file with the same mtime and size."""
+        entry = self.entries.get(key)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return entry
+        return None
+
+    def put(self, key: str, st: os.stat_result, **values) -> None:
+        self.entries[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, **values}
+        self.dirty = True
+
+    def prune(self, keys: set[str]) -> None:
+        """Drop entries whose key is not in keys."""
+        for key in [key for key in self.entries if key not in keys]:
+            del self.entries[key]
+            self.dirty = True
+
+    def save(self) -> None:
+        if not (self.enabled and self.dirty):
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(self.path, {"version": self.version, "entries": self.entries})
+        except OSError:
+            pass  # Cache is an optimisation only
+
+
+class TemplateCache:
+    """Content-addressed, size-bounded LRU cache of template archives.
+
+    Layout::
+
+        <root>/templates/<sha256>.zip   archive blobs
+        <root>/templates/index.json     {"<tag>/<asset>": {sha256, size, stored_at, last_used}}
+        <root>/templates/index.lock     serialises index updates across processes
+    """
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None, release_ttl: float | None = None):
+        self.root = Path(root) if root else default_cache_dir()
+        self.blob_dir = self.root / "templates"
+        self.index_path = self.blob_dir / "index.json"
+        self.index_lock_path = self.blob_dir / "index.lock"
+        self.release_dir = self.root / "releases"
+        if max_bytes is None:
+            try:
+                max_bytes = int(os.getenv("BLUEPRINT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+            except ValueError:
+                max_bytes = DEFAULT_MAX_BYTES
+        self.max_bytes = max_bytes
+        if release_ttl is None:
+            try:
+                release_ttl = float(os.getenv("BLUEPRINT_RELEASE_TTL", DEFAULT_RELEASE_TTL))
+            except ValueError:
+                release_ttl = DEFAULT_RELEASE_TTL
+        self.release_ttl = release_ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tag: str, asset_name: str) -> str:
+        return f"{tag}/{asset_name}"
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / f"{sha256}.zip"
+
+    @contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """Serialise index read-modify-write cycles between threads and between processes.
+
+        Without the file lock, two concurrent ``blueprint init`` runs could each
+        rewrite index.json from their own stale copy, dropping the other's entry
+        and orphaning its blob where eviction can never find it.
+        """
+        with self._lock, file_lock(self.index_lock_path):
+            yield
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict) -> None:
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(self.index_path, index)
+
+    def lookup(self, tag: str, asset_name: str, sha256: str | None = None, size: int | None = None) -> Path | None:
+        """Return the cached archive for tag/asset, or None on a miss.
+
+        When the release publishes a digest it must match the cached entry; otherwise
+        the recorded size is used as a cheap sanity check.
+        """
+        with self._index_lock():
+            index = self._load_index()
+            entry = index.get(self.key(tag, asset_name))
+            if not entry:
+                return None
+            if sha256 and entry.get("sha256") != sha256:
+                return None
+            if size is not None and entry.get("size") != size:
+                return None
+            path = self.blob_path(entry["sha256"])
+            if not path.is_file():
+                index.pop(self.key(tag, asset_name), None)
+                self._save_index(index)
+                return None
+            entry["last_used"] = time.time()
+            self._save_index(index)
+            return path
+
+    def latest(self, asset_prefix: str) -> tuple[Path, dict] | None:
+        """Return the most recently stored archive whose asset name starts with asset_prefix."""
+        with self._index_lock():
+            index = self._load_index()
+            candidates = []
+            for key, entry in index.items():
+                tag, _, asset_name = key.partition("/")
+                if asset_name.startswith(asset_prefix) and self.blob_path(entry.get("sha256", "")).is_file():
+                    candidates.append((entry.get("stored_at", 0), tag, asset_name, entry))
+            if not candidates:
+                return None
+            _, tag, asset_name, entry = max(candidates, key=lambda c: c[0])
+            entry["last_used"] = time.time()
+            self._save_index(index)
+            return self.blob_path(entry["sha256"]), {"release": tag, "filename": asset_name, **entry}
+
+    def new_temp_path(self, asset_name: str) -> Path:
+        """Return a unique temporary download path inside the cache directory."""
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        return self.blob_dir / f".{asset_name}.{os.getpid()}.{threading.get_ident()}.part"
+
+    @contextmanager
+    def download_slot(self, tag: str, asset_name: str) -> Iterator[tuple[Path, bool]]:
+        """Yield (download path, resumable) for tag/asset.
+
+        The path is stable across runs so an interrupted download resumes later.
+
+        A lock file keeps concurrent downloads of the same asset apart: the loser
+        gets a unique, non-resumable path instead. Locks older than
+        DOWNLOAD_LOCK_STALE seconds are left over from a killed process and are taken over.
+        """
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        safe = f"{tag}-{asset_name}".replace("/", "_")
+        path = self.blob_dir / f".{safe}.download"
+        lock = path.with_name(path.name + ".lock")
+        try:
+            if time.time() - lock.stat().st_mtime > DOWNLOAD_LOCK_STALE:
+                lock.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            yield self.new_temp_path(asset_name), False
+            return
+        try:
+            yield path, True
+        finally:
+            try:
+                lock.unlink()
+            except FileNotFoundError:
+                pass
+
+    def store(self, tag: str, asset_name: str, source: Path, sha256: str | None = None) -> Path:
+        """Move a downloaded archive into the cache and return its blob path."""
+        sha256 = sha256 or file_sha256(source)
+        size = source.stat().st_size
+        blob = self.blob_path(sha256)
+        with self._index_lock():
+            if blob.exists():
+                source.unlink()
+            else:
+                os.replace(source, blob)
+            index = self._load_index()
+            now = time.time()
+            index[self.key(tag, asset_name)] = {
+                "sha256": sha256,
+                "size": size,
+                "stored_at": now,
+                "last_used": now,
+            }
+            self._evict(index, keep=sha256)
+            self._save_index(index)
+            self._sweep_partials(now)
+        return blob
+
+    def _sweep_partials(self, now: float) -> None:
+        for path in self.blob_dir.glob(".*.download.part*"):
+            try:
+                if now - path.stat().st_mtime > PARTIAL_DOWNLOAD_TTL:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _release_path(self, url: str) -> Path:
+        return self.release_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]}.json"
+
+    def load_release(self, url: str) -> dict | None:
+        """Return the cached metadata entry for a release URL.
+
+        The entry has ``data``, ``etag``, ``last_modified`` and ``fetched_at`` keys.
+        """
+        try:
+            with open(self._release_path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "data" in entry else None
+
+    def release_is_fresh(self, entry: dict) -> bool:
+        """True when entry was fetched or revalidated within the TTL window."""
+        return time.time() - entry.get("fetched_at", 0) < self.release_ttl
+
+    def store_release(self, url: str, data: dict, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Persist release metadata together with its HTTP validators."""
+        self.release_dir.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(self._release_path(url), {
+            "url": url,
+            "data": data,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        })
+
+    def touch_release(self, url: str, entry: dict) -> None:
+        """Restart the TTL window for an entry after a 304 revalidation."""
+        self.store_release(url, entry["data"], entry.get("etag"), entry.get("last_modified"))
+
+    def _evict(self, index: dict, keep: str | None = None) -> None:
+        """Drop least-recently-used blobs until the cache fits in max_bytes."""
+        blobs: dict[str, dict] = {}
+        for key, entry in index.items():
+            sha = entry.get("sha256")
+            if not sha:
+                continue
+            info = blobs.setdefault(sha, {"size": entry.get("size", 0), "last_used": 0, "keys": []})
+            info["last_used"] = max(info["last_used"], entry.get("last_used", 0))
+            info["keys"].append(key)
+
+        total = sum(info["size"] for info in blobs.values())
+        for sha, info in sorted(blobs.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if sha == keep:
+                continue
+            try:
+                self.blob_path(sha).unlink()
+            except FileNotFoundError:
+                pass
+            for key in info["keys"]:
+                index.pop(key, None)
+            total -= info["size"]
@@ -0,0 +1,312 @@
+"""Spec catalog for the Blueprint-Kit CLI.
+
+Keeps an SQLite catalog of every feature under ``.blueprint/specs`` and its
+artifacts (spec, goals, blueprint, plan, tasks). The database lives in the
+user cache directory, keyed on the project root like the parse and status
+caches, so it and its WAL sidecar files never show up in the project tree.
+Each refresh only stats artifact files; a file is re-read when its mtime or
+size changed and re-parsed only when its content hash changed, so listing and
+querying thousands of features never re-walks unchanged documents. The search
+index (``services/search.py``) lives in the same database and is refreshed on
+the same content-hash changes.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+from .artifacts import ARTIFACT_FILES
+from .cache import default_cache_dir
+from .features import SPECS_DIR, _FEATURE_NUM_RE
+from .search import SEARCH_KINDS, SEARCH_SCHEMA, index_document
+
+
+# Written by earlier releases inside the project; removed when a catalog opens
+LEGACY_FILES = tuple(Path(".blueprint") / f"catalog.db{suffix}" for suffix in ("", "-wal", "-shm"))
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS features (
+    name TEXT PRIMARY KEY,
+    number INTEGER,
+    title TEXT,
+    status TEXT,
+    tasks_total INTEGER NOT NULL DEFAULT 0,
+    tasks_done INTEGER NOT NULL DEFAULT 0,
+    goals INTEGER NOT NULL DEFAULT 0,
+    mtime REAL,
+    indexed_at REAL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    feature TEXT NOT NULL REFERENCES features(name) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    title TEXT,
+    tasks_total INTEGER NOT NULL DEFAULT 0,
+    tasks_done INTEGER NOT NULL DEFAULT 0,
+    goals INTEGER NOT NULL DEFAULT 0,
+    status TEXT,
+    PRIMARY KEY (feature, kind)
+);
+CREATE INDEX IF NOT EXISTS features_status ON features(status);
+""" + SEARCH_SCHEMA
+
+_TABLES = ("lsh_buckets", "postings", "search_docs", "artifacts", "features")
+
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_CHECKBOX_RE = re.compile(r'^\s*[-*+]\s+\[([ xX])\]')
+_BULLET_RE = re.compile(r'^\s*[-*+]\s+\S')
+_STATUS_RE = re.compile(r'^\*\*Status\*\*:\s*(.+?)\s*$', re.IGNORECASE)
+# Template headings that are placeholders rather than real titles
+_PLACEHOLDER_RE = re.compile(r'^\[.*\]$')
+
+# H2 sections in tasks.md whose checkboxes are review items, not tasks
+_NON_TASK_SECTIONS = {"validation checklist", "prerequisites", "review checklist"}
+
+
+def parse_artifact(kind: str, text: str) -> dict:
+    """Extract the catalog fields for one artifact.
+
+    Returns:
+        Dict with ``title`` (first H1, None for template placeholders),
+        ``status`` (explicit ``**Status**:`` line), ``tasks_total``/``tasks_done``
+        (checkbox items, tasks.md only) and ``goals`` (Success Criteria bullets,
+        goals.md only)
+    """
+    title = None
+    status = None
+    tasks_total = tasks_done = goals = 0
+    section = None
+    for line in text.splitlines():
+        heading = _HEADING_RE.match(line)
+        if heading:
+            level, heading_text = len(heading.group(1)), heading.group(2)
+            if level == 1 and title is None:
+                title = None if _PLACEHOLDER_RE.match(heading_text) else heading_text
+            if level <= 2:
+                section = heading_text.lower()
+            continue
+        if status is None:
+            status_match = _STATUS_RE.match(line)
+            if status_match:
+                status = status_match.group(1).lower()
+                continue
+        if kind == "tasks" and section not in _NON_TASK_SECTIONS:
+            checkbox = _CHECKBOX_RE.match(line)
+            if checkbox:
+                tasks_total += 1
+                tasks_done += checkbox.group(1) != " "
+        elif kind == "goals" and section == "success criteria" and _BULLET_RE.match(line):
+            goals += 1
+    return {"title": title, "status": status, "tasks_total": tasks_total, "tasks_done": tasks_done, "goals": goals}
+
+
+def derive_status(artifacts: dict[str, dict]) -> str:
+    """Workflow stage for a feature from the artifacts it has (explicit spec status wins)."""
+    spec = artifacts.get("spec")
+    if spec and spec.get("status"):
+        return spec["status"]
+    tasks = artifacts.get("tasks")
+    if tasks and tasks["tasks_total"]:
+        if tasks["tasks_done"] == tasks["tasks_total"]:
+            return "done"
+        return "in-progress" if tasks["tasks_done"] else "tasked"
+    if artifacts.get("plan") and artifacts["plan"]["size"]:
+        return "planned"
+    if spec:
+        return "specified"
+    return "empty"
+
+
+class Catalog:
+    """Incrementally maintained SQLite catalog of one project's features."""
+
+    def __init__(self, root: Path, db_path: Path | None = None):
+        self.root = Path(root)
+        self.specs_dir = self.root / SPECS_DIR
+        if db_path is None:
+            digest = hashlib.sha256(str(self.root.resolve()).encode("utf-8")).hexdigest()[:16]
+            db_path = default_cache_dir() / "catalog" / f"{digest}.db"
+            for legacy in LEGACY_FILES:
+                try:
+                    (self.root / legacy).unlink()
+                except OSError:
+                    pass
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self._ensure_schema()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _ensure_schema(self) -> None:
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.conn.executescript("".join(f"DROP TABLE IF EXISTS {table};" for table in _TABLES))
+        self.conn.executescript(_SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def rebuild(self) -> dict:
+        """Drop every row and index from scratch."""
+        with self.conn:
+            self.conn.execute("DELETE FROM artifacts")
+            self.conn.execute("DELETE FROM features")
+        return self.refresh()
+
+    def refresh(self) -> dict:
+        """Bring the catalog in line with the specs directory.
+
+        Returns:
+            Dict with ``features``, ``scanned`` (artifacts stat'ed), ``read``
+            (re-read because mtime/size moved), ``parsed`` (content changed),
+            ``search_indexed`` (documents re-indexed for search), ``removed``
+            (features deleted) and ``elapsed_ms``
+        """
+        start = time.perf_counter()
+        stats = {"features": 0, "scanned": 0, "read": 0, "parsed": 0, "search_indexed": 0, "removed": 0}
+
+        known: dict[str, dict[str, sqlite3.Row]] = {}
+        for row in self.conn.execute("SELECT * FROM artifacts"):
+            known.setdefault(row["feature"], {})[row["kind"]] = row
+        indexed_features = {row["name"] for row in self.conn.execute("SELECT name FROM features")}
+
+        try:
+            with os.scandir(self.specs_dir) as it:
+                feature_dirs = sorted((entry.name, Path(entry.path)) for entry in it if entry.is_dir())
+        except OSError:
+            feature_dirs = []
+
+        with self.conn:
+            present = set()
+            for name, feature_dir in feature_dirs:
+                present.add(name)
+                stats["features"] += 1
+                previous = known.get(name, {})
+                artifacts = {}
+                changed = name not in indexed_features
+                if changed:
+                    # Parent row first so artifact inserts satisfy the foreign key
+                    self.conn.execute("INSERT INTO features (name) VALUES (?)", (name,))
+                for kind, file_name in ARTIFACT_FILES.items():
+                    path = feature_dir / file_name
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        if kind in previous:
+                            self.conn.execute("DELETE FROM artifacts WHERE feature = ? AND kind = ?", (name, kind))
+                            changed = True
+                        continue
+                    stats["scanned"] += 1
+                    row = previous.get(kind)
+                    if row is not None and row["mtime_ns"] == st.st_mtime_ns and row["size"] == st.st_size:
+                        artifacts[kind] = dict(row)
+                        continue
+
+                    stats["read"] += 1
+                    data = path.read_bytes()
+                    sha = hashlib.sha256(data).hexdigest()
+                    content_changed = row is None or row["sha256"] != sha
+                    if content_changed:
+                        stats["parsed"] += 1
+                        text = data.decode("utf-8", errors="replace")
+                        parsed = parse_artifact(kind, text)
+                        changed = True
+                    else:
+                        parsed = {k: row[k] for k in ("title", "status", "tasks_total", "tasks_done", "goals")}
+                    entry = {
+                        "feature": name,
+                        "kind": kind,
+                        "path": str(path.relative_to(self.root)),
+                        "mtime_ns": st.st_mtime_ns,
+                        "size": st.st_size,
+                        "sha256": sha,
+                        **parsed,
+                    }
+                    # Upsert so the artifact's search rows are not cascaded away
+                    self.conn.execute(
+                        "INSERT INTO artifacts (feature, kind, path, mtime_ns, size, sha256, title, tasks_total, tasks_done, goals, status)"
+                        " VALUES (:feature, :kind, :path, :mtime_ns, :size, :sha256, :title, :tasks_total, :tasks_done, :goals, :status)"
+                        " ON CONFLICT(feature, kind) DO UPDATE SET path = excluded.path, mtime_ns = excluded.mtime_ns,"
+                        " size = excluded.size, sha256 = excluded.sha256, title = excluded.title,"
+                        " tasks_total = excluded.tasks_total, tasks_done = excluded.tasks_done,"
+                        " goals = excluded.goals, status = excluded.status",
+                        entry,
+                    )
+                    artifacts[kind] = entry
+                    if content_changed and kind in SEARCH_KINDS:
+                        index_document(self.conn, name, kind, text)
+                        stats["search_indexed"] += 1
+
+                if changed:
+                    self._upsert_feature(name, artifacts)
+
+            removed = indexed_features - present
+            for name in removed:
+                self.conn.execute("DELETE FROM features WHERE name = ?", (name,))
+            stats["removed"] = len(removed)
+
+        stats["elapsed_ms"] = (time.perf_counter() - start) * 1000
+        return stats
+
+    def _upsert_feature(self, name: str, artifacts: dict[str, dict]) -> None:
+        number_match = _FEATURE_NUM_RE.match(name)
+        title = next((artifacts[k]["title"] for k in ("spec", "goals", "blueprint") if artifacts.get(k, {}).get("title")), None)
+        tasks = artifacts.get("tasks", {})
+        # Upsert rather than INSERT OR REPLACE: a replace deletes the row and would
+        # cascade to the feature's artifacts
+        self.conn.execute(
+            "INSERT INTO features (name, number, title, status, tasks_total, tasks_done, goals, mtime, indexed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(name) DO UPDATE SET number = excluded.number, title = excluded.title, status = excluded.status,"
+            " tasks_total = excluded.tasks_total, tasks_done = excluded.tasks_done, goals = excluded.goals,"
+            " mtime = excluded.mtime, indexed_at = excluded.indexed_at",
+            (
+                name,
+                int(number_match.group(1)) if number_match else None,
+                title,
+                derive_status(artifacts),
+                tasks.get("tasks_total", 0),
+                tasks.get("tasks_done", 0),
+                artifacts.get("goals", {}).get("goals", 0),
+                max((a["mtime_ns"] for a in artifacts.values()), default=0) / 1e9 or None,
+                time.time(),
+            ),
+        )
+
+    def list_features(self, status: str | None = None) -> list[dict]:
+        """Return catalog rows ordered by feature number (optionally filtered by status)."""
+        sql = "SELECT * FROM features"
+        params: tuple = ()
+        if status:
+            sql += " WHERE status = ?"
+            params = (status.lower(),)
+        sql += " ORDER BY number, name"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def query(self, sql: str) -> tuple[list[str], list[tuple]]:
+        """Run a read-only SQL statement against the catalog. Returns (columns, rows)."""
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        try:
+            cursor = conn.execute(sql)
+            columns = [d[0] for d in cursor.description or []]
+            return columns, cursor.fetchall()
+        finally:
+            conn.close()
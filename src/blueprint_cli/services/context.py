@@ -0,0 +1,162 @@
+"""Project context resolution for the Blueprint-Kit CLI.
+
+Resolves the repository root, current branch, active feature directory and
+artifact paths in a single process, replacing the ``git rev-parse`` /
+``git branch --show-current`` / ``ls | sort -r`` chain the workflow scripts
+used to fork on every call.
+
+The branch is read straight from ``.git/HEAD``. The feature directory
+resolution is cached in the user cache directory, keyed on the HEAD content,
+the specs directory signature and ``BLUEPRINT_FEATURE``; artifact existence is
+always checked live since it is a handful of stat calls.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from .cache import default_cache_dir, write_json_atomic
+from .features import SPECS_DIR, _dir_signature
+
+
+CONTEXT_VERSION = 1
+FEATURE_BRANCH_RE = re.compile(r'^[0-9]{3,}-')
+
+# Output key -> file name inside the feature directory
+ARTIFACTS = {
+    "FEATURE_SPEC": "spec.md",
+    "GOALS": "goals.md",
+    "BLUEPRINT": "blueprint.md",
+    "IMPL_PLAN": "plan.md",
+    "TASKS": "tasks.md",
+}
+
+
+def find_git_dir(start: Path | None = None) -> tuple[Path, Path] | tuple[None, None]:
+    """Return (work tree root, git dir) for start, following ``.git`` files used by worktrees."""
+    start = (start or Path.cwd()).resolve()
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return candidate, dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:"):].strip())
+                if not git_dir.is_absolute():
+                    git_dir = (candidate / git_dir).resolve()
+                return candidate, git_dir
+    return None, None
+
+
+def read_head(git_dir: Path) -> str | None:
+    """Return the raw contents of HEAD, or None if it cannot be read."""
+    try:
+        return (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def branch_from_head(head: str | None) -> str | None:
+    """Branch name for a symbolic HEAD (``ref: refs/heads/<name>``); None when detached."""
+    if head and head.startswith("ref:"):
+        ref = head[len("ref:"):].strip()
+        return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+    return None
+
+
+def latest_feature_dir(specs_dir: Path) -> str | None:
+    """Name of the lexically last directory in specs_dir (the scripts' ``ls | sort -r`` rule)."""
+    try:
+        with os.scandir(specs_dir) as it:
+            names = [entry.name for entry in it if entry.is_dir()]
+    except OSError:
+        return None
+    return max(names) if names else None
+
+
+def _cache_path(root: Path) -> Path:
+    digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+    return default_cache_dir() / "contexts" / f"{digest}.json"
+
+
+def _resolve_feature(specs_dir: Path, branch: str | None, override: str) -> tuple[str | None, str | None]:
+    """Return (feature name, source) following the workflow scripts' precedence."""
+    if override:
+        return override, "env"
+    if branch and FEATURE_BRANCH_RE.match(branch):
+        return branch, "branch"
+    latest = latest_feature_dir(specs_dir)
+    return (latest, "latest") if latest else (None, None)
+
+
+def resolve_context(start: Path | None = None, *, use_cache: bool = True) -> dict:
+    """Resolve the project context for start (default: the current directory).
+
+    Returns:
+        Dict with ``REPO_ROOT``, ``HAS_GIT``, ``BRANCH``, ``FEATURE``,
+        ``FEATURE_SOURCE`` ("env", "branch", "latest" or None), ``FEATURE_DIR``,
+        one path per artifact (``FEATURE_SPEC``, ``GOALS``, ``BLUEPRINT``,
+        ``IMPL_PLAN``, ``TASKS``), ``AVAILABLE_DOCS`` (artifacts that exist) and
+        ``CACHED`` (whether the feature resolution came from the cache).
+    """
+    start = (start or Path.cwd()).resolve()
+    root, git_dir = find_git_dir(start)
+    if root is None:
+        # Without git the project root is the nearest directory with .blueprint/
+        root = next((c for c in (start, *start.parents) if (c / ".blueprint").is_dir()), start)
+    specs_dir = root / SPECS_DIR
+    head = read_head(git_dir) if git_dir else None
+    override = os.getenv("BLUEPRINT_FEATURE", "").strip()
+    key = {
+        "version": CONTEXT_VERSION,
+        "head": head,
+        "specs": _dir_signature(specs_dir),
+        "override": override,
+    }
+
+    cached = None
+    cache_path = _cache_path(root) if use_cache else None
+    if cache_path is not None:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("key") == key:
+                cached = stored
+        except (OSError, ValueError):
+            pass
+
+    if cached:
+        feature, source = cached.get("feature"), cached.get("source")
+    else:
+        feature, source = _resolve_feature(specs_dir, branch_from_head(head), override)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                write_json_atomic(cache_path, {"key": key, "feature": feature, "source": source})
+            except OSError:
+                pass  # Cache is an optimisation only
+
+    feature_dir = specs_dir / feature if feature else None
+    context = {
+        "REPO_ROOT": str(root),
+        "HAS_GIT": git_dir is not None,
+        "BRANCH": branch_from_head(head),
+        "FEATURE": feature,
+        "FEATURE_SOURCE": source,
+        "FEATURE_DIR": str(feature_dir) if feature_dir else None,
+    }
+    available = []
+    for name, file_name in ARTIFACTS.items():
+        path = feature_dir / file_name if feature_dir else None
+        context[name] = str(path) if path else None
+        if path is not None and path.is_file():
+            available.append(file_name)
+    context["AVAILABLE_DOCS"] = available
+    context["CACHED"] = cached is not None
+    return context
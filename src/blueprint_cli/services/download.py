@@ -0,0 +1,473 @@
+"""Resumable, retrying HTTP downloads for the Blueprint-Kit CLI.
+
+Bytes are streamed into ``<dest>.part`` and the response validators (ETag,
+Last-Modified) are kept next to it in ``<dest>.part.json``. When a transfer is
+interrupted, the next attempt (in the same run after a backoff, or in a later
+run when the ``.part`` file lives in the template cache) asks only for the
+missing tail with ``Range: bytes=N-`` and ``If-Range: <validator>``. A server
+that still has the same representation answers ``206`` and the tail is
+appended; if the asset changed it answers ``200`` with the full body and the
+partial file is discarded, so stale and fresh bytes are never mixed.
+
+Connection failures, mid-stream drops, timeouts and ``429``/``5xx`` responses
+are retried with full-jitter exponential backoff.
+
+Large assets can be fetched over several connections at once
+(``download_parallel``): the asset is split into byte ranges written into a
+preallocated ``.part`` file at their offsets, which helps on high-latency links
+where one TCP connection cannot fill the available bandwidth.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+
+# Seconds to wait for a connection / between received chunks (override with
+# BLUEPRINT_CONNECT_TIMEOUT and BLUEPRINT_READ_TIMEOUT)
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 60.0
+# Attempts after the first one (override with BLUEPRINT_DOWNLOAD_RETRIES)
+DEFAULT_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+CHUNK_SIZE = 64 * 1024
+# Parallel downloads: connections per asset (override with
+# BLUEPRINT_DOWNLOAD_CONNECTIONS; 1 disables) and the smallest range worth its own connection
+DEFAULT_CONNECTIONS = 4
+MIN_SEGMENT_SIZE = 1024 * 1024
+
+RETRY_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class DownloadError(RuntimeError):
+    """A download attempt failed; ``retryable`` says whether another attempt may succeed."""
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def _env_number(name: str, default: float, cast=float):
+    try:
+        return cast(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def download_timeout(timeout: float | None = None) -> httpx.Timeout:
+    """Timeout for asset downloads.
+
+    An explicit timeout applies to the read phase (the time allowed between
+    chunks); the connect phase keeps its own, shorter limit so an unreachable
+    host fails fast.
+    """
+    connect = _env_number("BLUEPRINT_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)
+    read = timeout if timeout is not None else _env_number("BLUEPRINT_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)
+    return httpx.Timeout(read, connect=min(connect, read))
+
+
+def default_retries() -> int:
+    return max(0, _env_number("BLUEPRINT_DOWNLOAD_RETRIES", DEFAULT_RETRIES, int))
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    value = response.headers.get("retry-after", "")
+    try:
+        return min(float(value), BACKOFF_CAP)
+    except ValueError:
+        return None
+
+
+def _validator(headers: httpx.Headers) -> str | None:
+    """The If-Range validator for a response: a strong ETag, else Last-Modified."""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("last-modified")
+
+
+def partial_paths(dest: Path) -> tuple[Path, Path]:
+    """(partial data file, validator sidecar) used while downloading to dest."""
+    return dest.with_name(dest.name + ".part"), dest.with_name(dest.name + ".part.json")
+
+
+def discard_partial(dest: Path) -> None:
+    for path in partial_paths(dest):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _load_state(state_path: Path, url: str) -> dict | None:
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("url") != url or not state.get("validator"):
+        return None
+    return state
+
+
+def _save_state(state_path: Path, url: str, validator: str | None, total: int | None, segments: list[list[int]] | None = None) -> None:
+    state = {"url": url, "validator": validator, "total": total}
+    if segments is not None:
+        state["segments"] = segments
+    with open(state_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+
+def download_file(
+    client: httpx.Client,
+    url: str,
+    dest: Path,
+    *,
+    headers: dict | None = None,
+    expected_size: int | None = None,
+    retries: int | None = None,
+    timeout: float | None = None,
+    on_progress: Callable[[int, int | None], None] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict:
+    """Download url to dest, resuming a previous partial download when possible.
+
+    Args:
+        client: HTTP client (redirects are followed per request)
+        url: Asset URL
+        dest: Final path; the file only appears there once complete
+        headers: Extra request headers (e.g. authorization)
+        expected_size: Size published for the asset; a shorter or longer body is
+            treated as a failed attempt
+        retries: Attempts after the first (default: BLUEPRINT_DOWNLOAD_RETRIES or 5)
+        timeout: Read timeout in seconds (default: BLUEPRINT_READ_TIMEOUT or 60)
+        on_progress: Called with (bytes on disk, total bytes or None) as data arrives
+        sleep: Backoff sleep, replaceable for tests
+
+    Returns:
+        Stats dict with ``bytes`` (downloaded in this call), ``resumed_from``
+        (bytes reused from an earlier partial download), ``attempts`` and ``size``
+
+    Raises:
+        DownloadError: On a non-retryable response or when retries run out. The
+            partial file is kept so a later call can resume it.
+    """
+    retries = default_retries() if retries is None else retries
+    request_timeout = download_timeout(timeout)
+    part_path, state_path = partial_paths(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    state = _load_state(state_path, url)
+    if state is not None and "segments" in state:
+        # A preallocated multi-connection file has holes; its size is not a resume offset
+        discard_partial(dest)
+        state = None
+    if state is None and part_path.exists():
+        # Bytes without a validator cannot be proven to belong to this asset
+        discard_partial(dest)
+    offset = part_path.stat().st_size if state else 0
+    if expected_size is not None and offset > expected_size:
+        discard_partial(dest)
+        state, offset = None, 0
+
+    stats = {"bytes": 0, "resumed_from": offset, "attempts": 0, "size": None}
+    last_error = None
+    for attempt in range(retries + 1):
+        stats["attempts"] += 1
+        request_headers = dict(headers or {})
+        if offset and state and state.get("validator"):
+            request_headers["Range"] = f"bytes={offset}-"
+            request_headers["If-Range"] = state["validator"]
+        delay = None
+        try:
+            with client.stream("GET", url, headers=request_headers, timeout=request_timeout, follow_redirects=True) as response:
+                status = response.status_code
+                if status == 416 and offset and offset == (expected_size or (state or {}).get("total")):
+                    # The earlier attempt already had every byte
+                    break
+                if status == 416:
+                    discard_partial(dest)
+                    state, offset = None, 0
+                    raise DownloadError(f"Server rejected resume at byte {stats['resumed_from']}", retryable=True)
+                if status in RETRY_STATUS:
+                    delay = _retry_after(response)
+                    raise DownloadError(f"Download failed with {status}", retryable=True)
+                if status not in (200, 206):
+                    body_sample = response.read()[:400].decode("utf-8", "replace")
+                    raise DownloadError(f"Download failed with {status}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
+
+                if status == 200:
+                    # Fresh start: no range was sent, or If-Range failed because the asset changed
+                    offset = 0
+                    stats["resumed_from"] = 0
+                    length = response.headers.get("content-length")
+                    total = int(length) if length and length.isdigit() else expected_size
+                    state = {"validator": _validator(response.headers), "total": total}
+                    _save_state(state_path, url, state["validator"], total)
+                    mode = "wb"
+                else:
+                    content_range = response.headers.get("content-range", "")
+                    if not content_range.startswith(f"bytes {offset}-"):
+                        discard_partial(dest)
+                        state, offset = None, 0
+                        raise DownloadError(f"Unexpected Content-Range {content_range!r} resuming at byte {stats['resumed_from']}", retryable=True)
+                    total = state.get("total") or expected_size
+                    mode = "ab" if offset else "wb"
+
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_bytes(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+                        offset += len(chunk)
+                        stats["bytes"] += len(chunk)
+                        if on_progress:
+                            on_progress(offset, total)
+
+                expected = expected_size if expected_size is not None else total
+                if expected is not None and offset != expected:
+                    if offset > expected:
+                        discard_partial(dest)
+                        state, offset = None, 0
+                    raise DownloadError(f"Incomplete download: got {offset:,} of {expected:,} bytes", retryable=True)
+                break
+        except DownloadError as e:
+            if not e.retryable:
+                raise
+            last_error = e
+        except httpx.TransportError as e:
+            # Connection refused/reset, dropped mid-stream, or timed out
+            last_error = e
+            if part_path.exists():
+                offset = part_path.stat().st_size
+        if attempt < retries:
+            sleep(max(delay or 0, backoff_delay(attempt)))
+    else:
+        raise DownloadError(f"Download failed after {stats['attempts']} attempts: {last_error}")
+
+    os.replace(part_path, dest)
+    try:
+        state_path.unlink()
+    except FileNotFoundError:
+        pass
+    stats["size"] = dest.stat().st_size
+    return stats
+
+
+def default_connections() -> int:
+    return max(1, _env_number("BLUEPRINT_DOWNLOAD_CONNECTIONS", DEFAULT_CONNECTIONS, int))
+
+
+def plan_segments(total: int, connections: int, min_segment: int = MIN_SEGMENT_SIZE) -> list[list[int]]:
+    """Split total bytes into at most connections ranges of at least min_segment bytes.
+
+    Each segment is ``[start, end, written]`` with an inclusive end.
+    """
+    count = max(1, min(connections, total // min_segment))
+    size = -(-total // count)
+    return [[start, min(start + size, total) - 1, 0] for start in range(0, total, size)]
+
+
+class _AssetChanged(Exception):
+    """A ranged request came back as a full 200: the asset no longer matches the validator."""
+
+
+def _fetch_segment(
+    client: httpx.Client,
+    url: str,
+    part_path: Path,
+    segment: list[int],
+    *,
+    validator: str,
+    headers: dict | None,
+    timeout: httpx.Timeout,
+    retries: int,
+    sleep: Callable[[float], None],
+    report: Callable[[int], None],
+    changed: threading.Event,
+) -> int:
+    """Fill one segment of the preallocated part file, resuming it on retry. Returns the attempts used."""
+    start, end = segment[0], segment[1]
+    last_error = None
+    for attempt in range(retries + 1):
+        offset = start + segment[2]
+        if offset > end:
+            return attempt
+        request_headers = {**(headers or {}), "Range": f"bytes={offset}-{end}", "If-Range": validator}
+        delay = None
+        try:
+            with client.stream("GET", url, headers=request_headers, timeout=timeout, follow_redirects=True) as response:
+                status = response.status_code
+                if status == 200:
+                    changed.set()
+                    raise _AssetChanged()
+                if status in RETRY_STATUS:
+                    delay = _retry_after(response)
+                    raise DownloadError(f"Download failed with {status}", retryable=True)
+                if status != 206:
+                    raise DownloadError(f"Download failed with {status} for bytes {offset}-{end}")
+                content_range = response.headers.get("content-range", "")
+                if not content_range.startswith(f"bytes {offset}-"):
+                    raise DownloadError(f"Unexpected Content-Range {content_range!r} for bytes {offset}-{end}")
+                with open(part_path, "r+b") as f:
+                    f.seek(offset)
+                    for chunk in response.iter_bytes(chunk_size=CHUNK_SIZE):
+                        if changed.is_set():
+                            # Another segment found a new asset version; these bytes are stale
+                            raise _AssetChanged()
+                        chunk = chunk[: end + 1 - offset]
+                        f.write(chunk)
+                        offset += len(chunk)
+                        segment[2] += len(chunk)
+                        report(len(chunk))
+                        if offset > end:
+                            # Some servers send past the requested end; the rest belongs to other segments
+                            break
+                if offset != end + 1:
+                    raise DownloadError(f"Incomplete segment: got bytes {start}-{offset - 1} of {start}-{end}", retryable=True)
+                return attempt + 1
+        except DownloadError as e:
+            if not e.retryable:
+                raise
+            last_error = e
+        except httpx.TransportError as e:
+            last_error = e
+        if attempt < retries:
+            sleep(max(delay or 0, backoff_delay(attempt)))
+    raise DownloadError(f"Download of bytes {start}-{end} failed after {retries + 1} attempts: {last_error}")
+
+
+def download_parallel(
+    client: httpx.Client,
+    url: str,
+    dest: Path,
+    *,
+    headers: dict | None = None,
+    expected_size: int | None = None,
+    connections: int | None = None,
+    retries: int | None = None,
+    timeout: float | None = None,
+    on_progress: Callable[[int, int | None], None] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict:
+    """Download url to dest over several connections, each fetching one byte range.
+
+    The part file is preallocated to the full size and every segment is written
+    at its own offset, so no reassembly step is needed. Segments retry and
+    resume independently; if they run out of retries, their progress is saved
+    in the sidecar so a later call fetches only the missing bytes.
+
+    Falls back to download_file (one stream) when the asset is too small to
+    split, its size is unknown, the server does not advertise ``Accept-Ranges``
+    or sends no validator, or the asset changes mid-download.
+
+    Returns:
+        download_file's stats plus ``connections`` (1 for a single stream)
+    """
+    retries = default_retries() if retries is None else retries
+    connections = default_connections() if connections is None else max(1, connections)
+    part_path, state_path = partial_paths(dest)
+
+    def single() -> dict:
+        stats = download_file(client, url, dest, headers=headers, expected_size=expected_size, retries=retries, timeout=timeout, on_progress=on_progress, sleep=sleep)
+        return {**stats, "connections": 1}
+
+    state = _load_state(state_path, url)
+    resumable = (
+        state is not None
+        and state.get("total") == expected_size
+        and part_path.exists()
+        and part_path.stat().st_size == expected_size
+    )
+    if resumable and "segments" not in state:
+        # A single-stream partial; finish it the same way
+        return single()
+    if expected_size is None or (not resumable and len(plan_segments(expected_size, connections)) < 2):
+        return single()
+
+    request_timeout = download_timeout(timeout)
+    attempts = 0
+    if resumable:
+        validator, segments = state["validator"], state["segments"]
+    else:
+        discard_partial(dest)
+        # Probe for range support and the validator with a one-byte request
+        attempts += 1
+        try:
+            with client.stream("GET", url, headers={**(headers or {}), "Range": "bytes=0-0"}, timeout=request_timeout, follow_redirects=True) as response:
+                status = response.status_code
+                response_headers = response.headers
+        except httpx.TransportError:
+            return single()
+        validator = _validator(response_headers)
+        total = response_headers.get("content-range", "").rpartition("/")[2]
+        if (
+            status != 206
+            or response_headers.get("accept-ranges", "").lower() != "bytes"
+            or not validator
+            or total != str(expected_size)
+        ):
+            return single()
+        segments = plan_segments(expected_size, connections)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(part_path, "wb") as f:
+            f.truncate(expected_size)
+
+    resumed_from = sum(segment[2] for segment in segments)
+    done = [resumed_from]
+    lock = threading.Lock()
+    changed = threading.Event()
+
+    def report(count: int) -> None:
+        with lock:
+            done[0] += count
+            if on_progress:
+                on_progress(done[0], expected_size)
+
+    pending = [segment for segment in segments if segment[0] + segment[2] <= segment[1]]
+    error: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=max(1, len(pending))) as pool:
+        futures = [
+            pool.submit(
+                _fetch_segment, client, url, part_path, segment,
+                validator=validator, headers=headers, timeout=request_timeout,
+                retries=retries, sleep=sleep, report=report, changed=changed,
+            )
+            for segment in pending
+        ]
+        for future in futures:
+            try:
+                attempts += future.result()
+            except (DownloadError, _AssetChanged, OSError) as e:
+                error = error or e
+
+    if isinstance(error, _AssetChanged):
+        discard_partial(dest)
+        return single()
+    if error is not None:
+        _save_state(state_path, url, validator, expected_size, segments)
+        raise error if isinstance(error, DownloadError) else DownloadError(str(error))
+
+    os.replace(part_path, dest)
+    try:
+        state_path.unlink()
+    except FileNotFoundError:
+        pass
+    return {
+        "bytes": done[0] - resumed_from,
+        "resumed_from": resumed_from,
+        "attempts": attempts,
+        "size": dest.stat().st_size,
+        "connections": len(segments),
+    }
@@ -0,0 +1,136 @@
+"""Feature allocation service for the Blueprint-Kit CLI.
+
+Feature directories live under ``.blueprint/specs/<NNN>-<slug>``. Rather than
+listing every spec directory to find the next number, the next free number is
+kept in a small index together with the specs directory mtime and link count it
+was computed against. Allocation takes an exclusive file lock, so concurrent
+``blueprint feature new`` runs never hand out the same number, and only
+rescans the specs directory when that signature no longer matches (someone
+created, renamed or removed a feature by hand).
+
+The index and its lock are machine-local state, so they live in the user cache
+directory keyed on the project root rather than in the tracked ``.blueprint/``.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from ..core.utils import file_lock
+from .cache import default_cache_dir, write_json_atomic
+
+
+INDEX_VERSION = 1
+SPECS_DIR = Path(".blueprint") / "specs"
+# Where earlier versions kept the index; removed on the next allocation
+LEGACY_FILES = (Path(".blueprint") / "feature-index.json", Path(".blueprint") / "feature-index.lock")
+
+_FEATURE_NUM_RE = re.compile(r'^(\d+)')
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9]')
+_SLUG_DASHES_RE = re.compile(r'-+')
+
+
+def find_project_root(start: Path | None = None) -> Path:
+    """Return the nearest directory containing ``.blueprint`` or ``.git``, else start."""
+    start = (start or Path.cwd()).resolve()
+    for candidate in (start, *start.parents):
+        if (candidate / ".blueprint").is_dir() or (candidate / ".git").exists():
+            return candidate
+    return start
+
+
+def slugify(description: str) -> str:
+    """Turn a feature description into a branch slug (same rules as create-new-feature.sh)."""
+    slug = _SLUG_INVALID_RE.sub('-', description.lower())
+    return _SLUG_DASHES_RE.sub('-', slug).strip('-')
+
+
+def scan_max_feature_number(specs_dir: Path) -> int:
+    """Return the highest ``NNN`` prefix among feature directories (0 if none)."""
+    highest = 0
+    try:
+        with os.scandir(specs_dir) as it:
+            for entry in it:
+                match = _FEATURE_NUM_RE.match(entry.name)
+                if match and entry.is_dir():
+                    highest = max(highest, int(match.group(1)))
+    except OSError:
+        pass
+    return highest
+
+
+def _dir_signature(path: Path) -> list | None:
+    """mtime plus link count: the link count also moves on filesystems with coarse mtimes."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_nlink]
+
+
+class FeatureIndex:
+    """Persisted next-feature counter for one project."""
+
+    def __init__(self, root: Path, cache_root: Path | None = None):
+        self.root = Path(root)
+        self.specs_dir = self.root / SPECS_DIR
+        digest = hashlib.sha256(str(self.root.resolve()).encode("utf-8")).hexdigest()[:16]
+        base = cache_root or default_cache_dir() / "features"
+        self.index_path = base / f"{digest}.json"
+        self.lock_path = base / f"{digest}.lock"
+        self.rescanned = False
+
+    def _load(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        return data
+
+    def _next_number(self, index: dict) -> int:
+        """Trust the stored counter while the specs directory is untouched; rescan otherwise."""
+        signature = _dir_signature(self.specs_dir)
+        if index and isinstance(index.get("next"), int) and index.get("specs_signature") == signature:
+            return index["next"]
+        self.rescanned = True
+        return scan_max_feature_number(self.specs_dir) + 1
+
+    def allocate(self, description: str) -> dict:
+        """Reserve the next feature number and create its directory.
+
+        Returns:
+            Dict with ``number`` (int), ``feature_num`` (zero-padded), ``branch_name``
+            and ``feature_dir`` (Path)
+        """
+        with file_lock(self.lock_path):
+            self.specs_dir.mkdir(parents=True, exist_ok=True)
+            index = self._load()
+            number = self._next_number(index)
+            feature_num = f"{number:03d}"
+            slug = slugify(description)
+            branch_name = f"{feature_num}-{slug}" if slug else f"{feature_num}-feature"
+            feature_dir = self.specs_dir / branch_name
+            # Directory is created while the lock is held so the recorded signature
+            # already reflects it and the next allocation stays on the fast path
+            feature_dir.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(self.index_path, {
+                "version": INDEX_VERSION,
+                "next": number + 1,
+                "specs_signature": _dir_signature(self.specs_dir),
+            })
+            for legacy in LEGACY_FILES:
+                try:
+                    (self.root / legacy).unlink()
+                except OSError:
+                    pass
+        return {
+            "number": number,
+            "feature_num": feature_num,
+            "branch_name": branch_name,
+            "feature_dir": feature_dir,
+        }
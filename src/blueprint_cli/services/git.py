@@ -5,6 +5,16 @@ import shutil
 from pathlib import Path
 from typing import Tuple
 
+from ..core.tracing import span
+
+
+def _run_git(args: list[str], cwd: Path, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run(["git", *args]) recorded as a ``git`` span."""
+    with span(f"git {args[0]}", "git", cwd=str(cwd)) as trace:
+        result = subprocess.run(["git", *args], cwd=cwd, **kwargs)
+        trace["returncode"] = result.returncode
+        return result
+
 
 def check_tool(tool: str, tracker: 'StepTracker' = None) -> bool:
     """Check if a tool is installed. Optionally update tracker.
@@ -51,12 +61,7 @@ def is_git_repo(path: Path = None) -> bool:
 
     try:
         # Use git command to check if inside a work tree
-        subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            check=True,
-            capture_output=True,
-            cwd=path,
-        )
+        _run_git(["rev-parse", "--is-inside-work-tree"], path, check=True, capture_output=True)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
@@ -73,16 +78,14 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, str |
         Tuple of (success: bool, error_message: str | None)
     """
     try:
-        original_cwd = Path.cwd()
-        import os
-        os.chdir(project_path)
         if not quiet:
             from rich.console import Console
             console = Console()
             console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit from Blueprint-Kit template"], check=True, capture_output=True, text=True)
+        # Run with cwd= rather than os.chdir so concurrent callers (init-batch) don't race
+        _run_git(["init"], project_path, check=True, capture_output=True, text=True)
+        _run_git(["add", "."], project_path, check=True, capture_output=True, text=True)
+        _run_git(["commit", "-m", "Initial commit from Blueprint-Kit template"], project_path, check=True, capture_output=True, text=True)
         if not quiet:
             from rich.console import Console
             console = Console()
@@ -101,6 +104,3 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, str |
             console = Console()
             console.print(f"[red]Error initializing git repository:[/red] {e}")
         return False, error_msg
-    finally:
-        import os
-        os.chdir(original_cwd)
\ No newline at end of file
@@ -7,55 +7,168 @@ from pathlib import Path
 import zipfile
 import tempfile
 import shutil
-from typing import Tuple
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
 import typer
 
+from ..core.tracing import http_event_hooks
 from ..core.utils import _github_auth_headers
+from .cache import TemplateCache, file_sha256
+from .download import DownloadError, discard_partial, download_parallel, partial_paths
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
 
+REPO_OWNER = "nom-nom-hub"
+REPO_NAME = "blueprint-kit"
+
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the shared system-trust SSL context, built on first use rather than at import."""
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+
+def _asset_sha256(asset: dict) -> str | None:
+    """Return the SHA-256 published by GitHub for a release asset, if any."""
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest.split(":", 1)[1].lower()
+    return None
+
+
+def release_api_url(tag: str | None = None) -> str:
+    """GitHub API URL for a release by tag, or for the latest release."""
+    base = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/releases"
+    return f"{base}/tags/{tag}" if tag else f"{base}/latest"
+
+
+def fetch_release_metadata(api_url: str, *, client: httpx.Client, cache: TemplateCache | None = None, revalidate: bool = False, debug: bool = False, github_token: str = None) -> Tuple[dict, str]:
+    """Return (release_data, source) for a GitHub release API URL.
+
+    source is "cached" when the stored metadata is within the cache TTL (no request made),
+    "revalidated" when a conditional GET returned 304, and "fetched" for a full response.
+    revalidate=True skips the TTL shortcut but still sends the stored validators.
+    """
+    entry = cache.load_release(api_url) if cache is not None else None
+    if entry and not revalidate and cache.release_is_fresh(entry):
+        return entry["data"], "cached"
+
+    headers = dict(_github_auth_headers(github_token) or {})
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = client.get(
+        api_url,
+        timeout=30,
+        follow_redirects=True,
+        headers=headers or None,
+    )
+    status = response.status_code
+    if status == 304 and entry:
+        cache.touch_release(api_url, entry)
+        return entry["data"], "revalidated"
+    if status != 200:
+        msg = f"GitHub API returned {status} for {api_url}"
+        if debug:
+            msg += f"\nResponse headers: {response.headers}\nBody (truncated 500): {response.text[:500]}"
+        raise RuntimeError(msg)
+    try:
+        release_data = response.json()
+    except ValueError as je:
+        raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+
+    if cache is not None:
+        cache.store_release(
+            api_url,
+            release_data,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+    return release_data, "fetched"
+
+
+def _download_asset(client: httpx.Client, url: str, dest: Path, *, show_progress: bool, console: "Console", **kwargs) -> dict:
+    """download_parallel with an optional Rich progress bar."""
+    if not show_progress:
+        return download_parallel(client, url, dest, **kwargs)
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Downloading...", total=kwargs.get("expected_size"))
+        return download_parallel(client, url, dest, on_progress=lambda done, total: progress.update(task, completed=done, total=total), **kwargs)
+
+
+def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None, cache: TemplateCache | None = None, offline: bool = False, refresh_cache: bool = False, timeout: float | None = None, retries: int | None = None, connections: int | None = None, console: "Console | None" = None) -> Tuple[Path, dict]:
+    """Download the latest template archive for an agent/script combination.
+
+    Status, progress and errors go to the caller's console (stderr when none is
+    given), so a caller streaming machine-readable output on stdout stays clean.
+
+    When a TemplateCache is supplied, archives are served from and stored into it.
+    The returned metadata carries ``cache`` ("hit", "miss", "refresh", "offline" or None)
+    and ``cached`` (True when the returned path is owned by the cache and must not be deleted).
+    Downloads are retried and resumed (see services/download.py), and large assets
+    are split over ``connections`` parallel ranged requests; with a cache an
+    interrupted download also resumes on the next run. A completed download adds
+    ``transfer`` stats (bytes, resumed_from, attempts, connections) to the metadata.
+    """
+    if console is None:
+        from rich.console import Console
+        console = Console(stderr=True)
+    pattern = f"blueprint-kit-template-{ai_assistant}-{script_type}"
+
+    if offline:
+        cached = cache.latest(pattern) if cache else None
+        if cached is None:
+            console.print(f"[red]No cached template available offline[/red] for [bold]{pattern}[/bold]")
+            raise typer.Exit(1)
+        zip_path, entry = cached
+        if verbose:
+            console.print(f"[cyan]Using cached template (offline):[/cyan] {entry['filename']} ({entry['release']})")
+        metadata = {
+            "filename": entry["filename"],
+            "size": entry["size"],
+            "release": entry["release"],
+            "asset_url": None,
+            "sha256": entry["sha256"],
+            "cache": "offline",
+            "cached": True,
+        }
+        return zip_path, metadata
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Tuple[Path, dict]:
-    repo_owner = "nom-nom-hub"
-    repo_name = "blueprint-kit"
     if client is None:
-        client = httpx.Client(verify=ssl_context)
+        client = httpx.Client(verify=get_ssl_context(), event_hooks=http_event_hooks())
 
     if verbose:
-        from rich.console import Console
-        console = Console()
         console.print("[cyan]Fetching latest release information...[/cyan]")
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+    api_url = release_api_url()
 
     try:
-        response = client.get(
+        release_data, release_source = fetch_release_metadata(
             api_url,
-            timeout=30,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
+            client=client,
+            cache=cache,
+            revalidate=refresh_cache,
+            debug=debug,
+            github_token=github_token,
         )
-        status = response.status_code
-        if status != 200:
-            msg = f"GitHub API returned {status} for {api_url}"
-            if debug:
-                msg += f"\nResponse headers: {response.headers}\nBody (truncated 500): {response.text[:500]}"
-            raise RuntimeError(msg)
-        try:
-            release_data = response.json()
-        except ValueError as je:
-            raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
     except Exception as e:
-        from rich.console import Console
         from rich.panel import Panel
-        console = Console()
         console.print(f"[red]Error fetching release information[/red]")
         console.print(Panel(str(e), title="Fetch Error", border_style="red"))
         raise typer.Exit(1)
 
     assets = release_data.get("assets", [])
-    pattern = f"blueprint-kit-template-{ai_assistant}-{script_type}"
     matching_assets = [
         asset for asset in assets
         if pattern in asset["name"] and asset["name"].endswith(".zip")
@@ -64,9 +177,7 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
     asset = matching_assets[0] if matching_assets else None
 
     if asset is None:
-        from rich.console import Console
         from rich.panel import Panel
-        console = Console()
         console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
         asset_names = [a.get('name', '?') for a in assets]
         console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
@@ -77,72 +188,84 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
     file_size = asset["size"]
 
     if verbose:
-        from rich.console import Console
-        console = Console()
         console.print(f"[cyan]Found template:[/cyan] {filename}")
         console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
         console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
 
-    zip_path = download_dir / filename
+    tag_name = release_data["tag_name"]
+    expected_sha = _asset_sha256(asset)
+    cache_status = None
+    if cache is not None:
+        if not refresh_cache:
+            cached_path = cache.lookup(tag_name, filename, sha256=expected_sha, size=file_size)
+            if cached_path is not None:
+                if verbose:
+                    console.print(f"[cyan]Using cached template:[/cyan] {cached_path}")
+                metadata = {
+                    "filename": filename,
+                    "size": file_size,
+                    "release": tag_name,
+                    "asset_url": download_url,
+                    "sha256": cached_path.stem,
+                    "release_source": release_source,
+                    "cache": "hit",
+                    "cached": True,
+                }
+                return cached_path, metadata
+        cache_status = "refresh" if refresh_cache else "miss"
     if verbose:
-        from rich.console import Console
-        console = Console()
         console.print(f"[cyan]Downloading template...[/cyan]")
 
-    try:
-        with client.stream(
-            "GET",
-            download_url,
-            timeout=60,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        ) as response:
-            if response.status_code != 200:
-                body_sample = response.text[:400]
-                raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
-            total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                else:
-                    if show_progress:
-                        from rich.console import Console
-                        from rich.progress import Progress, SpinnerColumn, TextColumn
-                        console = Console()
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                progress.update(task, completed=downloaded)
-                    else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
-                            f.write(chunk)
-    except Exception as e:
-        from rich.console import Console
-        from rich.panel import Panel
-        console = Console()
-        console.print(f"[red]Error downloading template[/red]")
-        detail = str(e)
-        if zip_path.exists():
-            zip_path.unlink()
-        console.print(Panel(detail, title="Download Error", border_style="red"))
-        raise typer.Exit(1)
-    if verbose:
-        from rich.console import Console
-        console = Console()
-        console.print(f"Downloaded: {filename}")
+    with ExitStack() as stack:
+        if cache is not None:
+            zip_path, resumable = stack.enter_context(cache.download_slot(tag_name, filename))
+        else:
+            zip_path, resumable = download_dir / filename, False
+        try:
+            transfer = _download_asset(
+                client,
+                download_url,
+                zip_path,
+                headers=_github_auth_headers(github_token),
+                expected_size=file_size,
+                retries=retries,
+                timeout=timeout,
+                connections=connections,
+                show_progress=show_progress,
+                console=console,
+            )
+        except (DownloadError, httpx.HTTPError, OSError) as e:
+            from rich.panel import Panel
+            console.print(f"[red]Error downloading template[/red]")
+            if not resumable:
+                discard_partial(zip_path)
+            detail = str(e)
+            if resumable and partial_paths(zip_path)[0].exists():
+                detail += "\n\nThe partial download was kept and will resume on the next run."
+            console.print(Panel(detail, title="Download Error", border_style="red"))
+            raise typer.Exit(1)
+        if verbose:
+            resumed = f" (resumed at {transfer['resumed_from']:,} bytes)" if transfer["resumed_from"] else ""
+            console.print(f"Downloaded: {filename}{resumed}")
+
+        sha256 = None
+        if cache is not None:
+            sha256 = file_sha256(zip_path)
+            if expected_sha and sha256 != expected_sha:
+                zip_path.unlink()
+                console.print(f"[red]Checksum mismatch[/red] for {filename}: expected {expected_sha}, got {sha256}")
+                raise typer.Exit(1)
+            zip_path = cache.store(tag_name, filename, zip_path, sha256=sha256)
+
     metadata = {
         "filename": filename,
         "size": file_size,
-        "release": release_data["tag_name"],
-        "asset_url": download_url
+        "release": tag_name,
+        "asset_url": download_url,
+        "sha256": sha256,
+        "release_source": release_source,
+        "cache": cache_status,
+        "cached": cache is not None,
+        "transfer": transfer,
     }
     return zip_path, metadata
\ No newline at end of file
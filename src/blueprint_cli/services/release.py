@@ -0,0 +1,287 @@
+"""Release package builder for the Blueprint-Kit CLI.
+
+Python port of ``.github/workflows/scripts/create-release-packages.sh``. The
+archives have the same layout and command file contents as the shell script's,
+but the work is shared:
+
+- every command template is parsed once into per-variant text with the
+  ``{SCRIPT}``/``{AGENT_SCRIPT}`` substitution, frontmatter cleanup and path
+  rewrite already applied, so rendering an agent's file is two replacements;
+- files shared by many archives (``memory/``, ``scripts/``, ``templates/``) are
+  deflated once and the compressed bytes are reused by every archive;
+- archives are written concurrently in a process pool as byte-reproducible zips
+  (sorted members, fixed timestamps and permissions), so identical inputs give
+  identical hashes.
+
+Next to each archive a small manifest lists every file in it with its SHA-256
+and byte range, which ``blueprint upgrade`` uses to fetch only the files that
+changed between releases.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ..core.agent_config import RELEASE_PACKAGE_CONFIG
+from .archive import compress_entry, write_reproducible_zip, zip_timestamp
+
+
+SCRIPT_VARIANTS = ("sh", "ps")
+SCRIPT_DIRS = {"sh": "bash", "ps": "powershell"}
+VERSION_RE = re.compile(r'^v\d+\.\d+\.\d+$')
+MANIFEST_VERSION = 1
+
+# Stand-ins for the per-agent values while the rest of the body is pre-rendered
+_ARGS_SENTINEL = "\x00"
+_AGENT_SENTINEL = "\x01"
+# Same rewrite as the shell script's rewrite_paths, but paths already under
+# .blueprint/ are left alone instead of becoming .blueprint.blueprint/
+_RELEASE_PATH_RE = re.compile(r'(?<!\.blueprint)(?<!\.blueprint/)/?(memory|scripts|templates)/')
+
+
+def archive_name(agent: str, script: str, version: str) -> str:
+    return f"blueprint-kit-template-{agent}-{script}-{version}.zip"
+
+
+def manifest_name(agent: str, script: str, version: str) -> str:
+    return f"blueprint-kit-template-{agent}-{script}-{version}.manifest.json"
+
+
+def _frontmatter_value(lines: list[str], key: str) -> str | None:
+    pattern = re.compile(rf'^\s*{re.escape(key)}:\s*')
+    for line in lines:
+        match = pattern.match(line)
+        if match:
+            return line[match.end():]
+    return None
+
+
+def _agent_script(lines: list[str], variant: str) -> str | None:
+    pattern = re.compile(rf'^\s*{re.escape(variant)}:\s*')
+    inside = False
+    for line in lines:
+        if line == "agent_scripts:":
+            inside = True
+            continue
+        if inside:
+            match = pattern.match(line)
+            if match:
+                return line[match.end():]
+            if re.match(r'^[a-zA-Z]', line):
+                inside = False
+    return None
+
+
+def _strip_script_sections(lines: list[str]) -> list[str]:
+    """Drop the ``scripts:`` and ``agent_scripts:`` blocks from the frontmatter."""
+    out = []
+    dashes = 0
+    in_frontmatter = skipping = False
+    for line in lines:
+        if line == "---":
+            out.append(line)
+            dashes += 1
+            in_frontmatter = dashes == 1
+            continue
+        if in_frontmatter and line in ("scripts:", "agent_scripts:"):
+            skipping = True
+            continue
+        if in_frontmatter and skipping and re.match(r'^[a-zA-Z].*:', line):
+            skipping = False
+        if in_frontmatter and skipping and re.match(r'^\s', line):
+            continue
+        out.append(line)
+    return out
+
+
+def parse_release_template(content: str, warnings: list[str] | None = None, name: str = "") -> dict:
+    """Parse one command template into its description and pre-rendered per-variant bodies."""
+    content = content.replace("\r", "")
+    lines = content.split("\n")
+    description = _frontmatter_value([l for l in lines if l.startswith("description:")], "description") or ""
+    variants = {}
+    for variant in SCRIPT_VARIANTS:
+        script_command = _frontmatter_value(lines, variant)
+        if not script_command:
+            if warnings is not None:
+                warnings.append(f"No script command found for {variant} in {name or 'template'}")
+            script_command = f"(Missing script command for {variant})"
+        body = content.replace("{SCRIPT}", script_command)
+        agent_script = _agent_script(lines, variant)
+        if agent_script:
+            body = body.replace("{AGENT_SCRIPT}", agent_script)
+        body = "\n".join(_strip_script_sections(body.split("\n")))
+        body = body.replace("{ARGS}", _ARGS_SENTINEL).replace("__AGENT__", _AGENT_SENTINEL)
+        variants[variant] = _RELEASE_PATH_RE.sub(r'.blueprint/\1/', body).rstrip("\n")
+    return {"description": description, "variants": variants}
+
+
+def render_release_command(template: dict, agent: str, variant: str, ext: str, arg_format: str) -> str:
+    """Render a parsed template into the agent's command file content."""
+    body = template["variants"][variant].replace(_ARGS_SENTINEL, arg_format).replace(_AGENT_SENTINEL, agent)
+    if ext == "toml":
+        body = body.replace("\\", "\\\\")
+        return f'description = "{template["description"]}"\n\nprompt = """\n{body}\n"""\n'
+    return body + "\n"
+
+
+def _file_mode(path: Path) -> int:
+    return 0o755 if path.stat().st_mode & 0o100 else 0o644
+
+
+def shared_files(source: Path) -> dict[str, list[tuple[Path, str]]]:
+    """Files copied into every archive of a script variant, as (source path, archive name)."""
+    common: list[tuple[Path, str]] = []
+    memory = source / "memory"
+    if memory.is_dir():
+        common += [(p, f".blueprint/memory/{p.relative_to(memory).as_posix()}") for p in memory.rglob("*") if p.is_file()]
+    templates = source / "templates"
+    if templates.is_dir():
+        for p in templates.rglob("*"):
+            rel = p.relative_to(templates)
+            if p.is_file() and rel.parts[0] != "commands" and p.name != "vscode-settings.json":
+                common.append((p, f".blueprint/templates/{rel.as_posix()}"))
+
+    scripts = source / "scripts"
+    by_variant = {}
+    for variant in SCRIPT_VARIANTS:
+        files = list(common)
+        if scripts.is_dir():
+            files += [(p, f".blueprint/scripts/{p.name}") for p in scripts.iterdir() if p.is_file()]
+            variant_dir = scripts / SCRIPT_DIRS[variant]
+            if variant_dir.is_dir():
+                files += [(p, f".blueprint/scripts/{SCRIPT_DIRS[variant]}/{p.relative_to(variant_dir).as_posix()}") for p in variant_dir.rglob("*") if p.is_file()]
+        by_variant[variant] = sorted(files, key=lambda item: item[1])
+    return by_variant
+
+
+# Per-worker state set once by _init_worker, so each job only carries (agent, variant)
+_worker_state: dict = {}
+
+
+def _init_worker(state: dict) -> None:
+    _worker_state.clear()
+    _worker_state.update(state)
+
+
+def _build_archive(agent: str, variant: str) -> dict:
+    state = _worker_state
+    config = RELEASE_PACKAGE_CONFIG[agent]
+    entries = [state["compressed"][name] for name in state["shared"][variant]]
+    for name, template in state["templates"].items():
+        content = render_release_command(template, agent, variant, config["ext"], config["arg_format"])
+        entries.append(compress_entry(f"{config['dir']}/blueprint.{name}.{config['ext']}", content.encode("utf-8")))
+    for src, dest in config["extra_files"].items():
+        path = Path(state["source"]) / src
+        if path.is_file():
+            entries.append(compress_entry(dest, path.read_bytes(), _file_mode(path)))
+
+    target = Path(state["output"]) / archive_name(agent, variant, state["version"])
+    layout = write_reproducible_zip(target, entries, state["timestamp"])
+    digest = hashlib.sha256()
+    with open(target, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    manifest_path = Path(state["output"]) / manifest_name(agent, variant, state["version"])
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "release": state["version"],
+        "agent": agent,
+        "script": variant,
+        "archive": target.name,
+        "sha256": digest.hexdigest(),
+        "size": target.stat().st_size,
+        "files": {
+            m["name"]: {"sha256": m["sha256"], "size": m["size"], "mode": m["mode"], "method": m["method"], "offset": m["offset"], "compressed_size": m["compressed_size"]}
+            for m in layout
+        },
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"), sort_keys=True)
+    return {
+        "agent": agent,
+        "script": variant,
+        "file": str(target),
+        "manifest": str(manifest_path),
+        "sha256": manifest["sha256"],
+        "size": manifest["size"],
+        "files": len(entries),
+    }
+
+
+def build_release(
+    source: Path,
+    output: Path,
+    version: str,
+    agents: list[str] | None = None,
+    scripts: list[str] | None = None,
+    jobs: int | None = None,
+) -> dict:
+    """Build every agent x script-variant template archive for a release.
+
+    Args:
+        source: Repository checkout holding templates/, memory/ and scripts/
+        output: Directory the archives are written to (created if missing)
+        version: Release tag, e.g. ``v0.2.0``
+        agents: Subset of ``RELEASE_PACKAGE_CONFIG`` (default: all)
+        scripts: Subset of ``SCRIPT_VARIANTS`` (default: both)
+        jobs: Worker processes (default: CPU count; 1 builds in-process)
+
+    Returns:
+        Dict with ``archives`` (agent, script, file, manifest, sha256, size,
+        files), ``warnings``, ``templates``, ``shared_files`` and ``elapsed_ms``
+    """
+    start = time.perf_counter()
+    agents = agents or list(RELEASE_PACKAGE_CONFIG)
+    scripts = scripts or list(SCRIPT_VARIANTS)
+    commands_dir = source / "templates" / "commands"
+    if not commands_dir.is_dir():
+        raise FileNotFoundError(f"No templates/commands directory in {source}")
+
+    warnings: list[str] = []
+    templates = {
+        path.stem: parse_release_template(path.read_text(encoding="utf-8"), warnings, str(path.relative_to(source)))
+        for path in sorted(commands_dir.glob("*.md"))
+    }
+
+    # Deflate each shared file once; archives reuse the compressed bytes
+    shared = shared_files(source)
+    compressed = {}
+    for variant in scripts:
+        for path, name in shared[variant]:
+            if name not in compressed:
+                compressed[name] = compress_entry(name, path.read_bytes(), _file_mode(path))
+
+    output.mkdir(parents=True, exist_ok=True)
+    state = {
+        "source": str(source),
+        "output": str(output),
+        "version": version,
+        "timestamp": zip_timestamp(),
+        "templates": templates,
+        "compressed": compressed,
+        "shared": {variant: [name for _, name in shared[variant]] for variant in scripts},
+    }
+    combos = [(agent, variant) for agent in agents for variant in scripts]
+    jobs = min(jobs or os.cpu_count() or 1, len(combos))
+    if jobs <= 1:
+        _init_worker(state)
+        archives = [_build_archive(agent, variant) for agent, variant in combos]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(state,)) as pool:
+            archives = list(pool.map(_build_archive, *zip(*combos)))
+
+    return {
+        "version": version,
+        "archives": archives,
+        "warnings": warnings,
+        "templates": len(templates),
+        "shared_files": len(compressed),
+        "jobs": jobs,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
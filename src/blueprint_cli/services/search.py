@@ -0,0 +1,300 @@
+"""Full-text and near-duplicate search over feature artifacts.
+
+Specs, goals and blueprints are indexed into tables that live in the spec
+catalog database (see ``services/catalog.py``), and are only re-indexed when
+the catalog sees their content hash change:
+
+- ``postings``: an inverted index (term -> document, term frequency) ranked with BM25
+- ``search_docs``: per-document length and a 64-permutation MinHash signature
+  over word 3-gram shingles
+- ``lsh_buckets``: the signature split into 16 bands of 4 rows; documents that
+  share any band bucket are near-duplicate candidates (Jaccard >= ~0.5)
+
+Template boilerplate (headings, ``**Label**:`` prefixes, ``[placeholders]`` and
+review checklists) is stripped before shingling so documents produced from the
+same template are not reported as duplicates of each other.
+"""
+
+import math
+import re
+import sqlite3
+import zlib
+from array import array
+from random import Random
+
+
+SEARCH_KINDS = ("spec", "goals", "blueprint")
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.5
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = Random(0x5EED)  # fixed seed: signatures must be stable across runs
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_HEADING_LINE_RE = re.compile(r'^\s*#')
+_CHECKBOX_LINE_RE = re.compile(r'^\s*[-*+]\s+\[[ xX]\]')
+_LABEL_RE = re.compile(r'\*\*[^*]+\*\*:?')
+_PLACEHOLDER_RE = re.compile(r'\[[^\]]*\]')
+
+STOPWORDS = frozenset("""
+a an and are as at be been but by can could do for from has have how if in into is it its may
+must not of on or should so such than that the their then there these this those to was we were
+what when which who will with would you your
+""".split())
+
+SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_docs (
+    feature TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    signature BLOB,
+    PRIMARY KEY (feature, kind),
+    FOREIGN KEY (feature, kind) REFERENCES artifacts(feature, kind) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    feature TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, feature, kind),
+    FOREIGN KEY (feature, kind) REFERENCES search_docs(feature, kind) ON DELETE CASCADE
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings(feature, kind);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    feature TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    PRIMARY KEY (band, bucket, feature, kind),
+    FOREIGN KEY (feature, kind) REFERENCES search_docs(feature, kind) ON DELETE CASCADE
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS lsh_buckets_doc ON lsh_buckets(feature, kind);
+"""
+
+
+def content_text(text: str) -> str:
+    """Strip template scaffolding, keeping only what the author wrote."""
+    kept = []
+    for line in text.splitlines():
+        if _HEADING_LINE_RE.match(line) or _CHECKBOX_LINE_RE.match(line):
+            continue
+        kept.append(_PLACEHOLDER_RE.sub(' ', _LABEL_RE.sub(' ', line)))
+    return "\n".join(kept)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased alphanumeric tokens without stopwords or single characters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def minhash_signature(tokens: list[str]) -> array | None:
+    """MinHash over word shingles; None when the document is too short to shingle."""
+    if not tokens:
+        return None
+    size = min(SHINGLE_SIZE, len(tokens))
+    shingles = {zlib.crc32(" ".join(tokens[i:i + size]).encode("utf-8")) for i in range(len(tokens) - size + 1)}
+    return array("I", (min((a * x + b) % _MERSENNE_PRIME for x in shingles) & 0xFFFFFFFF for a, b in _PERMUTATIONS))
+
+
+def band_buckets(signature: array) -> list[tuple[int, int]]:
+    """(band, bucket) pairs for LSH lookups."""
+    return [
+        (band, zlib.crc32(signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes()))
+        for band in range(BANDS)
+    ]
+
+
+def similarity(sig_a: array, sig_b: array) -> float:
+    """Estimated Jaccard similarity: the fraction of agreeing MinHash rows."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def _signature_from_blob(blob: bytes | None) -> array | None:
+    if not blob:
+        return None
+    sig = array("I")
+    sig.frombytes(blob)
+    return sig
+
+
+def index_document(conn: sqlite3.Connection, feature: str, kind: str, text: str) -> None:
+    """Replace the search entries for one artifact (call inside the catalog transaction)."""
+    conn.execute("DELETE FROM search_docs WHERE feature = ? AND kind = ?", (feature, kind))
+    tokens = tokenize(content_text(text))
+    signature = minhash_signature(tokens)
+    conn.execute(
+        "INSERT INTO search_docs (feature, kind, length, signature) VALUES (?, ?, ?, ?)",
+        (feature, kind, len(tokens), signature.tobytes() if signature is not None else None),
+    )
+    counts: dict[str, int] = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    conn.executemany(
+        "INSERT INTO postings (term, feature, kind, tf) VALUES (?, ?, ?, ?)",
+        [(term, feature, kind, tf) for term, tf in counts.items()],
+    )
+    if signature is not None:
+        conn.executemany(
+            "INSERT INTO lsh_buckets (band, bucket, feature, kind) VALUES (?, ?, ?, ?)",
+            [(band, bucket, feature, kind) for band, bucket in band_buckets(signature)],
+        )
+
+
+def _kind_filter(kinds, column: str = "kind") -> tuple[str, tuple]:
+    kinds = tuple(kinds or SEARCH_KINDS)
+    return f"{column} IN ({','.join('?' * len(kinds))})", kinds
+
+
+def search(conn: sqlite3.Connection, query: str, *, kinds=None, limit: int = 10) -> list[dict]:
+    """Rank documents for a free-text query with BM25.
+
+    Returns:
+        Up to limit dicts with ``feature``, ``kind``, ``path``, ``title``,
+        ``score`` and ``matched`` (query terms present in the document)
+    """
+    terms = sorted(set(tokenize(query)))
+    if not terms:
+        return []
+    kind_sql, kind_params = _kind_filter(kinds)
+    total, avg_length = conn.execute(
+        f"SELECT COUNT(*), AVG(length) FROM search_docs WHERE {kind_sql}", kind_params
+    ).fetchone()
+    if not total:
+        return []
+    avg_length = avg_length or 1
+
+    scores: dict[tuple[str, str], float] = {}
+    matched: dict[tuple[str, str], list[str]] = {}
+    term_sql = ",".join("?" * len(terms))
+    rows = conn.execute(
+        f"SELECT p.term, p.feature, p.kind, p.tf, d.length FROM postings p"
+        f" JOIN search_docs d ON d.feature = p.feature AND d.kind = p.kind"
+        f" WHERE p.term IN ({term_sql}) AND {_kind_filter(kinds, 'p.kind')[0]}",
+        (*terms, *kind_params),
+    ).fetchall()
+    df: dict[str, int] = {}
+    for term, *_ in rows:
+        df[term] = df.get(term, 0) + 1
+    for term, feature, kind, tf, length in rows:
+        idf = math.log(1 + (total - df[term] + 0.5) / (df[term] + 0.5))
+        norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+        key = (feature, kind)
+        scores[key] = scores.get(key, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+        matched.setdefault(key, []).append(term)
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [_hit(conn, feature, kind, round(score, 4), matched=sorted(matched[(feature, kind)])) for (feature, kind), score in ranked]
+
+
+def _hit(conn: sqlite3.Connection, feature: str, kind: str, score: float, **extra) -> dict:
+    row = conn.execute(
+        "SELECT a.path, COALESCE(a.title, f.title) FROM artifacts a JOIN features f ON f.name = a.feature"
+        " WHERE a.feature = ? AND a.kind = ?",
+        (feature, kind),
+    ).fetchone()
+    return {"feature": feature, "kind": kind, "path": row[0] if row else None, "title": row[1] if row else None, "score": score, **extra}
+
+
+def similar_to_text(conn: sqlite3.Connection, text: str, *, kinds=None, threshold: float = DEFAULT_THRESHOLD, limit: int = 10, exclude: str | None = None) -> list[dict]:
+    """Documents whose estimated Jaccard similarity with text is at least threshold."""
+    signature = minhash_signature(tokenize(content_text(text)))
+    if signature is None:
+        return []
+    kind_sql, kind_params = _kind_filter(kinds, "b.kind")
+    candidates = set()
+    for band, bucket in band_buckets(signature):
+        candidates.update(conn.execute(
+            f"SELECT b.feature, b.kind FROM lsh_buckets b WHERE b.band = ? AND b.bucket = ? AND {kind_sql}",
+            (band, bucket, *kind_params),
+        ).fetchall())
+
+    hits = []
+    for feature, kind in candidates:
+        if feature == exclude:
+            continue
+        row = conn.execute("SELECT signature FROM search_docs WHERE feature = ? AND kind = ?", (feature, kind)).fetchone()
+        other = _signature_from_blob(row[0]) if row else None
+        if other is None:
+            continue
+        score = similarity(signature, other)
+        if score >= threshold:
+            hits.append((score, feature, kind))
+    hits.sort(key=lambda h: (-h[0], h[1], h[2]))
+    return [_hit(conn, feature, kind, round(score, 4)) for score, feature, kind in hits[:limit]]
+
+
+def duplicate_clusters(conn: sqlite3.Connection, *, kinds=None, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """Group documents of the same kind into near-duplicate clusters.
+
+    Candidate pairs come from shared LSH buckets only; each pair is then verified
+    against the full signatures before being unioned into a cluster.
+
+    Returns:
+        Clusters sorted by size, each with ``kind``, ``similarity`` (highest
+        verified pair score) and ``members`` (feature names)
+    """
+    kind_sql, kind_params = _kind_filter(kinds)
+    buckets = conn.execute(
+        f"SELECT kind, GROUP_CONCAT(feature, char(31)) FROM lsh_buckets WHERE {kind_sql}"
+        f" GROUP BY band, bucket, kind HAVING COUNT(*) > 1",
+        kind_params,
+    ).fetchall()
+
+    pairs = set()
+    for kind, members in buckets:
+        names = sorted(members.split("\x1f"))
+        for i, a in enumerate(names):
+            for b in names[i + 1:]:
+                pairs.add((kind, a, b))
+    if not pairs:
+        return []
+
+    signatures: dict[tuple[str, str], array] = {}
+
+    def signature_of(feature, kind):
+        key = (feature, kind)
+        if key not in signatures:
+            row = conn.execute("SELECT signature FROM search_docs WHERE feature = ? AND kind = ?", key).fetchone()
+            signatures[key] = _signature_from_blob(row[0]) if row else None
+        return signatures[key]
+
+    parent: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def find(node):
+        while parent.setdefault(node, node) != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    best: dict[tuple[str, str], float] = {}
+    for kind, a, b in pairs:
+        sig_a, sig_b = signature_of(a, kind), signature_of(b, kind)
+        if sig_a is None or sig_b is None:
+            continue
+        score = similarity(sig_a, sig_b)
+        if score < threshold:
+            continue
+        root_a, root_b = find((kind, a)), find((kind, b))
+        merged = max(score, best.pop(root_a, 0.0), best.pop(root_b, 0.0) if root_b != root_a else 0.0)
+        parent[root_b] = root_a
+        best[root_a] = merged
+
+    groups: dict[tuple[str, str], list[str]] = {}
+    for node in parent:
+        groups.setdefault(find(node), []).append(node[1])
+    clusters = [
+        {"kind": root[0], "similarity": round(best.get(root, 0.0), 4), "members": sorted(members)}
+        for root, members in groups.items()
+        if len(members) > 1
+    ]
+    clusters.sort(key=lambda c: (-len(c["members"]), -c["similarity"], c["members"]))
+    return clusters
@@ -0,0 +1,119 @@
+"""Task completion accounting across features for the Blueprint-Kit CLI.
+
+Counts checked and unchecked tasks in every ``tasks.md`` under
+``.blueprint/specs``, broken down by user story and persona. Counts are cached
+per file in the user cache directory keyed on (mtime, size), so a repeated
+``blueprint status`` only stats each file and re-reads the ones that changed.
+"""
+
+import time
+from pathlib import Path
+
+from .artifacts import PARSER_VERSION, iter_tasks
+from .cache import FileStatCache, default_cache_dir
+from .features import SPECS_DIR, _FEATURE_NUM_RE
+
+
+STATUS_VERSION = 1
+
+UNASSIGNED = "(unassigned)"
+
+
+def count_tasks(path: Path) -> dict:
+    """Stream one tasks.md and return its totals, per-story and per-persona counts."""
+    counts = {"total": 0, "done": 0, "stories": {}, "personas": {}}
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for task in iter_tasks(f):
+            done = int(task["done"])
+            counts["total"] += 1
+            counts["done"] += done
+            story = task["story"]
+            key = str(story["number"]) if story else ""
+            entry = counts["stories"].setdefault(key, {"number": story["number"] if story else None, "title": story["title"] if story else "", "total": 0, "done": 0})
+            entry["total"] += 1
+            entry["done"] += done
+            persona = counts["personas"].setdefault(task["persona"] or UNASSIGNED, {"total": 0, "done": 0})
+            persona["total"] += 1
+            persona["done"] += done
+    return counts
+
+
+def _percent(done: int, total: int) -> float | None:
+    return round(100.0 * done / total, 1) if total else None
+
+
+class StatusCache(FileStatCache):
+    """Per-project cache of task counts keyed on each tasks.md's (mtime, size)."""
+
+    def __init__(self, root: Path, cache_root: Path | None = None, enabled: bool = True):
+        super().__init__(root, cache_root or default_cache_dir() / "status", [STATUS_VERSION, PARSER_VERSION], enabled)
+        self.stats = {"reused": 0, "read": 0}
+
+    def get(self, feature: str, path: Path) -> dict | None:
+        """Counts for path, or None when the feature has no tasks.md."""
+        st = self.stat(feature, path)
+        if st is None:
+            return None
+        entry = self.fresh(feature, st)
+        if entry:
+            self.stats["reused"] += 1
+            return entry["counts"]
+        self.stats["read"] += 1
+        counts = count_tasks(path)
+        self.put(feature, st, counts=counts)
+        return counts
+
+
+def project_status(root: Path, features: list[str] | None = None, use_cache: bool = True) -> dict:
+    """Completion report for every feature (or the named ones) under root.
+
+    Returns:
+        Dict with ``features`` (name, tasks_file, total, done, percent, stories,
+        personas), project-wide ``totals`` and ``personas``, and ``cache`` stats
+    """
+    start = time.perf_counter()
+    specs_dir = root / SPECS_DIR
+    try:
+        names = sorted(p.name for p in specs_dir.iterdir() if p.is_dir() and _FEATURE_NUM_RE.match(p.name))
+    except OSError:
+        names = []
+    cache = StatusCache(root, enabled=use_cache)
+    if features is None:
+        cache.prune(set(names))
+    else:
+        names = [name for name in names if name in features]
+
+    report_features = []
+    totals = {"total": 0, "done": 0}
+    personas: dict[str, dict] = {}
+    for name in names:
+        tasks_file = specs_dir / name / "tasks.md"
+        counts = cache.get(name, tasks_file)
+        if counts is None:
+            report_features.append({"name": name, "tasks_file": None, "total": 0, "done": 0, "percent": None, "stories": [], "personas": []})
+            continue
+        totals["total"] += counts["total"]
+        totals["done"] += counts["done"]
+        for persona, c in counts["personas"].items():
+            entry = personas.setdefault(persona, {"total": 0, "done": 0})
+            entry["total"] += c["total"]
+            entry["done"] += c["done"]
+        stories = sorted(counts["stories"].values(), key=lambda s: (s["number"] is not None, s["number"] or 0))
+        report_features.append({
+            "name": name,
+            "tasks_file": str(tasks_file),
+            "total": counts["total"],
+            "done": counts["done"],
+            "percent": _percent(counts["done"], counts["total"]),
+            "stories": [{**s, "percent": _percent(s["done"], s["total"])} for s in stories],
+            "personas": [{"persona": p, **c, "percent": _percent(c["done"], c["total"])} for p, c in sorted(counts["personas"].items())],
+        })
+    cache.save()
+
+    return {
+        "version": STATUS_VERSION,
+        "features": report_features,
+        "totals": {**totals, "features": len(report_features), "percent": _percent(totals["done"], totals["total"])},
+        "personas": [{"persona": p, **c, "percent": _percent(c["done"], c["total"])} for p, c in sorted(personas.items())],
+        "cache": {**cache.stats, "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)},
+    }
@@ -0,0 +1,276 @@
+"""Task dependency graph and parallel batch scheduling for tasks.md.
+
+Ordering rules, following ``templates/tasks-template.md``:
+
+- Phases run in document order within a user story; different user stories are
+  independent of each other.
+- Tasks outside any user story (setup before the first story, polish after the
+  last) act as barriers: they wait for everything before them and everything
+  after them waits for them.
+- Inside a phase, consecutive ``**[P]**`` tasks may run together; a task
+  without the marker waits for every task before it in the phase and blocks
+  every task after it.
+- Tasks that name the same file are serialised in document order.
+- ``(depends on T001, T002)`` adds explicit edges.
+
+Phase and [P]-group ordering goes through zero-cost barrier nodes, so the
+graph has O(tasks + files) edges rather than one edge per pair of tasks in
+adjacent groups, which keeps thousands of tasks cheap to schedule.
+"""
+
+from collections import deque
+
+
+class TaskGraphError(ValueError):
+    """Raised when the task graph cannot be scheduled (e.g. a dependency cycle)."""
+
+
+class TaskGraph:
+    """DAG over parsed tasks (see ``services.artifacts.iter_tasks``)."""
+
+    def __init__(self, tasks: list[dict], include_done: bool = False):
+        self.tasks = tasks
+        self.include_done = include_done
+        self.warnings: list[str] = []
+        self.n = len(tasks)
+        # Node ids 0..n-1 are tasks; n.. are barriers
+        self.preds: list[list[int]] = [[] for _ in range(self.n)]
+        self.file_preds: list[list[int]] = [[] for _ in range(self.n)]
+        self._build()
+
+    def _new_barrier(self, preds: list[int]) -> int:
+        self.preds.append(list(preds))
+        return len(self.preds) - 1
+
+    def _chain_block(self, start: int, block: list[int]) -> int:
+        """Wire one phase's tasks after barrier start; return the barrier closing it."""
+        group: list[int] = []
+        for index in block:
+            if self.tasks[index]["parallel"]:
+                group.append(index)
+                continue
+            if group:
+                for member in group:
+                    self.preds[member].append(start)
+                start = self._new_barrier(group)
+                group = []
+            self.preds[index].append(start)
+            start = self._new_barrier([index])
+        if group:
+            for member in group:
+                self.preds[member].append(start)
+            start = self._new_barrier(group)
+        return start
+
+    def _build(self) -> None:
+        # Split tasks into (story, phase) blocks in document order
+        blocks: list[tuple[object, list[int]]] = []
+        previous_key = object()
+        for index, task in enumerate(self.tasks):
+            story = task["story"]["number"] if task.get("story") else None
+            phase = task["phase"]["number"] if task.get("phase") else None
+            key = (story, phase)
+            if key != previous_key:
+                blocks.append((story, []))
+                previous_key = key
+            blocks[-1][1].append(index)
+
+        current = self._new_barrier([])
+        story_tails: dict[object, int] = {}
+        for story, block in blocks:
+            if story is None:
+                if story_tails:
+                    current = self._new_barrier([current, *story_tails.values()])
+                    story_tails = {}
+                current = self._chain_block(current, block)
+            else:
+                story_tails[story] = self._chain_block(story_tails.get(story, current), block)
+
+        # Explicit dependencies
+        index_by_id = {}
+        for index, task in enumerate(self.tasks):
+            if task["id"] in index_by_id:
+                self.warnings.append(f"Duplicate task id {task['id']} (line {task['line']}); dependencies resolve to the first occurrence")
+            else:
+                index_by_id[task["id"]] = index
+        for index, task in enumerate(self.tasks):
+            for dep in task.get("depends_on", []):
+                if dep not in index_by_id:
+                    self.warnings.append(f"Task {task['id']} depends on unknown task {dep}")
+                    continue
+                self.preds[index].append(index_by_id[dep])
+
+        # Shared files: serialise in document order
+        last_by_file: dict[str, int] = {}
+        for index, task in enumerate(self.tasks):
+            for path in task.get("files", []):
+                previous = last_by_file.get(path)
+                if previous is not None and previous != index:
+                    self.preds[index].append(previous)
+                    self.file_preds[index].append(previous)
+                    if task["parallel"] and self.tasks[previous]["parallel"] and task.get("phase") == self.tasks[previous].get("phase") and task.get("story") == self.tasks[previous].get("story"):
+                        self.warnings.append(f"[P] tasks {self.tasks[previous]['id']} and {task['id']} both touch {path}; they are serialised")
+                last_by_file[path] = index
+
+    def _weight(self, node: int) -> int:
+        if node >= self.n:
+            return 0
+        return 0 if self.tasks[node]["done"] and not self.include_done else 1
+
+    def _topological_order(self) -> list[int]:
+        total = len(self.preds)
+        succs: list[list[int]] = [[] for _ in range(total)]
+        indegree = [0] * total
+        for node, preds in enumerate(self.preds):
+            for pred in preds:
+                succs[pred].append(node)
+                indegree[node] += 1
+        queue = deque(node for node in range(total) if indegree[node] == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for succ in succs[node]:
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    queue.append(succ)
+        if len(order) != total:
+            cycle = sorted(self.tasks[node]["id"] for node in range(self.n) if indegree[node] > 0)
+            raise TaskGraphError(f"Dependency cycle among tasks: {', '.join(cycle)}")
+        self._succs = succs
+        return order
+
+    def schedule(self, workers: int | None = None) -> dict:
+        """Compute batches, the critical path and per-task slack.
+
+        With workers unset, batches are the ASAP levels (every ready task runs
+        at once). With a worker limit, ready tasks are packed by longest
+        remaining path first.
+
+        Returns:
+            Dict with ``batches`` (list of task id lists), ``critical_path``
+            (task ids), ``tasks`` (per-task batch, slack and critical flag) and
+            ``warnings``
+        """
+        order = self._topological_order()
+        total = len(self.preds)
+        earliest = [0] * total
+        best_pred = [-1] * total
+        for node in order:
+            start = 0
+            for pred in self.preds[node]:
+                if best_pred[node] == -1 or earliest[pred] > start:
+                    start = earliest[pred]
+                    best_pred[node] = pred
+            earliest[node] = start + self._weight(node)
+        length = max(earliest, default=0)
+
+        # Latest finish without delaying the whole plan, and remaining path length
+        latest = [length] * total
+        tail = [0] * total
+        for node in reversed(order):
+            for succ in self._succs[node]:
+                latest[node] = min(latest[node], latest[succ] - self._weight(succ))
+                tail[node] = max(tail[node], tail[succ])
+            tail[node] += self._weight(node)
+
+        critical = []
+        node = max(range(self.n), key=lambda i: (earliest[i], -i), default=-1) if length else -1
+        while node != -1:
+            if node < self.n and self._weight(node):
+                critical.append(self.tasks[node]["id"])
+            node = best_pred[node]
+        critical.reverse()
+
+        schedulable = [i for i in range(self.n) if self._weight(i)]
+        if workers:
+            batch_of = self._pack(tail, workers)
+        else:
+            batch_of = {i: earliest[i] for i in schedulable}
+        batches: dict[int, list[int]] = {}
+        for index in schedulable:
+            batches.setdefault(batch_of[index], []).append(index)
+
+        rank = {level: position for position, level in enumerate(sorted(batches), 1)}
+        critical_set = set(critical)
+        task_info = []
+        for index, task in enumerate(self.tasks):
+            scheduled = index in batch_of
+            task_info.append({
+                "id": task["id"],
+                "text": task["text"],
+                "done": task["done"],
+                "parallel": task["parallel"],
+                "story": task["story"]["number"] if task.get("story") else None,
+                "phase": task["phase"]["number"] if task.get("phase") else None,
+                "files": task.get("files", []),
+                "persona": task.get("persona"),
+                "depends_on": task.get("depends_on", []),
+                "file_conflicts": sorted({self.tasks[p]["id"] for p in self.file_preds[index]}),
+                "batch": rank[batch_of[index]] if scheduled else None,
+                "slack": latest[index] - earliest[index] if scheduled else None,
+                "critical": task["id"] in critical_set,
+                "line": task["line"],
+            })
+
+        return {
+            "batches": [[self.tasks[i]["id"] for i in batches[level]] for level in sorted(batches)],
+            "critical_path": critical,
+            "tasks": task_info,
+            "warnings": self.warnings,
+        }
+
+    def _pack(self, tail: list[int], workers: int) -> dict[int, int]:
+        """List scheduling with at most `workers` tasks per batch, longest tail first."""
+        import heapq
+
+        total = len(self.preds)
+        remaining = [len(p) for p in self.preds]
+        ready: list[tuple[int, int]] = []
+        free: deque[int] = deque()  # zero-weight nodes complete instantly
+
+        def release(node):
+            for succ in self._succs[node]:
+                remaining[succ] -= 1
+                if remaining[succ] == 0:
+                    enqueue(succ)
+
+        def enqueue(node):
+            if self._weight(node):
+                heapq.heappush(ready, (-tail[node], node))
+            else:
+                free.append(node)
+
+        for node in range(total):
+            if remaining[node] == 0:
+                enqueue(node)
+        batch_of: dict[int, int] = {}
+        batch = 0
+        while True:
+            while free:
+                release(free.popleft())
+            if not ready:
+                break
+            batch += 1
+            picked = [heapq.heappop(ready)[1] for _ in range(min(workers, len(ready)))]
+            for node in picked:
+                batch_of[node] = batch
+            for node in picked:
+                release(node)
+        return batch_of
+
+
+def plan_tasks(tasks: list[dict], *, workers: int | None = None, include_done: bool = False) -> dict:
+    """Build the task graph and schedule it (see ``TaskGraph.schedule``)."""
+    graph = TaskGraph(tasks, include_done=include_done)
+    result = graph.schedule(workers=workers)
+    result["summary"] = {
+        "tasks": len(tasks),
+        "done": sum(1 for t in tasks if t["done"]),
+        "scheduled": sum(len(b) for b in result["batches"]),
+        "batches": len(result["batches"]),
+        "critical_path": len(result["critical_path"]),
+        "max_parallel": max((len(b) for b in result["batches"]), default=0),
+        "workers": workers,
+    }
+    return result
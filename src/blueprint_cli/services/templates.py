@@ -0,0 +1,176 @@
+"""Command template bundle for the Blueprint-Kit CLI.
+
+``templates/commands/*.md`` are parsed once into a compact bundle: for every
+template and script variant the body is stored as a list of segments split at
+the argument placeholders, with the ``{SCRIPT}`` substitution, ``.blueprint/``
+path rewrite and backslash normalisation already applied. Rendering an output
+file is then a single ``arg_format.join(segments)``.
+
+Bundles are memoised per process and persisted in the user cache directory,
+keyed by the templates directory and invalidated when any template's
+name/mtime/size changes.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+
+from .cache import default_cache_dir, write_json_atomic
+
+
+BUNDLE_VERSION = 1
+SCRIPT_VARIANTS = ("sh", "ps")
+
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---\n(.*)', re.DOTALL)
+_DESCRIPTION_RE = re.compile(r'^description:\s*(.*)', re.MULTILINE)
+_SCRIPTS_RE = re.compile(r'^scripts:\s*\n((?:\s+[a-z_]+:.*)+)', re.MULTILINE)
+# Only rewrite root paths that are not already prefixed with .blueprint/
+_PATH_REWRITE_RE = re.compile(r'(?<!\.blueprint)/(memory|scripts|templates)/')
+# Stand-in for the argument placeholder while rewrites run over the whole body
+_ARG_SENTINEL = "\x00"
+
+_memo: dict[str, tuple[list, dict]] = {}
+_memo_lock = threading.Lock()
+
+
+def find_commands_dir() -> Path | None:
+    """Locate ``templates/commands`` for both development checkouts and installed wheels."""
+    # Method 1: walk up from this file to a blueprint-kit checkout
+    current = Path(__file__)
+    for _ in range(10):  # Prevent infinite loop
+        current = current.parent
+        if current.name == "blueprint-kit" or current.parent.name == "blueprint-kit":
+            root = current if current.name == "blueprint-kit" else current.parent
+            candidate = root / "templates" / "commands"
+            if candidate.is_dir():
+                return candidate
+
+    # Method 2: templates shipped inside the wheel (tool.hatch.build.data)
+    try:
+        from importlib.resources import files
+        candidate = Path(str(files('blueprint_cli').joinpath('templates', 'commands')))
+        if candidate.is_dir():
+            return candidate
+    except Exception:
+        pass
+
+    # Method 3: development layout relative to src/blueprint_cli/services/
+    candidate = Path(__file__).resolve().parents[3] / "templates" / "commands"
+    if candidate.is_dir():
+        return candidate
+    return None
+
+
+def parse_command_template(content: str) -> dict | None:
+    """Parse one command template into description + per-variant body segments.
+
+    Returns None when the template has no valid frontmatter.
+    """
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return None
+    yaml_content, body = match.group(1), match.group(2)
+
+    description_match = _DESCRIPTION_RE.search(yaml_content)
+    description = description_match.group(1).strip().strip('"') if description_match else ""
+
+    scripts = {}
+    scripts_match = _SCRIPTS_RE.search(yaml_content)
+    if scripts_match:
+        for line in scripts_match.group(1).split('\n'):
+            line = line.strip()
+            if ':' in line:
+                key, value = line.split(':', 1)
+                scripts[key.strip()] = value.strip().strip('"')
+
+    variants = {}
+    for variant in SCRIPT_VARIANTS:
+        text = body.replace('{SCRIPT}', scripts.get(variant, "(Missing script command)"))
+        text = text.replace('{ARGS}', _ARG_SENTINEL).replace('$ARGUMENTS', _ARG_SENTINEL)
+        text = _PATH_REWRITE_RE.sub(r'.blueprint/\1/', text)
+        text = text.replace('\\\\', '/')
+        variants[variant] = text.split(_ARG_SENTINEL)
+
+    return {
+        "description": description.replace('\\\\', '/'),
+        "variants": variants,
+    }
+
+
+def _signature(commands_dir: Path) -> list:
+    sig = []
+    for path in sorted(commands_dir.glob('*.md')):
+        st = path.stat()
+        sig.append([path.name, st.st_mtime_ns, st.st_size])
+    return sig
+
+
+def compile_bundle(commands_dir: Path, signature: list | None = None) -> dict:
+    """Parse every template in commands_dir into a bundle dict."""
+    templates = {}
+    errors = {}
+    for path in sorted(commands_dir.glob('*.md')):
+        try:
+            parsed = parse_command_template(path.read_text(encoding='utf-8'))
+        except Exception as e:
+            errors[path.stem] = str(e)
+            continue
+        if parsed is not None:
+            templates[path.stem] = parsed
+    return {
+        "version": BUNDLE_VERSION,
+        "source": str(commands_dir),
+        "signature": signature if signature is not None else _signature(commands_dir),
+        "count": len(list(commands_dir.glob('*.md'))),
+        "templates": templates,
+        "errors": errors,
+    }
+
+
+def _bundle_path(commands_dir: Path) -> Path:
+    digest = hashlib.sha256(str(commands_dir.resolve()).encode('utf-8')).hexdigest()[:16]
+    return default_cache_dir() / "command-bundles" / f"{digest}.json"
+
+
+def load_bundle(commands_dir: Path, *, use_disk: bool = True) -> dict:
+    """Return the compiled bundle for commands_dir, recompiling only when templates changed."""
+    key = str(commands_dir)
+    signature = _signature(commands_dir)
+    with _memo_lock:
+        cached = _memo.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+    bundle = None
+    bundle_path = _bundle_path(commands_dir) if use_disk else None
+    if bundle_path is not None:
+        try:
+            with open(bundle_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get("version") == BUNDLE_VERSION and stored.get("signature") == signature:
+                bundle = stored
+        except (OSError, ValueError):
+            pass
+
+    if bundle is None:
+        bundle = compile_bundle(commands_dir, signature)
+        if bundle_path is not None:
+            try:
+                bundle_path.parent.mkdir(parents=True, exist_ok=True)
+                write_json_atomic(bundle_path, bundle)
+            except OSError:
+                pass  # Cache is an optimisation only
+
+    with _memo_lock:
+        _memo[key] = (signature, bundle)
+    return bundle
+
+
+def render_command(entry: dict, variant: str, arg_format: str, ext: str) -> str:
+    """Render one bundled template for a script variant and agent output format."""
+    body = arg_format.join(entry["variants"][variant])
+    if ext == 'toml':
+        return f'description = "{entry["description"]}"\n\nprompt = """\n{body}\n"""'
+    return body
@@ -0,0 +1,174 @@
+"""Tool discovery service for the Blueprint-Kit CLI.
+
+Instead of one ``shutil.which`` PATH scan per tool, every PATH directory is
+listed once into an index and all tool names are resolved against it. The
+index is persisted in the user cache directory and reused while PATH is the
+same; only directories whose mtime changed are listed again.
+"""
+
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+from ..core.cli import CLAUDE_LOCAL_PATH
+from ..core.tracing import span
+from .cache import default_cache_dir, write_json_atomic
+
+
+INDEX_VERSION = 1
+VERSION_PROBE_TIMEOUT = 5
+
+
+def _pathext() -> list[str]:
+    if os.name != "nt":
+        return [""]
+    return [""] + [ext.lower() for ext in os.getenv("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if ext]
+
+
+def _dir_mtime(directory: str) -> int | None:
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _list_dir(directory: str) -> list[str]:
+    try:
+        with os.scandir(directory) as it:
+            return [entry.name for entry in it]
+    except OSError:
+        return []
+
+
+class PathIndex:
+    """Names present in each PATH directory, in PATH order."""
+
+    def __init__(self, path_env: str | None = None, cache_path: Path | None = None, use_cache: bool = True):
+        self.path_env = os.getenv("PATH", "") if path_env is None else path_env
+        self.cache_path = cache_path or (default_cache_dir() / "path-index.json")
+        self.use_cache = use_cache
+        self.rescanned = 0
+        self.dirs: list[tuple[str, set[str]]] = []
+        self._build()
+
+    def _load_cached(self) -> dict:
+        if not self.use_cache:
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return {d["dir"]: d for d in data.get("dirs", [])}
+
+    def _build(self) -> None:
+        cached = self._load_cached()
+        seen = set()
+        stored = []
+        for directory in self.path_env.split(os.pathsep):
+            if not directory or directory in seen:
+                continue
+            seen.add(directory)
+            mtime = _dir_mtime(directory)
+            if mtime is None:
+                continue
+            entry = cached.get(directory)
+            if entry and entry.get("mtime") == mtime:
+                names = entry["names"]
+            else:
+                names = _list_dir(directory)
+                self.rescanned += 1
+            if os.name == "nt":
+                names = [n.lower() for n in names]
+            self.dirs.append((directory, set(names)))
+            stored.append({"dir": directory, "mtime": mtime, "names": names})
+
+        if self.use_cache and self.rescanned:
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                write_json_atomic(self.cache_path, {"version": INDEX_VERSION, "dirs": stored})
+            except OSError:
+                pass  # Index cache is an optimisation only
+
+    def resolve(self, tool: str) -> str | None:
+        """Return the first executable named tool on PATH (like shutil.which), or None."""
+        candidates = [tool + ext for ext in _pathext()]
+        if os.name == "nt":
+            candidates = [c.lower() for c in candidates]
+        for directory, names in self.dirs:
+            for name in candidates:
+                if name in names:
+                    full = os.path.join(directory, name)
+                    if os.path.isfile(full) and os.access(full, os.X_OK):
+                        return full
+        return None
+
+
+def probe_version(path: str, timeout: float = VERSION_PROBE_TIMEOUT) -> str | None:
+    """Run ``<path> --version`` and return the first non-empty output line."""
+    try:
+        with span(f"{os.path.basename(path)} --version", "process"):
+            result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    for line in (result.stdout or result.stderr or "").splitlines():
+        if line.strip():
+            return line.strip()
+    return None
+
+
+def discover_tools(tools: list[str], *, probe_versions: bool = False, max_workers: int | None = None, index: PathIndex | None = None, on_result=None) -> dict[str, dict]:
+    """Resolve many tools against a single PATH index, probing versions concurrently.
+
+    Args:
+        tools: Tool names to look up
+        probe_versions: Also run ``--version`` for each tool found
+        max_workers: Thread pool size for version probes
+        index: Prebuilt PathIndex (built from the current PATH if omitted)
+        on_result: Optional callback(tool, result) invoked as each result is known
+
+    Returns:
+        Dict mapping tool name to {"found", "path", "version", "elapsed_ms"}
+    """
+    index = index or PathIndex()
+    results: dict[str, dict] = {}
+    found = []
+    for tool in tools:
+        start = time.perf_counter()
+        # Special handling for Claude CLI after `claude migrate-installer`, which
+        # replaces the PATH executable with ~/.claude/local/claude
+        if tool == "claude" and CLAUDE_LOCAL_PATH.is_file():
+            path = str(CLAUDE_LOCAL_PATH)
+        else:
+            path = index.resolve(tool)
+        results[tool] = {
+            "found": path is not None,
+            "path": path,
+            "version": None,
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+        }
+        if path is not None and probe_versions:
+            found.append(tool)
+        elif on_result:
+            on_result(tool, results[tool])
+
+    if found:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        def probe(tool):
+            start = time.perf_counter()
+            version = probe_version(results[tool]["path"])
+            return tool, version, (time.perf_counter() - start) * 1000
+
+        with ThreadPoolExecutor(max_workers=max_workers or min(16, len(found))) as pool:
+            for future in as_completed([pool.submit(probe, tool) for tool in found]):
+                tool, version, elapsed = future.result()
+                results[tool]["version"] = version
+                results[tool]["elapsed_ms"] += elapsed
+                if on_result:
+                    on_result(tool, results[tool])
+    return results
@@ -0,0 +1,237 @@
+"""Delta template upgrades for the Blueprint-Kit CLI.
+
+``blueprint init`` records the installed release and the SHA-256 of every file
+it extracted in ``.blueprint/release.json``. An upgrade compares three hashes
+per file: the recorded baseline, the file on disk and the target release's
+manifest entry (published next to the archives by ``blueprint build-release``).
+Only files that changed upstream are fetched, with HTTP range requests against
+the release archive using the byte offsets in the manifest, and files the user
+has edited since install are reported instead of overwritten.
+"""
+
+import hashlib
+import json
+import os
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+
+from .archive import _target_path, nested_root, read_local_member
+from .cache import file_sha256, write_json_atomic
+
+if TYPE_CHECKING:
+    import httpx
+
+
+RECORD_FILE = Path(".blueprint") / "release.json"
+RECORD_VERSION = 1
+
+# Fetch the whole archive instead of ranges once this share of it is needed
+FULL_DOWNLOAD_RATIO = 0.5
+# Ranges closer than this are merged into one request
+RANGE_MERGE_GAP = 16 * 1024
+
+
+def file_hash(path: Path) -> str | None:
+    """SHA-256 of a file, or None when it does not exist."""
+    try:
+        return file_sha256(path)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
+def load_record(project: Path) -> dict | None:
+    try:
+        with open(project / RECORD_FILE, "r", encoding="utf-8") as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return record if isinstance(record, dict) and record.get("version") == RECORD_VERSION else None
+
+
+def write_record(project: Path, release: str, agent: str, script: str, files: dict[str, str], agents: list[str] | None = None) -> None:
+    """Record the installed release.
+
+    ``agent`` is the agent whose release archive ``files`` (path -> SHA-256)
+    came from; ``agents`` lists every agent the project was initialised for,
+    including ones whose command files were rendered locally.
+    """
+    path = project / RECORD_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(path, {
+        "version": RECORD_VERSION,
+        "release": release,
+        "agent": agent,
+        "agents": agents or [agent],
+        "script": script,
+        "installed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "files": dict(sorted(files.items())),
+    })
+
+
+def hashes_from_zip(zip_ref: zipfile.ZipFile) -> dict[str, str]:
+    """Project-relative path -> SHA-256 for every file member, with the same flattening as extraction."""
+    infos = zip_ref.infolist()
+    strip = nested_root([i.filename for i in infos])
+    base = Path("/")
+    hashes = {}
+    for info in infos:
+        if info.is_dir():
+            continue
+        target = _target_path(base, info.filename, strip)
+        if target is None:
+            continue
+        digest = hashlib.sha256()
+        with zip_ref.open(info) as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        hashes[target.relative_to(base).as_posix()] = digest.hexdigest()
+    return hashes
+
+
+def plan_upgrade(project: Path, baseline: dict[str, str], target: dict[str, dict], force: bool = False) -> list[dict]:
+    """Decide what to do with every file in the baseline or the target manifest.
+
+    Actions: ``add``/``update``/``delete`` (applied), ``conflict`` (the user
+    changed a file upstream also changed; left alone unless force), and
+    ``current`` (nothing to do). Files that did not change upstream are never
+    touched, even when the user edited them.
+    """
+    plan = []
+    for path in sorted(set(baseline) | set(target)):
+        rel = PurePosixPath(path)
+        if rel.is_absolute() or ".." in rel.parts:
+            continue
+        local = file_hash(project / path)
+        base = baseline.get(path)
+        new = target[path]["sha256"] if path in target else None
+
+        if new == base or local == new:
+            action, reason = "current", None
+        elif new is None:
+            action, reason = ("delete", "removed upstream") if local in (base, None) else ("conflict", "removed upstream but modified locally")
+        elif local is None:
+            action, reason = "add", "new upstream" if base is None else "missing locally"
+        elif local == base:
+            action, reason = "update", "changed upstream"
+        else:
+            action, reason = "conflict", "modified locally" if base is not None else "exists locally but was not installed by the template"
+
+        if action == "conflict" and force:
+            action = "delete" if new is None else "update"
+            reason = f"{reason} (forced)"
+        if action == "delete" and local is None:
+            action = "current"
+        plan.append({"path": path, "action": action, "reason": reason})
+    return plan
+
+
+def record_hashes(plan: list[dict], baseline: dict[str, str], target: dict[str, dict]) -> dict[str, str]:
+    """Hashes to record once a plan is applied.
+
+    Files left alone as ``conflict`` keep their previous baseline hash (or get
+    no entry if they had none), so the next run still flags them and
+    ``--force`` still takes the release version.
+    """
+    conflicts = {item["path"] for item in plan if item["action"] == "conflict"}
+    hashes = {path: meta["sha256"] for path, meta in target.items() if path not in conflicts}
+    for path in conflicts:
+        if baseline.get(path) is not None:
+            hashes[path] = baseline[path]
+    return hashes
+
+
+def _ranges(members: list[dict], gap: int = RANGE_MERGE_GAP) -> list[tuple[int, int]]:
+    """Merged inclusive byte ranges covering each member's local header and data."""
+    spans = sorted(
+        (m["offset"], m["offset"] + 30 + len(m["name"].encode("utf-8")) + m["compressed_size"] - 1)
+        for m in members
+    )
+    merged: list[list[int]] = []
+    for start, end in spans:
+        if merged and start - merged[-1][1] <= gap:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def fetch_members(client: "httpx.Client", url: str, members: list[dict], archive_size: int, headers: dict | None = None) -> tuple[dict[str, bytes], dict]:
+    """Fetch and verify archive members, using range requests when that saves traffic.
+
+    Returns:
+        (name -> content, stats) where stats has ``mode`` ("ranged" or "full"),
+        ``requests`` and ``bytes`` downloaded
+    """
+    stats = {"mode": "ranged", "requests": 0, "bytes": 0}
+    if not members:
+        return {}, stats
+    ranges = _ranges(members)
+    needed = sum(end - start + 1 for start, end in ranges)
+
+    def full() -> list[tuple[int, bytes]]:
+        response = client.get(url, headers=headers, follow_redirects=True, timeout=60)
+        stats["mode"] = "full"
+        stats["requests"] += 1
+        stats["bytes"] += len(response.content)
+        if response.status_code != 200:
+            raise RuntimeError(f"Download failed with {response.status_code} for {url}")
+        return [(0, response.content)]
+
+    buffers: list[tuple[int, bytes]] = []
+    if needed < archive_size * FULL_DOWNLOAD_RATIO:
+        for start, end in ranges:
+            response = client.get(url, headers={**(headers or {}), "Range": f"bytes={start}-{end}"}, follow_redirects=True, timeout=60)
+            stats["requests"] += 1
+            stats["bytes"] += len(response.content)
+            if response.status_code == 200:
+                # Server ignored the range; the body is the whole archive
+                buffers = [(0, response.content)]
+                stats["mode"] = "full"
+                break
+            if response.status_code == 416:
+                # Server refused the range (e.g. a proxy that mangles Range); take the whole archive
+                buffers = full()
+                break
+            if response.status_code != 206:
+                raise RuntimeError(f"Download failed with {response.status_code} for {url}")
+            buffers.append((start, response.content))
+    else:
+        buffers = full()
+
+    contents = {}
+    for member in members:
+        for base, buf in buffers:
+            if base <= member["offset"] < base + len(buf):
+                contents[member["name"]] = read_local_member(buf, member, base)
+                break
+        else:
+            raise ValueError(f"{member['name']} not covered by the downloaded ranges")
+    return contents, stats
+
+
+def read_members_from_zip(zip_path: Path, members: list[dict]) -> dict[str, bytes]:
+    """Read and verify members from a locally cached copy of the archive."""
+    with open(zip_path, "rb") as f:
+        data = f.read()
+    return {m["name"]: read_local_member(data, m) for m in members}
+
+
+def apply_plan(project: Path, plan: list[dict], contents: dict[str, bytes], target: dict[str, dict]) -> None:
+    """Write added/updated files atomically and remove deleted ones."""
+    for item in plan:
+        path = project / item["path"]
+        if item["action"] in ("add", "update"):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(contents[item["path"]])
+            if os.name != "nt":
+                os.chmod(tmp_path, target[item["path"]].get("mode", 0o644))
+            os.replace(tmp_path, path)
+        elif item["action"] == "delete":
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass